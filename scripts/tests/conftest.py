@@ -0,0 +1,8 @@
+"""Make the flat script directories importable, as the scripts themselves expect."""
+
+import os
+import sys
+
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for subdir in ('utils', 'validation'):
+    sys.path.insert(0, os.path.join(SCRIPTS, subdir))
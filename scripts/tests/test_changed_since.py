@@ -0,0 +1,64 @@
+"""--changed-since scoping with a cache written before other commits landed."""
+
+import subprocess
+
+from check_links import (LinkCache, LinkChecker, git_baseline_findings, git_changed_files,
+                         git_markdown_files, new_findings)
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-C', str(repo), *args], check=True, capture_output=True)
+
+
+def scoped_check(repo):
+    checker = LinkChecker(str(repo))
+    cache = LinkCache(str(repo / '.link_check_cache.json'), str(repo))
+    cache.load()
+    changed, deleted, _ = git_changed_files(str(repo), 'HEAD')
+    cache.check_changed(checker, changed, deleted, tracked=git_markdown_files(str(repo)))
+    cache.save()
+    return checker, cache
+
+
+def test_files_committed_after_the_cache_are_dependents(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.email', 'docs@example.com')
+    git(tmp_path, 'config', 'user.name', 'Docs')
+    (tmp_path / 'README.md').write_text("# Readme\n\n## Repository Structure\n", encoding='utf-8')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-qm', 'readme')
+    scoped_check(tmp_path)
+
+    # Arrives with a commit (e.g. a pull), so git diff HEAD never lists it
+    (tmp_path / 'newdoc.md').write_text("# New\n\n[s](README.md#repository-structure)\n",
+                                        encoding='utf-8')
+    git(tmp_path, 'add', 'newdoc.md')
+    git(tmp_path, 'commit', '-qm', 'newdoc')
+    (tmp_path / 'README.md').write_text("# Readme\n\n## Repo Layout\n", encoding='utf-8')
+
+    checker, cache = scoped_check(tmp_path)
+    assert [(link['file'], link['line']) for link in checker.broken_links] == [('newdoc.md', 3)]
+    assert cache.stats['dependents'] == 1
+
+
+def test_baseline_hides_links_broken_before_the_change(tmp_path):
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'config', 'user.email', 'docs@example.com')
+    git(tmp_path, 'config', 'user.name', 'Docs')
+    body = "# Notes\n\n" + "".join(f"Line {n} of the notes.\n" for n in range(20))
+    (tmp_path / 'old.md').write_text(body + "[gone](missing.md)\n", encoding='utf-8')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-qm', 'old')
+
+    # Rename the file and add one more broken link to it
+    git(tmp_path, 'mv', 'old.md', 'new.md')
+    (tmp_path / 'new.md').write_text(body + "[gone](missing.md)\n[typo](new.md#nope)\n",
+                                     encoding='utf-8')
+    checker, _ = scoped_check(tmp_path)
+    assert len(checker.broken_links) == 2
+
+    _, _, renamed = git_changed_files(str(tmp_path), 'HEAD')
+    assert renamed == {'new.md': 'old.md'}
+    baseline = git_baseline_findings(str(tmp_path), 'HEAD', ['old.md'])
+    fresh = new_findings(checker.broken_links, baseline, renamed)
+    assert [link['link'] for link in fresh] == ['new.md#nope']
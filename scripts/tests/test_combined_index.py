@@ -0,0 +1,53 @@
+"""CombinedDocIndex: extract() returns what regenerate() embedded."""
+
+import os
+
+import pytest
+
+from combined_index import CombinedDocIndex
+
+SOURCES = {
+    'a.md': b"# A\n\nFirst file.\n",
+    'b.md': b"# B\n\nNo trailing newline",
+    'c.md': b"# C\n\nEnds with a blank line.\n\n",
+}
+
+
+def block(path, body):
+    return (f"---\n## File: {path}\n### Section: Docs\n---\n\n".encode('utf-8') + body
+            + f"<!-- END OF FILE: {path} -->\n\n".encode('utf-8'))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    source_root = tmp_path / 'src'
+    source_root.mkdir()
+    for path, content in SOURCES.items():
+        (source_root / path).write_bytes(content)
+    # Stale bodies, embedded the way the generator does (content + newline)
+    combined = tmp_path / 'combined.md'
+    combined.write_bytes(b"# Combined\n\n" + b''.join(
+        block(path, b"old " + path.encode('utf-8') + b"\n\n") for path in SOURCES))
+    return source_root, combined
+
+
+def test_regenerate_then_extract_round_trips(tree):
+    source_root, combined = tree
+    index = CombinedDocIndex(combined).load_or_build()
+    assert index.regenerate(source_root) == list(SOURCES)
+
+    for path, content in SOURCES.items():
+        assert index.extract(path) == content.decode('utf-8')
+    # Nothing left to do, and a fresh process reads the same content back
+    assert index.regenerate(source_root) == []
+    reloaded = CombinedDocIndex(combined).load_or_build()
+    for path, content in SOURCES.items():
+        assert reloaded.extract(path) == content.decode('utf-8')
+
+
+def test_regenerate_keeps_file_mode_and_leaves_no_temp_files(tree):
+    source_root, combined = tree
+    os.chmod(combined, 0o640)
+    CombinedDocIndex(combined).load_or_build().regenerate(source_root)
+    assert os.stat(combined).st_mode & 0o777 == 0o640
+    assert not [name for name in os.listdir(combined.parent) if name.endswith('.tmp')]
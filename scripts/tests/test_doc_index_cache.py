@@ -0,0 +1,35 @@
+"""MetadataCache.save: atomic writes through a unique temp file."""
+
+import os
+
+import pytest
+
+from generate_doc_index import MetadataCache
+
+
+def test_save_uses_default_mode_and_leaves_no_temp_files(tmp_path):
+    cache_path = tmp_path / '.doc_index_cache.json'
+    cache = MetadataCache(cache_path)
+    cache.files = {'a.md': {'status': 'Draft', 'size': 1, 'mtime': 2}}
+    cache.save()
+
+    umask = os.umask(0)
+    os.umask(umask)
+    assert os.stat(cache_path).st_mode & 0o777 == 0o666 & ~umask
+    assert os.listdir(tmp_path) == ['.doc_index_cache.json']
+    reloaded = MetadataCache(str(cache_path))
+    reloaded.load()
+    assert reloaded.files == cache.files
+
+
+def test_failed_save_keeps_the_old_cache(tmp_path):
+    cache_path = tmp_path / '.doc_index_cache.json'
+    cache = MetadataCache(cache_path)
+    cache.save()
+    before = cache_path.read_bytes()
+
+    cache.files = {'a.md': object()}
+    with pytest.raises(TypeError):
+        cache.save()
+    assert cache_path.read_bytes() == before
+    assert os.listdir(tmp_path) == ['.doc_index_cache.json']
@@ -0,0 +1,111 @@
+"""DocLintDaemon: watcher events and LSP saves re-lint the affected files."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import doc_lint_daemon
+from doc_lint_daemon import DocLintDaemon, PollingWatcher, apply_events
+from doc_model import default_cache
+
+ANCHOR_ERROR = "Anchor '#usage' not found in b.md (b.md#usage)"
+
+
+@pytest.fixture
+def docs(tmp_path):
+    (tmp_path / 'a.md').write_text("# A\n\nSee [b](b.md#usage).\n", encoding='utf-8')
+    (tmp_path / 'b.md').write_text("# B\n\n## Usage\n\nText.\n", encoding='utf-8')
+    return tmp_path
+
+
+def link_errors(diagnostics):
+    return [d['message'] for d in diagnostics if d['source'] == 'check_links']
+
+
+def test_polling_watcher_feeds_on_change(docs, monkeypatch):
+    daemon = DocLintDaemon(str(docs))
+    daemon.lint_all()
+    assert link_errors(daemon.diagnostics[str(docs / 'a.md')]) == []
+
+    changed = []
+    on_change = daemon.on_change
+    monkeypatch.setattr(daemon, 'on_change', lambda path: changed.append(path) or on_change(path))
+    watcher = PollingWatcher(str(docs), interval=0.01)
+    target = docs / 'b.md'
+    target.write_text("# B\n\n## Setup\n", encoding='utf-8')
+    stat = os.stat(target)
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    batch = next(watcher.events())
+    assert batch == [('changed', str(target))]
+    updated = apply_events(daemon, batch)
+    assert changed == [str(target)]
+    assert link_errors(updated[str(docs / 'a.md')]) == [ANCHOR_ERROR]
+
+
+def test_on_delete_drops_the_cached_document(docs):
+    daemon = DocLintDaemon(str(docs))
+    daemon.lint_all()
+    target = str(docs / 'b.md')
+    assert target in default_cache()._documents
+
+    os.remove(target)
+    updated = daemon.on_delete(target)
+    assert target not in default_cache()._documents
+    assert updated[target] == []
+    assert link_errors(updated[str(docs / 'a.md')]) == [
+        "Target file not found: b.md (b.md#usage)"]
+
+
+def frame(payload):
+    body = json.dumps(payload).encode('utf-8')
+    return f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body
+
+
+def read_frame(stream):
+    length = None
+    for line in iter(stream.readline, b'\r\n'):
+        name, _, value = line.decode('ascii').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    return json.loads(stream.read(length))
+
+
+def test_lsp_save_round_trip(docs):
+    server = subprocess.Popen([sys.executable, doc_lint_daemon.__file__, 'lsp', str(docs), '--no-watch'],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        server.stdin.write(frame({'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}}))
+        server.stdin.flush()
+        # The tree is linted before the first request is answered
+        response = read_frame(server.stdout)
+        assert response['id'] == 1
+        assert response['result']['capabilities']['textDocumentSync']['save'] == {'includeText': False}
+
+        (docs / 'b.md').write_text("# B\n\n## Setup\n", encoding='utf-8')
+        uri = (docs / 'b.md').resolve().as_uri()
+        server.stdin.write(frame({'jsonrpc': '2.0', 'method': 'textDocument/didSave',
+                                  'params': {'textDocument': {'uri': uri}}}))
+        server.stdin.write(frame({'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'}))
+        server.stdin.write(frame({'jsonrpc': '2.0', 'method': 'exit'}))
+        server.stdin.close()
+
+        messages = [read_frame(server.stdout) for _ in range(3)]
+        assert server.wait(timeout=30) == 0, server.stderr.read().decode()
+    finally:
+        if server.poll() is None:
+            server.kill()
+        server.stdout.close()
+        server.stderr.close()
+
+    published = {m['params']['uri']: m['params']['diagnostics'] for m in messages[:2]
+                 if m['method'] == 'textDocument/publishDiagnostics'}
+    dependent = (docs / 'a.md').resolve().as_uri()
+    assert set(published) == {uri, dependent}
+    errors = [d for d in published[dependent] if d['source'] == 'check_links']
+    assert [(d['range']['start']['line'], d['severity'], d['message']) for d in errors] == [
+        (2, 1, ANCHOR_ERROR)]
+    assert messages[2] == {'jsonrpc': '2.0', 'id': 2, 'result': None}
@@ -0,0 +1,140 @@
+"""ExternalLinkChecker against a local HTTP server."""
+
+import functools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from external_links import ExternalLinkChecker
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """Rejects HEAD, serves GET with an ETag and answers 304 when it matches.
+
+    Every request is appended to ``self.server.requests`` as
+    (time, method, path, headers).
+    """
+    protocol_version = 'HTTP/1.1'
+    etag = '"v1"'
+    last_modified = 'Mon, 05 Oct 2026 10:00:00 GMT'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.server.requests.append((time.monotonic(), 'HEAD', self.path, dict(self.headers)))
+        self.send_response(405)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.requests.append((time.monotonic(), 'GET', self.path, dict(self.headers)))
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.end_headers()
+            return
+        body = b"# doc\n"
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Last-Modified', self.last_modified)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server(tmp_path):
+    for name in ('a.md', 'b.md', 'c.md'):
+        (tmp_path / name).write_text(f"# {name}\n", encoding='utf-8')
+    handler = functools.partial(QuietHandler, directory=str(tmp_path))
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05},
+                              daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def counting_server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05},
+                              daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", httpd.requests
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+def test_check_urls_can_run_twice(server):
+    # One request per host at a time, so the per-host semaphore and lock
+    # have waiters; ttl=0 makes the second run go back to the server
+    checker = ExternalLinkChecker(ttl=0, per_host=1, rate=0)
+    urls = [f"{server}/{name}" for name in ('a.md', 'b.md', 'c.md', 'missing.md')]
+
+    for _ in range(2):
+        results = checker.check_urls(urls)
+        assert [results[url]['ok'] for url in urls] == [True, True, True, False]
+        assert results[urls[-1]]['status'] == 404
+    assert checker.stats['fetched'] + checker.stats['revalidated'] == 2 * len(urls)
+
+
+def test_rerun_within_ttl_sends_no_requests(counting_server):
+    base, requests = counting_server
+    checker = ExternalLinkChecker(ttl=3600, rate=0)
+    urls = [f"{base}/a.md", f"{base}/b.md"]
+    assert all(result['ok'] for result in checker.check_urls(urls).values())
+    sent = len(requests)
+
+    assert all(result['ok'] for result in checker.check_urls(urls).values())
+    assert len(requests) == sent
+    assert checker.stats['cached'] == len(urls)
+
+
+def test_head_rejected_falls_back_to_get(counting_server):
+    base, requests = counting_server
+    checker = ExternalLinkChecker(ttl=3600, rate=0)
+    result = checker.check_urls([f"{base}/a.md"])[f"{base}/a.md"]
+    assert result == {'ok': True, 'status': 200, 'error': None}
+    assert [(method, path) for _, method, path, _ in requests] == [
+        ('HEAD', '/a.md'), ('GET', '/a.md')]
+
+
+def test_expired_entries_are_revalidated_with_304(counting_server):
+    base, requests = counting_server
+    checker = ExternalLinkChecker(ttl=0, rate=0)
+    url = f"{base}/a.md"
+    checker.check_urls([url])
+    del requests[:]
+
+    assert checker.check_urls([url])[url] == {'ok': True, 'status': 200, 'error': None}
+    assert checker.stats == {'cached': 0, 'revalidated': 1, 'fetched': 1}
+    _, method, _, headers = requests[-1]
+    assert method == 'GET'
+    assert headers['If-None-Match'] == CountingHandler.etag
+    assert headers['If-Modified-Since'] == CountingHandler.last_modified
+
+
+def test_requests_to_one_host_are_spaced_by_the_rate_limit(counting_server):
+    base, requests = counting_server
+    interval = 0.1
+    checker = ExternalLinkChecker(ttl=3600, rate=1 / interval, per_host=4)
+    checker.check_urls([f"{base}/{name}.md" for name in 'abc'])
+
+    # HEAD and GET for each of three URLs, all through the same host slot
+    times = sorted(sent_at for sent_at, _, _, _ in requests)
+    assert len(times) == 6
+    assert times[-1] - times[0] >= 5 * interval * 0.9
+    assert min(later - earlier for earlier, later in zip(times, times[1:])) >= interval * 0.5
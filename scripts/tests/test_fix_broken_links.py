@@ -0,0 +1,18 @@
+"""fix_links_in_file: links after an unbalanced code fence are still fixed."""
+
+from fix_broken_links import AnchorIndex, fix_links_in_file
+
+
+def test_links_after_an_unclosed_fence_are_fixed(tmp_path):
+    doc = tmp_path / 'doc.md'
+    # The ```` fence is never closed (the ``` line cannot close it), so a
+    # tokenizer treats the rest of the file as code
+    doc.write_text("# Doc\n\n````cpp\nint x;\n```\n\n## Setup Guide\n\n"
+                   "See [setup](#Setup-Guide) and [other](other.md#Usage-Notes).\n",
+                   encoding='utf-8')
+    (tmp_path / 'other.md').write_text("# Other\n\n## Usage Notes\n", encoding='utf-8')
+    index = AnchorIndex(str(tmp_path)).build([str(doc), str(tmp_path / 'other.md')])
+
+    assert fix_links_in_file(str(doc), index=index) == 2
+    assert doc.read_text(encoding='utf-8').endswith(
+        "See [setup](#setup-guide) and [other](other.md#usage-notes).\n")
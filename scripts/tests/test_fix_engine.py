@@ -0,0 +1,33 @@
+"""FixPipeline: files are only rewritten when the fixers change them."""
+
+import os
+
+import fix_engine
+from fix_engine import FixPipeline
+
+
+def upper_headers(lines, ctx):
+    for line in lines:
+        if line.startswith('# ') and line != line.upper():
+            ctx.change("uppercased header")
+            line = line.upper()
+        yield line
+
+
+def test_unchanged_files_create_no_temp_file(tmp_path, monkeypatch):
+    created = []
+    temp_file = fix_engine._temp_file
+    monkeypatch.setattr(fix_engine, '_temp_file',
+                        lambda path: created.append(path) or temp_file(path))
+    clean = tmp_path / 'clean.md'
+    clean.write_text("# CLEAN\n\nBody\n", encoding='utf-8')
+    dirty = tmp_path / 'dirty.md'
+    dirty.write_text("# Dirty\n\nBody", encoding='utf-8')
+    os.chmod(dirty, 0o640)
+
+    results = FixPipeline([upper_headers]).fix_files([str(clean), str(dirty)])
+    assert [result['written'] for result in results] == [False, True]
+    assert created == [str(dirty)]
+    assert dirty.read_text(encoding='utf-8') == "# DIRTY\n\nBody"
+    assert os.stat(dirty).st_mode & 0o777 == 0o640
+    assert sorted(os.listdir(tmp_path)) == ['clean.md', 'dirty.md']
@@ -0,0 +1,42 @@
+"""Tokenizer link rules: code spans and index expressions are not links."""
+
+from check_links import LinkChecker
+from markdown_tokens import tokenize, LINK, REF_LINK
+
+
+def links(text):
+    return [(token.kind, token.text, token.target) for token in tokenize(text)
+            if token.kind in (LINK, REF_LINK)]
+
+
+def test_index_expressions_are_not_reference_links():
+    text = "Read arr[i][j] and matrix[0][1], or grid[0][1][2] and f(x)[0][1].\n"
+    assert links(text) == []
+
+
+def test_code_spans_are_skipped():
+    assert links("Use `arr[i][j]` or ``x[`a`][b]`` here.\n") == []
+
+
+def test_reference_links_are_still_found():
+    text = "See [the guide][guide], [guide][] and ![logo][img] | [HAVE][PRIMARY]|\n"
+    assert links(text) == [
+        (REF_LINK, 'the guide', 'guide'),
+        (REF_LINK, 'guide', 'guide'),
+        (REF_LINK, 'logo', 'img'),
+        (REF_LINK, 'HAVE', 'PRIMARY'),
+    ]
+
+
+def test_inline_links_after_a_word_are_kept():
+    assert links("word[text](page.md)\n") == [(LINK, 'text', 'page.md')]
+
+
+def test_no_undefined_label_errors_for_index_expressions(tmp_path):
+    doc = tmp_path / 'doc.md'
+    doc.write_text("# Doc\n\nThe cell matrix[0][1] holds arr[i][j].\n\n"
+                   "A [real][missing] reference.\n", encoding='utf-8')
+    checker = LinkChecker(str(tmp_path))
+    checker.check_file(str(doc))
+    assert [link['error'] for link in checker.broken_links] == [
+        "Reference link label 'missing' is not defined"]
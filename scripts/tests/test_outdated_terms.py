@@ -0,0 +1,51 @@
+"""OutdatedTermScanner must find exactly what a per-term regex loop finds."""
+
+import re
+
+from validate_all_docs import OutdatedTermScanner, DEFAULT_OUTDATED_TERMS
+
+
+def per_term_hits(terms, text):
+    """Reference: one re.finditer pass per term, as the checker used to run."""
+    hits = []
+    for pattern, description in terms.items():
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            line = text.count('\n', 0, match.start()) + 1
+            column = match.start() - (text.rfind('\n', 0, match.start()) + 1) + 1
+            hits.append((line, column, description))
+    return sorted(hits)
+
+
+def test_terms_starting_at_the_same_offset_are_all_reported():
+    terms = {'camera-only': 'camera-only perception', 'camera': 'camera'}
+    text = "A2 uses camera-only\nperception; one Camera, camera-only."
+    hits = OutdatedTermScanner(terms).scan(text)
+    assert (1, 9, 'camera-only perception') in hits
+    assert (1, 9, 'camera') in hits
+    assert sorted(hits) == per_term_hits(terms, text)
+
+
+def test_regex_escapes_keep_their_case():
+    # \S and \W must not turn into \s and \w
+    terms = {r'gimbal\Scable': 'joined', r'RTX\W4080': 'rtx'}
+    text = "GIMBAL-CABLE and gimbal cable; RTX 4080, rtx_4080"
+    assert sorted(OutdatedTermScanner(terms).scan(text)) == per_term_hits(terms, text)
+
+
+def test_matches_per_term_loop_on_documents():
+    terms = dict(DEFAULT_OUTDATED_TERMS, **{'camera': 'camera', 'cable': 'cable'})
+    text = ("# Vision\n\n"
+            "The single Arducam setup used a CSI cable through the gimbal.\n"
+            "Camera-only perception, camera-only again; CAMERA.\n"
+            "RTX 4080 for production LLM serving, RTX 4080 in production LLM.\n"
+            "İstanbul camera\n")
+    assert sorted(OutdatedTermScanner(terms).scan(text)) == per_term_hits(terms, text)
+
+
+def test_escaped_literals_are_folded():
+    # An escaped backslash is followed by a literal; \É is a literal too
+    terms = {r'path\\Name': 'path', r'\ÉTÉ': 'summer', r'[Z-a]x': 'no fold'}
+    text = "C:PATH\\NAME and path\\name; Été, ÉTÉ; ^X _x\n"
+    hits = OutdatedTermScanner(terms).scan(text)
+    assert len(hits) == 6
+    assert sorted(hits) == per_term_hits(terms, text)
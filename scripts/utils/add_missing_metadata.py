@@ -6,11 +6,12 @@ Add metadata blocks to files that are missing them.
 import os
 from datetime import datetime
 
+from doc_model import get_document
+
 def add_metadata_to_file(filepath, metadata_type="yaml"):
     """Add appropriate metadata block to a file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = get_document(filepath).text
     except Exception as e:
         print(f"❌ Cannot read {filepath}: {e}")
         return False
@@ -11,26 +11,51 @@ Validates all internal links in markdown documentation:
 
 import os
 import re
+import stat
 import sys
 import argparse
+import hashlib
+import subprocess
+import tempfile
+from collections import Counter
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
+from markdown_tokens import tokenize, normalize_label, HEADER, LINK, REF_LINK, REF_DEF
+from doc_model import get_document, default_cache
+from external_links import ExternalLinkChecker
+from trigram_index import TrigramIndex
+
 class LinkChecker:
     def __init__(self, base_directory):
         self.base_directory = Path(base_directory).resolve()
         self.broken_links = []
         self.warnings = []
         self.checked_files = set()
+        # Per-run anchor index: path -> (mtime, anchor set, header list)
+        self._anchor_index = {}
+        # Trigram indexes for suggestions, built once per run
+        self._path_trigrams = None
+        self._anchor_trigrams = {}
+        # Links and anchors of every checked file, keyed by relative path
+        self.parsed_files = {}
+        
+    def check_file(self, filepath, content=None):
+        """Check all links in a single markdown file.
         
-    def check_file(self, filepath):
-        """Check all links in a single markdown file."""
+        ``content`` overrides the file on disk (e.g. an unsaved editor buffer).
+        """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is not None:
+                links, headers, undefined_refs, external = self._scan(content)
+            else:
+                # The shared document model tokenizes each file once
+                links, headers, undefined_refs, external = self._scan(
+                    tokens=get_document(filepath).tokens)
         except Exception as e:
             self.broken_links.append({
                 'file': str(filepath),
@@ -42,60 +67,120 @@ class LinkChecker:
         self.checked_files.add(str(filepath))
         relative_path = os.path.relpath(filepath, self.base_directory)
         
-        # Find all markdown links
-        links = self._extract_links(content)
+        # Prime the anchor index with this file so same-file anchors are free
+        # (buffer content is not what other files see on disk, so skip it)
+        if content is None:
+            self._anchor_index[os.path.abspath(filepath)] = (
+                os.path.getmtime(filepath), {h['anchor'] for h in headers}, headers)
+        
+        self.parsed_files[relative_path] = {
+            'anchors': [h['anchor'] for h in headers],
+            'links': [{'line': link_info['line'],
+                       'url': link_info['url'],
+                       'target': self._resolve_target(filepath, relative_path, link_info['url'])[3]}
+                      for link_info in links],
+            'external': external
+        }
         
         for link_info in links:
             self._validate_link(filepath, relative_path, link_info)
             
-    def _extract_links(self, content):
-        """Extract all markdown links from content."""
-        links = []
-        lines = content.split('\n')
+        for ref in undefined_refs:
+            self.broken_links.append({
+                'file': relative_path,
+                'line': ref['line'],
+                'link': ref['url'],
+                'error': f"Reference link label '{ref['text']}' is not defined"
+            })
+            
+    def check_files(self, filepaths, jobs=1):
+        """Check a list of files, optionally fanning them out across processes.
         
-        # Pattern for markdown links: [text](url) or [text](url#anchor)
-        link_pattern = r'\[([^\]]*)\]\(([^)]+)\)'
+        Each worker process runs its own LinkChecker. Results are merged back
+        in the order of ``filepaths`` so the output matches a serial run.
+        Returns one (broken_links, warnings) pair per input file.
+        """
+        per_file = []
+        if jobs <= 1 or len(filepaths) < 2:
+            for filepath in filepaths:
+                broken_start, warning_start = len(self.broken_links), len(self.warnings)
+                self.check_file(filepath)
+                per_file.append((self.broken_links[broken_start:], self.warnings[warning_start:]))
+            return per_file
+            
+        chunksize = max(1, len(filepaths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=_init_worker,
+                                 initargs=(str(self.base_directory),)) as pool:
+            for broken, warnings, checked, parsed in pool.map(_check_file_in_worker, filepaths,
+                                                              chunksize=chunksize):
+                self.broken_links.extend(broken)
+                self.warnings.extend(warnings)
+                self.checked_files.update(checked)
+                self.parsed_files.update(parsed)
+                per_file.append((broken, warnings))
+        return per_file
+            
+    def _scan(self, source=None, tokens=None):
+        """Tokenize markdown once and collect links and headers.
         
-        for line_num, line in enumerate(lines, 1):
-            matches = re.finditer(link_pattern, line)
-            for match in matches:
-                link_text = match.group(1)
-                link_url = match.group(2)
-                
-                # Skip external links (http/https)
-                if link_url.startswith(('http://', 'https://', 'mailto:')):
+        ``source`` is a string or an iterable of lines (e.g. an open file);
+        pass ``tokens`` instead to reuse an existing tokenizer pass.
+        Returns (links, headers, undefined_refs, external). Links cover
+        inline links and reference definitions; code blocks and code spans
+        are skipped. External http(s) links are returned separately.
+        """
+        links = []
+        external = []
+        headers = []
+        ref_uses = []
+        ref_labels = set()
+        
+        for token in tokens if tokens is not None else tokenize(source):
+            if token.kind == HEADER:
+                headers.append({
+                    'level': token.level,
+                    'text': token.text,
+                    'anchor': self._normalize_anchor(token.text),
+                    'line': token.line
+                })
+            elif token.kind in (LINK, REF_DEF):
+                if token.kind == REF_DEF:
+                    ref_labels.add(normalize_label(token.text))
+                    
+                # External links are only checked with --external
+                if token.target.startswith(('http://', 'https://')):
+                    external.append({'line': token.line, 'url': token.target})
+                    continue
+                if token.target.startswith('mailto:'):
                     continue
                     
                 links.append({
-                    'text': link_text,
-                    'url': link_url,
-                    'line': line_num,
-                    'full_line': line.strip()
+                    'text': token.text,
+                    'url': token.target,
+                    'line': token.line
                 })
+            elif token.kind == REF_LINK:
+                ref_uses.append(token)
                 
-        return links
+        # Reference definitions may follow their uses, so resolve at the end
+        undefined_refs = [{'text': token.target,
+                           'url': f"[{token.text}][{token.target}]",
+                           'line': token.line}
+                          for token in ref_uses if normalize_label(token.target) not in ref_labels]
+        
+        return links, headers, undefined_refs, external
+        
+    def _extract_links(self, content):
+        """Extract all internal markdown links from content."""
+        return self._scan(content)[0]
         
     def _validate_link(self, source_file, source_relative, link_info):
         """Validate a single link."""
         url = link_info['url']
         line_num = link_info['line']
-        
-        # Parse URL to separate path and anchor
-        if '#' in url:
-            file_path, anchor = url.split('#', 1)
-        else:
-            file_path = url
-            anchor = None
-            
-        # Handle empty file path (same-file anchor)
-        if not file_path:
-            target_file = source_file
-            target_relative = source_relative
-        else:
-            # Resolve relative path
-            source_dir = os.path.dirname(source_file)
-            target_file = os.path.normpath(os.path.join(source_dir, file_path))
-            target_relative = os.path.relpath(target_file, self.base_directory)
+        file_path, anchor, target_file, target_relative = self._resolve_target(
+            source_file, source_relative, url)
             
         # Check if target file exists
         if not os.path.exists(target_file):
@@ -104,7 +189,7 @@ class LinkChecker:
                 'line': line_num,
                 'link': url,
                 'error': f"Target file not found: {target_relative}",
-                'suggestion': self._suggest_file_fix(file_path)
+                'suggestion': self._suggest_file_fix(file_path, source_file)
             })
             return
             
@@ -122,11 +207,34 @@ class LinkChecker:
         if anchor:
             self._validate_anchor(source_relative, line_num, target_file, target_relative, anchor, url)
             
+    def _resolve_target(self, source_file, source_relative, url):
+        """Split a link URL and resolve its target file.
+        
+        Returns (file_path, anchor, target_file, target_relative).
+        """
+        # Parse URL to separate path and anchor
+        if '#' in url:
+            file_path, anchor = url.split('#', 1)
+        else:
+            file_path = url
+            anchor = None
+            
+        # Handle empty file path (same-file anchor)
+        if not file_path:
+            target_file = source_file
+            target_relative = source_relative
+        else:
+            # Resolve relative path
+            source_dir = os.path.dirname(source_file)
+            target_file = os.path.normpath(os.path.join(source_dir, file_path))
+            target_relative = os.path.relpath(target_file, self.base_directory)
+            
+        return file_path, anchor, target_file, target_relative
+        
     def _validate_anchor(self, source_relative, line_num, target_file, target_relative, anchor, full_url):
         """Validate that an anchor exists in the target file."""
         try:
-            with open(target_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            anchors, headers = self._get_anchor_index(target_file)
         except Exception as e:
             self.broken_links.append({
                 'file': source_relative,
@@ -136,22 +244,13 @@ class LinkChecker:
             })
             return
             
-        # Find all headers in target file
-        headers = self._extract_headers(content)
-        
         # Convert anchor to expected format (lowercase, hyphens)
         expected_anchor = self._normalize_anchor(anchor)
         
-        # Check if anchor exists
-        found = False
-        for header in headers:
-            if header['anchor'] == expected_anchor:
-                found = True
-                break
-                
-        if not found:
+        # Check if anchor exists (O(1) lookup in the anchor index)
+        if expected_anchor not in anchors:
             # Try to find similar headers for suggestions
-            suggestions = self._suggest_anchor_fix(expected_anchor, headers)
+            suggestions = self._suggest_anchor_fix(expected_anchor, target_file)
             
             self.broken_links.append({
                 'file': source_relative,
@@ -162,30 +261,26 @@ class LinkChecker:
                 'similar': suggestions
             })
             
+    def _get_anchor_index(self, target_file):
+        """Return (anchors, headers) for a file, parsing it once per mtime."""
+        key = os.path.abspath(target_file)
+        mtime = os.path.getmtime(key)
+        cached = self._anchor_index.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+            
+        headers = [dict(header, anchor=self._normalize_anchor(header['text']))
+                   for header in get_document(key).headers]
+        anchors = {header['anchor'] for header in headers}
+        self._anchor_index[key] = (mtime, anchors, headers)
+        return anchors, headers
+        
     def _extract_headers(self, content):
         """Extract all headers from markdown content."""
-        headers = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith('#'):
-                # Extract header text
-                header_match = re.match(r'^(#{1,6})\s+(.+)', line.strip())
-                if header_match:
-                    level = len(header_match.group(1))
-                    text = header_match.group(2).strip()
-                    anchor = self._normalize_anchor(text)
-                    
-                    headers.append({
-                        'level': level,
-                        'text': text,
-                        'anchor': anchor,
-                        'line': line_num
-                    })
-                    
-        return headers
+        return self._scan(content)[1]
         
-    def _normalize_anchor(self, text):
+    @staticmethod
+    def _normalize_anchor(text):
         """Convert header text to anchor format."""
         # Remove markdown formatting
         text = re.sub(r'[*_`]', '', text)
@@ -198,54 +293,72 @@ class LinkChecker:
         text = text.strip('-')
         return text
         
-    def _suggest_file_fix(self, broken_path):
-        """Suggest fixes for broken file paths."""
+    def _suggest_file_fix(self, broken_path, source_file):
+        """Suggest fixes for broken file paths from anywhere in the tree."""
         if not broken_path:
             return None
             
-        # Look for similar files
-        filename = os.path.basename(broken_path)
-        directory = os.path.dirname(broken_path)
-        
-        # Search for files with similar names
-        suggestions = []
-        search_dir = os.path.join(self.base_directory, directory) if directory else self.base_directory
-        
-        if os.path.exists(search_dir):
-            for file in os.listdir(search_dir):
-                if file.endswith('.md') and self._similarity(filename, file) > 0.6:
-                    suggestions.append(os.path.join(directory, file) if directory else file)
-                    
-        return suggestions[:3] if suggestions else None
-        
-    def _suggest_anchor_fix(self, broken_anchor, headers):
-        """Suggest fixes for broken anchors."""
-        suggestions = []
-        for header in headers:
-            if self._similarity(broken_anchor, header['anchor']) > 0.6:
-                suggestions.append(header['anchor'])
+        if self._path_trigrams is None:
+            self._path_trigrams = TrigramIndex()
+            for filepath in find_markdown_files(self.base_directory):
+                relative = os.path.relpath(filepath, self.base_directory)
+                self._path_trigrams.add(os.path.basename(relative), relative)
                 
-        return suggestions[:3]
+        # Rank tree files by filename similarity (so moved files are found
+        # in any directory), then express each suggestion relative to the
+        # linking file
+        source_dir = os.path.dirname(os.path.abspath(source_file))
+        matches = self._path_trigrams.search(os.path.basename(broken_path), threshold=0.4)
+        suggestions = [os.path.relpath(os.path.join(self.base_directory, candidate), source_dir)
+                       for candidate, _ in matches]
+                    
+        return suggestions if suggestions else None
         
-    def _similarity(self, a, b):
-        """Calculate simple similarity between two strings."""
-        if not a or not b:
-            return 0
+    def _suggest_anchor_fix(self, broken_anchor, target_file):
+        """Suggest fixes for broken anchors, ranked by trigram similarity."""
+        key = os.path.abspath(target_file)
+        mtime, _, headers = self._anchor_index[key]
+        cached = self._anchor_trigrams.get(key)
+        if cached is None or cached[0] != mtime:
+            index = TrigramIndex()
+            for header in headers:
+                index.add(header['anchor'])
+            cached = (mtime, index)
+            self._anchor_trigrams[key] = cached
             
-        # Simple Jaccard similarity
-        set_a = set(a.lower())
-        set_b = set(b.lower())
-        intersection = len(set_a & set_b)
-        union = len(set_a | set_b)
+        return [anchor for anchor, _ in cached[1].search(broken_anchor)]
         
-        return intersection / union if union > 0 else 0
+    def check_external(self, parsed_files, external_checker):
+        """Check the external links recorded in ``parsed_files``.
+        
+        ``parsed_files`` maps relative paths to entries with an 'external'
+        list (LinkChecker.parsed_files or LinkCache.files). Broken links are
+        appended to broken_links in file and line order.
+        """
+        urls = {link['url'].split('#', 1)[0]
+                for entry in parsed_files.values() for link in entry.get('external', [])}
+        results = external_checker.check_urls(urls)
+        
+        for relative_path in sorted(parsed_files):
+            for link in parsed_files[relative_path].get('external', []):
+                result = results[link['url'].split('#', 1)[0]]
+                if result['ok']:
+                    continue
+                reason = f"HTTP {result['status']}" if result['status'] else result['error']
+                self.broken_links.append({
+                    'file': relative_path,
+                    'line': link['line'],
+                    'link': link['url'],
+                    'error': f"External link failed: {reason}"
+                })
+        return len(urls)
         
     def get_results(self):
         """Get link checking results."""
         return {
             'broken_links': self.broken_links,
             'warnings': self.warnings,
-            'checked_files': list(self.checked_files),
+            'checked_files': sorted(self.checked_files),
             'broken_count': len(self.broken_links),
             'warning_count': len(self.warnings),
             'files_checked': len(self.checked_files)
@@ -284,6 +397,479 @@ class LinkChecker:
             
         return len(self.broken_links) == 0  # Return True if no broken links
 
+# Per-process checker used by --jobs workers
+_worker_checker = None
+
+def _init_worker(base_directory):
+    """Create the LinkChecker owned by a pool worker process."""
+    global _worker_checker
+    _worker_checker = LinkChecker(base_directory)
+
+def _check_file_in_worker(filepath):
+    """Check one file in a pool worker and return its findings."""
+    checker = _worker_checker
+    checker.broken_links = []
+    checker.warnings = []
+    checker.checked_files = set()
+    checker.parsed_files = {}
+    checker.check_file(filepath)
+    return (checker.broken_links, checker.warnings,
+            sorted(checker.checked_files), checker.parsed_files)
+
+class LinkCache:
+    """Persisted content-hash cache backing ``--incremental`` runs.
+    
+    For every markdown file the cache stores its size, mtime, content hash,
+    ordered anchor list, extracted links and the findings of its last check.
+    Every other local link target (images, assets, files outside the
+    checked set) is recorded with its stat signature. A later run only
+    re-validates files whose content changed, plus files that link into a
+    changed file whose anchors (or existence) changed or into a target
+    whose signature changed. Everything else is replayed from the cache,
+    so the merged results match a full run.
+    """
+    
+    VERSION = 5
+    
+    def __init__(self, cache_path, base_directory):
+        self.cache_path = cache_path
+        self.base_directory = str(Path(base_directory).resolve())
+        self.files = {}
+        self.targets = {}
+        self.dirs = {}
+        self.file_list = []
+        self.walk_root = None
+        self.stats = {'reused': 0, 'changed': 0, 'dependents': 0, 'removed': 0}
+        
+    def load(self):
+        """Load the cache file, discarding it if it is stale or unreadable."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != self.VERSION or data.get('base_directory') != self.base_directory:
+            return
+        self.files = data.get('files', {})
+        self.targets = data.get('targets', {})
+        self.dirs = data.get('dirs', {})
+        self.file_list = data.get('file_list', [])
+        self.walk_root = data.get('walk_root')
+        
+    def save(self):
+        """Write the cache file atomically."""
+        data = {
+            'version': self.VERSION,
+            'base_directory': self.base_directory,
+            'walk_root': self.walk_root,
+            'dirs': self.dirs,
+            'file_list': self.file_list,
+            'files': self.files,
+            'targets': self.targets
+        }
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path)
+        
+    def find_markdown_files(self, directory):
+        """Return the markdown file list, re-walking only if a directory changed.
+        
+        Adding or removing an entry bumps the parent directory's mtime, so
+        unchanged directory mtimes mean the cached file list is still valid.
+        """
+        walk_root = [os.getcwd(), directory]
+        if self.dirs and self.walk_root == walk_root:
+            try:
+                unchanged = all(os.stat(path).st_mtime_ns == mtime
+                                for path, mtime in self.dirs.items())
+            except OSError:
+                unchanged = False
+            if unchanged:
+                return list(self.file_list)
+                
+        markdown_files = find_markdown_files(directory)
+        self.dirs = {}
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__']]
+            self.dirs[root] = os.stat(root).st_mtime_ns
+        self.file_list = markdown_files
+        self.walk_root = walk_root
+        return markdown_files
+        
+    def check(self, checker, filepaths, jobs=1, prune=True):
+        """Check ``filepaths`` incrementally, filling ``checker`` with merged results.
+        
+        With ``prune`` (a full-tree run) cached files missing from
+        ``filepaths`` are treated as deleted.
+        """
+        relative = {filepath: os.path.relpath(filepath, checker.base_directory) for filepath in filepaths}
+        current = set(relative.values())
+        
+        # Find files whose content changed since the last run
+        changed = []
+        fresh_stat = {}
+        for filepath in filepaths:
+            rel = relative[filepath]
+            entry = self.files.get(rel)
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                changed.append(filepath)
+                continue
+            if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+                continue
+            digest = _hash_file(filepath)
+            if entry and entry['hash'] == digest:
+                entry['size'], entry['mtime'] = st.st_size, st.st_mtime_ns
+                continue
+            fresh_stat[rel] = (st.st_size, st.st_mtime_ns, digest)
+            changed.append(filepath)
+            
+        removed = [rel for rel in self.files if rel not in current] if prune else []
+        previous_anchors = {rel: entry['anchors'] for rel, entry in self.files.items()}
+        for rel in removed:
+            del self.files[rel]
+            
+        results = {}
+        self._store(checker, changed, checker.check_files(changed, jobs=jobs),
+                    relative, fresh_stat, results)
+        
+        # A changed file only invalidates the files linking to it when its
+        # anchors or its existence changed
+        affected = set(removed)
+        for filepath in changed:
+            rel = relative[filepath]
+            new_anchors = self.files.get(rel, {}).get('anchors')
+            if rel not in previous_anchors or new_anchors != previous_anchors[rel]:
+                affected.add(rel)
+                
+        # Links to anything that is not checked here depend on that target's
+        # state on disk: an image deleted, a directory created in its place
+        previous_targets = self.targets
+        targets = {link['target'] for entry in self.files.values() for link in entry['links']}
+        self.targets = {target: _target_state(os.path.join(checker.base_directory, target))
+                        for target in sorted(targets - current)}
+        affected |= {target for target, state in self.targets.items()
+                     if previous_targets.get(target, state) != state}
+                
+        changed_rels = {relative[filepath] for filepath in changed}
+        dependent_rels = LinkGraph.from_parsed(self.files).dependents(affected) - changed_rels
+        
+        # Missing-target suggestions are drawn from the whole tree, so they
+        # go stale whenever a file appears or disappears
+        if removed or any(rel not in previous_anchors for rel in changed_rels):
+            dependent_rels |= {rel for rel, entry in self.files.items()
+                               if rel not in changed_rels and any(
+                                   link['error'].startswith('Target file not found')
+                                   for link in entry['broken_links'])}
+        dependents = [filepath for filepath in filepaths if relative[filepath] in dependent_rels]
+        self._store(checker, dependents, checker.check_files(dependents, jobs=jobs),
+                    relative, {}, results)
+        
+        # Merge fresh and cached findings back in input order
+        checker.broken_links = []
+        checker.warnings = []
+        for filepath in filepaths:
+            rel = relative[filepath]
+            if filepath in results:
+                broken, warnings = results[filepath]
+            else:
+                entry = self.files[rel]
+                broken, warnings = entry['broken_links'], entry['warnings']
+                checker.checked_files.add(str(filepath))
+            checker.broken_links.extend(broken)
+            checker.warnings.extend(warnings)
+            
+        self.stats = {
+            'reused': len(filepaths) - len(results),
+            'changed': len(changed),
+            'dependents': len(dependents),
+            'removed': len(removed)
+        }
+        
+    def _store(self, checker, filepaths, per_file, relative, fresh_stat, results):
+        """Record freshly checked files in the cache and in ``results``."""
+        for filepath, (broken, warnings) in zip(filepaths, per_file):
+            rel = relative[filepath]
+            results[filepath] = (broken, warnings)
+            parsed = checker.parsed_files.get(rel)
+            if parsed is None:
+                # Unreadable files are never cached so they are retried next run
+                self.files.pop(rel, None)
+                continue
+            entry = self.files.get(rel, {})
+            if rel in fresh_stat:
+                entry['size'], entry['mtime'], entry['hash'] = fresh_stat[rel]
+            entry['anchors'] = parsed['anchors']
+            entry['links'] = parsed['links']
+            entry['external'] = parsed['external']
+            entry['broken_links'] = broken
+            entry['warnings'] = warnings
+            self.files[rel] = entry
+
+    def check_changed(self, checker, changed, deleted, tracked=(), jobs=1):
+        """Validate ``changed`` files plus every file linking to a changed
+        or deleted path, without walking the tree.
+        
+        ``changed`` and ``deleted`` are paths relative to the base directory;
+        ``tracked`` lists the markdown files git knows about. Cached entries
+        and tracked files are stat-checked first, and the ones that changed
+        outside the diff (a pull or checkout since the cache was written) or
+        are not cached yet are re-parsed, so the link graph is current before
+        dependents are computed. Only changed files and their dependents are
+        reported. Returns the list of reported files.
+        """
+        base = checker.base_directory
+        changed, deleted = set(changed), set(deleted)
+        
+        # Bring the cache up to date with the working tree
+        refresh, vanished, fresh_stat = [], [], {}
+        for rel in sorted((set(self.files) | set(tracked)) - changed - deleted):
+            filepath = os.path.join(base, rel)
+            entry = self.files.get(rel)
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                if entry is not None:
+                    vanished.append(rel)
+                continue
+            if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+                continue
+            digest = _hash_file(filepath)
+            if entry and entry['hash'] == digest:
+                entry['size'], entry['mtime'] = st.st_size, st.st_mtime_ns
+                continue
+            fresh_stat[rel] = (st.st_size, st.st_mtime_ns, digest)
+            refresh.append(filepath)
+        refresh_relative = {filepath: os.path.relpath(filepath, base) for filepath in refresh}
+        previous_anchors = {rel: self.files[rel]['anchors']
+                            for rel in refresh_relative.values() if rel in self.files}
+        for rel in vanished:
+            del self.files[rel]
+        self._store(checker, refresh, checker.check_files(refresh, jobs=jobs),
+                    refresh_relative, fresh_stat, {})
+            
+        graph = LinkGraph.from_parsed(self.files)
+        for rel in deleted:
+            self.files.pop(rel, None)
+            
+        changed_files = [os.path.join(base, rel) for rel in sorted(changed)
+                         if rel.endswith('.md') and os.path.isfile(os.path.join(base, rel))]
+        dependents = sorted(graph.dependents(changed | deleted | set(vanished)) - changed)
+        dependent_files = [os.path.join(base, rel) for rel in dependents
+                           if os.path.isfile(os.path.join(base, rel))]
+        filepaths = changed_files + dependent_files
+        
+        # Files linking to a re-parsed file whose anchors changed have stale
+        # findings too; they are re-checked for the cache but not reported
+        stale = {rel for filepath, rel in refresh_relative.items()
+                 if self.files.get(rel, {}).get('anchors') != previous_anchors.get(rel)}
+        stale_files = [os.path.join(base, rel)
+                       for rel in sorted(graph.dependents(stale) - changed - set(dependents))
+                       if os.path.isfile(os.path.join(base, rel))]
+        
+        # Files re-parsed above are already current; check the rest
+        relative = {filepath: os.path.relpath(filepath, base) for filepath in filepaths + stale_files}
+        to_check = [filepath for filepath in filepaths + stale_files
+                    if filepath not in refresh_relative]
+        fresh_stat = {}
+        for filepath in changed_files:
+            st = os.stat(filepath)
+            fresh_stat[relative[filepath]] = (st.st_size, st.st_mtime_ns, _hash_file(filepath))
+        self._store(checker, to_check, checker.check_files(to_check, jobs=jobs),
+                    relative, fresh_stat, {})
+        for rel in changed | deleted:
+            if rel in self.targets:
+                self.targets[rel] = _target_state(os.path.join(base, rel))
+                
+        # Report the scoped files only, in order
+        checker.broken_links = []
+        checker.warnings = []
+        checker.checked_files = set()
+        for filepath in filepaths:
+            entry = self.files.get(relative[filepath])
+            if entry is None:
+                continue
+            checker.broken_links.extend(entry['broken_links'])
+            checker.warnings.extend(entry['warnings'])
+            checker.checked_files.add(str(filepath))
+        
+        self.stats = {
+            'reused': 0,
+            'changed': len(changed_files),
+            'dependents': len(dependent_files),
+            'removed': len(deleted) + len(vanished),
+            'refreshed': len(refresh)
+        }
+        return filepaths
+
+class LinkGraph:
+    """Reverse link index: target file -> [(source file, line), ...].
+    
+    Built from the per-file links recorded by LinkChecker.check_file (or
+    replayed from a LinkCache), with all paths relative to the base
+    directory.
+    """
+    
+    def __init__(self):
+        self.reverse = {}
+        
+    @classmethod
+    def from_parsed(cls, parsed_files):
+        """Build the graph from a relative path -> {'links': [...]} mapping."""
+        graph = cls()
+        for source, entry in parsed_files.items():
+            graph.add(source, entry['links'])
+        return graph
+        
+    def add(self, source, links):
+        """Register the links found in ``source``."""
+        for link in links:
+            self.reverse.setdefault(link['target'], []).append((source, link['line']))
+            
+    def sources(self, target):
+        """Return the (source file, line) pairs linking to ``target``."""
+        return self.reverse.get(target, [])
+        
+    def dependents(self, targets):
+        """Return the set of source files linking to any of ``targets``."""
+        return {source for target in targets for source, _ in self.reverse.get(target, ())}
+
+def git_changed_files(directory, ref):
+    """List markdown-relevant changes in ``directory`` since a git ref.
+    
+    Returns (changed, deleted, renamed): path lists relative to
+    ``directory`` plus a new path -> old path mapping for renames and
+    copies. Renames count as a deletion of the old path plus a change of
+    the new one, and untracked files count as changed.
+    """
+    # -z keeps paths verbatim (no quoting of spaces or non-ASCII names)
+    diff = subprocess.run(
+        ['git', '-C', directory, 'diff', '--name-status', '-z', '-M', '--relative', ref],
+        capture_output=True, text=True, check=True).stdout
+    untracked = subprocess.run(
+        ['git', '-C', directory, 'ls-files', '-z', '--others', '--exclude-standard'],
+        capture_output=True, text=True, check=True).stdout
+        
+    # Records are "status NUL path NUL", with a second path for renames
+    # and copies ("R100 NUL old NUL new NUL")
+    changed, deleted, renamed = [], [], {}
+    fields = iter(diff.split('\0'))
+    for status in fields:
+        if not status:
+            continue
+        status = status[:1]
+        path = next(fields)
+        if status == 'D':
+            deleted.append(path)
+        elif status == 'R':
+            deleted.append(path)
+            changed.append(next(fields))
+            renamed[os.path.normpath(changed[-1])] = os.path.normpath(path)
+        elif status == 'C':
+            changed.append(next(fields))
+            renamed[os.path.normpath(changed[-1])] = os.path.normpath(path)
+        else:
+            changed.append(path)
+    changed.extend(path for path in untracked.split('\0') if path)
+    
+    normalize = os.path.normpath
+    return (sorted({normalize(p) for p in changed}), sorted({normalize(p) for p in deleted}),
+            renamed)
+
+def git_baseline_findings(directory, ref, relpaths):
+    """Count the broken links ``relpaths`` had at git ``ref``.
+    
+    The tree at ``ref`` is recreated in a temporary directory: markdown
+    files with their content, every other file as an empty placeholder
+    (links only need it to exist). Returns a Counter of finding keys (see
+    _finding_key) for the files that existed at ``ref``.
+    """
+    listing = subprocess.run(
+        ['git', '-C', directory, 'ls-tree', '-r', '-z', '--name-only', ref],
+        capture_output=True, text=True, check=True).stdout
+    paths = [path for path in listing.split('\0') if path]
+    markdown = [path for path in paths if path.endswith('.md')]
+    contents = subprocess.run(
+        ['git', '-C', directory, 'cat-file', '--batch'],
+        input=''.join(f"{ref}:./{path}\n" for path in markdown).encode('utf-8'),
+        capture_output=True, check=True).stdout
+        
+    with tempfile.TemporaryDirectory() as root:
+        position = 0
+        blobs = {}
+        for path in markdown:
+            header_end = contents.index(b'\n', position)
+            size = int(contents[position:header_end].split()[2])
+            blobs[path] = contents[header_end + 1:header_end + 1 + size]
+            position = header_end + 1 + size + 1
+        for path in paths:
+            target = os.path.join(root, path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(blobs.get(path, b''))
+                
+        checker = LinkChecker(root)
+        existing = [os.path.join(root, rel) for rel in relpaths if rel in blobs]
+        checker.check_files(existing)
+        for path in markdown:
+            default_cache().invalidate(os.path.join(root, path))
+        return Counter(_finding_key(item) for item in checker.broken_links + checker.warnings)
+
+def _finding_key(item, renamed=None):
+    """Line-independent identity of a broken link or warning."""
+    source = item['file']
+    if renamed:
+        source = renamed.get(source, source)
+    return source, item.get('link'), item.get('error') or item.get('warning')
+
+def new_findings(findings, baseline, renamed):
+    """Drop the findings already present in ``baseline`` (renames mapped back)."""
+    remaining = Counter(baseline)
+    kept = []
+    for item in findings:
+        key = _finding_key(item, renamed)
+        if remaining[key] > 0:
+            remaining[key] -= 1
+        else:
+            kept.append(item)
+    return kept
+
+def git_markdown_files(directory):
+    """Markdown files tracked by git in ``directory``, relative to it.
+    
+    Skips the same hidden and ignored directories as find_markdown_files.
+    """
+    listing = subprocess.run(
+        ['git', '-C', directory, 'ls-files', '-z', '--', '*.md'],
+        capture_output=True, text=True, check=True).stdout
+    tracked = []
+    for path in listing.split('\0'):
+        parts = path.split('/')
+        if path and not any(part.startswith('.') or part in ('node_modules', '__pycache__')
+                            for part in parts[:-1]):
+            tracked.append(os.path.normpath(path))
+    return tracked
+
+def _target_state(path):
+    """Stat signature of a link target: [size, mtime], 'dir' or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if stat.S_ISDIR(st.st_mode):
+        return 'dir'
+    return [st.st_size, st.st_mtime_ns]
+
+def _hash_file(filepath):
+    """Return the SHA-1 hex digest of a file's content."""
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 def find_markdown_files(directory):
     """Find all markdown files in directory."""
     markdown_files = []
@@ -303,31 +889,134 @@ def main():
                        help='Directory to check (default: a2-docs)')
     parser.add_argument('--output', help='Output results to JSON file')
     parser.add_argument('--files', nargs='*', help='Specific files to check')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only re-check files changed since the last run')
+    parser.add_argument('--cache-file',
+                       help='Cache file for --incremental (default: <directory>/.link_check_cache.json)')
+    parser.add_argument('--changed-since', metavar='GIT_REF',
+                       help='Only check files changed since GIT_REF and files linking to them')
+    parser.add_argument('--new-only', action='store_true',
+                       help='With --changed-since: only report links that were not already broken at GIT_REF')
+    parser.add_argument('--exclude', action='append', default=[], metavar='DIR',
+                       help='Skip markdown files under DIR, relative to the directory (repeatable)')
+    parser.add_argument('--external', action='store_true',
+                       help='Also check http(s) links (results cached in <directory>/.external_link_cache.json)')
+    parser.add_argument('--external-ttl', type=float, default=24,
+                       help='Hours before a cached external link result is revalidated (default: 24)')
+    parser.add_argument('--external-concurrency', type=int, default=16,
+                       help='Maximum concurrent external requests (default: 16)')
     
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.new_only and not args.changed_since:
+        parser.error('--new-only needs --changed-since')
     
     if not os.path.exists(args.directory):
         print(f"❌ Directory '{args.directory}' not found")
         sys.exit(1)
         
+    excludes = [os.path.normpath(path) + os.sep for path in args.exclude]
+    
+    def included(relative):
+        return not (relative + os.sep).startswith(tuple(excludes))
+        
     checker = LinkChecker(args.directory)
     
-    if args.files:
-        # Check specific files
-        files_to_check = args.files
+    cache = None
+    if args.incremental or args.changed_since:
+        cache_file = args.cache_file or os.path.join(args.directory, '.link_check_cache.json')
+        cache = LinkCache(cache_file, args.directory)
+        cache.load()
+    
+    if args.changed_since:
+        # Scope the run with git and the cached reverse link graph; without
+        # a cache the tracked files are parsed once to build it
+        try:
+            changed, deleted, renamed = git_changed_files(args.directory, args.changed_since)
+            tracked = [rel for rel in git_markdown_files(args.directory) if included(rel)]
+            changed = [rel for rel in changed if included(rel)]
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ Cannot diff against '{args.changed_since}': {e}")
+            sys.exit(1)
+            
+        print(f"🔍 Checking links affected by {len(changed)} changed and "
+              f"{len(deleted)} deleted files since {args.changed_since}...")
+        print()
+        scoped = cache.check_changed(checker, changed, deleted, tracked=tracked, jobs=jobs)
+        cache.save()
+        scoped = [filepath for filepath in scoped
+                  if included(os.path.relpath(filepath, checker.base_directory))]
+        checker.broken_links = [item for item in checker.broken_links if included(item['file'])]
+        checker.warnings = [item for item in checker.warnings if included(item['file'])]
+        checker.checked_files = {str(filepath) for filepath in scoped}
+        stats = cache.stats
+        print(f"♻️  Scoped: {stats['changed']} changed, {stats['dependents']} dependent, "
+              f"{stats['removed']} removed, {stats['refreshed']} refreshed in the cache")
+        print()
+        
+        if args.new_only:
+            # Links that were already broken at the ref are not this change's doing
+            scoped = [os.path.relpath(filepath, checker.base_directory) for filepath in scoped]
+            try:
+                baseline = git_baseline_findings(
+                    args.directory, args.changed_since, [renamed.get(rel, rel) for rel in scoped])
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"❌ Cannot read '{args.changed_since}': {e}")
+                sys.exit(1)
+            before = len(checker.broken_links) + len(checker.warnings)
+            checker.broken_links = new_findings(checker.broken_links, baseline, renamed)
+            checker.warnings = new_findings(checker.warnings, baseline, renamed)
+            known = before - len(checker.broken_links) - len(checker.warnings)
+            print(f"🧮 Ignoring {known} issues already present at {args.changed_since}")
+            print()
     else:
-        # Check all markdown files in directory
-        files_to_check = find_markdown_files(args.directory)
+        if args.files:
+            # Check specific files
+            files_to_check = args.files
+        elif cache:
+            # Reuse the cached file list unless the tree changed
+            files_to_check = cache.find_markdown_files(args.directory)
+        else:
+            # Check all markdown files in directory
+            files_to_check = find_markdown_files(args.directory)
+        files_to_check = [filepath for filepath in files_to_check
+                          if included(os.path.relpath(filepath, args.directory))]
+            
+        if not files_to_check:
+            print("No markdown files found to check")
+            sys.exit(0)
+            
+        print(f"🔍 Checking links in {len(files_to_check)} markdown files...")
+        print()
         
-    if not files_to_check:
-        print("No markdown files found to check")
-        sys.exit(0)
+        if cache:
+            cache.check(checker, files_to_check, jobs=jobs, prune=not args.files)
+            cache.save()
+            stats = cache.stats
+            print(f"♻️  Incremental: {stats['changed']} changed, {stats['dependents']} dependent, "
+                  f"{stats['removed']} removed, {stats['reused']} reused from cache")
+            print()
+        else:
+            checker.check_files(files_to_check, jobs=jobs)
         
-    print(f"🔍 Checking links in {len(files_to_check)} markdown files...")
-    print()
-    
-    for filepath in files_to_check:
-        checker.check_file(filepath)
+    if args.external:
+        # Incremental runs know the external links of every file from the cache
+        if cache and not args.changed_since:
+            parsed_files = cache.files
+        else:
+            parsed_files = checker.parsed_files
+        external_checker = ExternalLinkChecker(
+            cache_path=os.path.join(args.directory, '.external_link_cache.json'),
+            ttl=args.external_ttl * 3600,
+            concurrency=args.external_concurrency)
+        url_count = checker.check_external(parsed_files, external_checker)
+        external_checker.save_cache()
+        stats = external_checker.stats
+        print(f"🌐 External: {url_count} URLs ({stats['fetched']} fetched, "
+              f"{stats['revalidated']} revalidated, {stats['cached']} cached)")
+        print()
         
     # Print results
     success = checker.print_results()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Code Block Language Detection
+
+Shared language detector for the code-block fixers (fix_code_blocks.py,
+fix_advanced_formatting.py):
+- A block is read by a fixed handful of regex scans (words, line starts,
+  line ends and a few structural patterns, each skipped when the block
+  lacks the character it needs); every feature found is looked up in one
+  precompiled table that scores all languages at the same time
+- Line-start tokens, line endings, YAML/JSON keys, HTML/XML tags and
+  shebangs are features alongside plain keywords
+- detect_language() returns (language, confidence); callers decide how
+  confident a guess must be before labelling a fence
+
+Run it directly to benchmark the detector against the labelled fences in
+a documentation tree. Accuracy is reported separately for a held-out
+third of the fences (split by content), which tuning must not look at:
+
+    python3 scripts/utils/code_language.py [directory ...]
+"""
+
+import argparse
+import re
+import sys
+import time
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+LANGUAGES = ['python', 'bash', 'yaml', 'json', 'cpp', 'javascript', 'html', 'xml',
+             'sql', 'dockerfile', 'makefile', 'css', 'markdown']
+
+# Feature -> weight per language. Features are plain tokens ('self'),
+# line-start tokens ('^sudo'), line endings ('$;') and structural features
+# ('@yaml-key', '@json-key', '@tag-html', ...)
+FEATURES: Dict[str, Dict[str, float]] = {
+    'python': {
+        '^def': 4, '^import': 2, '^from': 2, '^class': 1, '^elif': 4, '^except': 3,
+        '^print': 2, '^with': 1, '^@': 1, '^async': 1, '^#': 0.3, '$:': 1, '@assignment': 1,
+        'self': 2, 'None': 2, 'True': 1, 'False': 1, 'elif': 2, 'lambda': 2,
+        '__name__': 3, '__init__': 3, '__main__': 3, 'def': 1, 'rclpy': 3, 'range': 1,
+        'isinstance': 2, 'kwargs': 2, 'args': 0.5, 'await': 0.5, 'yield': 1,
+    },
+    'bash': {
+        '^sudo': 4, '^cd': 3, '^ls': 3, '^mkdir': 3, '^chmod': 3, '^export': 3, '^echo': 3,
+        '^apt': 3, '^apt-get': 3, '^pip': 3, '^pip3': 3, '^npm': 3, '^npx': 3, '^yarn': 3,
+        '^git': 3, '^docker': 3, '^docker-compose': 3, '^curl': 3, '^wget': 3,
+        '^source': 3, '^ros2': 3, '^colcon': 3, '^make': 3, '^python': 3, '^python3': 3,
+        '^cp': 2, '^mv': 2, '^rm': 2, '^cat': 2, '^systemctl': 3, '^ssh': 3, '^scp': 3,
+        '^tar': 2, '^grep': 2, '^nano': 2, '^brew': 3, '^platformio': 3, '^pio': 3,
+        '^$': 3, '^./': 3, '^conda': 3, '^nvidia-smi': 3, '^#': 0.3, '@env-assignment': 1.5,
+        '^fi': 3, '^done': 2, '^then': 2, '^for': 0.5, '^if': 0.5, '^runpodctl': 3,
+        '@flag': 0.5, '@pipe': 0.5, '@var': 1, 'fi': 1, 'esac': 3, 'then': 1, 'sudo': 1,
+    },
+    'yaml': {
+        '@yaml-key': 1.5, '^-': 0.7, '^version': 1, '^services': 2, '^image': 2,
+        '^ports': 2, '^volumes': 2, '^environment': 2, '^depends_on': 3, '^networks': 2,
+        '^build': 0.5, '^command': 1, '^restart': 1, '^ros__parameters': 5,
+    },
+    'json': {
+        '@json-key': 2, '^{': 1.5, '^}': 0.5, '^[': 0.5, '$,': 0.3, 'null': 1,
+        'true': 0.5, 'false': 0.5,
+    },
+    'cpp': {
+        '^#include': 5, '^#define': 3, '^#ifndef': 3, '^#ifdef': 2, '^#endif': 3,
+        '^#pragma': 3, '^void': 3, '^int': 1, '^struct': 2, '^namespace': 3,
+        '^template': 3, '^//': 0.5, '$;': 1, '${': 0.5, '@scope': 1,
+        'void': 2, 'int': 1.5, 'double': 1.5, 'uint8_t': 3, 'uint16_t': 3, 'uint32_t': 3, 'int16_t': 3,
+        'int32_t': 3, 'size_t': 2, 'std': 2, 'nullptr': 3, 'Serial': 2, 'digitalWrite': 3,
+        'digitalRead': 3, 'pinMode': 3, 'analogRead': 3, 'millis': 2, 'delay': 1,
+        'setup': 1, 'loop': 1, 'struct': 1, 'bool': 1, 'float': 1.5, 'char': 1,
+        'unsigned': 2, 'sizeof': 2, 'const': 0.5, 'return': 0.5, 'static': 1,
+        'rclcpp': 3, 'public': 0.5, 'private': 0.5,
+    },
+    'javascript': {
+        '^const': 1, '^let': 2, '^function': 2, '^export': 2, '^import': 1,
+        '^//': 0.5, '$;': 0.7, '${': 0.5, '@arrow': 2, '@strict-eq': 2,
+        'const': 0.5, 'let': 1, 'function': 2, 'className': 3, 'console': 3, 'require': 2, 'undefined': 2,
+        'async': 1, 'await': 1, 'document': 1, 'window': 2, 'fetch': 2, 'useState': 3,
+        'useEffect': 3, 'React': 3, 'axios': 3, 'JSON': 1, 'process': 0.5,
+    },
+    'html': {
+        '^<!': 3, '@tag-html': 2, '^<': 0.5,
+    },
+    'xml': {
+        '^<?': 6, '@tag-xml': 1.5, '^<': 0.5,
+    },
+    'sql': {
+        '^SELECT': 5, '^INSERT': 5, '^UPDATE': 3, '^DELETE': 3, '^CREATE': 4,
+        '^ALTER': 5, '^DROP': 4, '^select': 3, '^insert': 3, '^create': 2,
+        'FROM': 1, 'WHERE': 2, 'INTO': 1, 'TABLE': 2, 'VALUES': 2, 'JOIN': 2,
+        'PRIMARY': 2, 'KEY': 1, 'VARCHAR': 3, 'INTEGER': 1, 'NOT': 0.5, 'NULL': 1,
+        'GROUP': 1, 'ORDER': 1, 'BY': 1,
+    },
+    'dockerfile': {
+        '^FROM': 4, '^RUN': 4, '^COPY': 4, '^WORKDIR': 5, '^CMD': 4, '^ENTRYPOINT': 5,
+        '^ENV': 3, '^EXPOSE': 5, '^ARG': 3, '^ADD': 3, '^USER': 2,
+    },
+    'css': {
+        '@css-property': 1.5, '$}': 0.3, '${': 0.3, 'px': 1, 'em': 0.5, 'rem': 1,
+        'color': 1, 'margin': 1, 'padding': 1, 'display': 1, 'flex': 1,
+    },
+    'makefile': {
+        '^.PHONY': 8, '@make-recipe': 1, '$:': 0.3,
+    },
+    'markdown': {
+        '@md-header': 0.3, '@md-link': 2, '@md-bold': 1, '^|': 0.5, '^-': 0.3, '^*': 0.5,
+        '^>': 0.5,
+    },
+}
+
+# token -> [(language, weight)], built once from FEATURES
+_TABLE: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+for _language, _features in FEATURES.items():
+    for _feature, _weight in _features.items():
+        _TABLE[_feature].append((_language, _weight))
+
+HTML_TAGS = {'html', 'head', 'body', 'div', 'span', 'p', 'a', 'script', 'style', 'link',
+             'meta', 'title', 'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 'img', 'br',
+             'form', 'input', 'button', 'h1', 'h2', 'h3', 'nav', 'header', 'footer'}
+SHEBANG_LANGUAGES = [('python', 'python'), ('bash', 'bash'), ('/sh', 'bash'),
+                     ('node', 'javascript')]
+
+# Whole-block scans, each run once per block at C speed. Line-start
+# patterns begin with a literal newline instead of ^ (the block is scanned
+# with a newline in front), which lets the engine jump from line to line
+# rather than try every position
+FIRST_TOKEN_RE = re.compile(r'\n[ \t]*(#\w+|//|/\*|<\?|<!|\./|\.[A-Z]+|[A-Za-z_][\w.-]*|\S)')
+LINE_END_RE = re.compile(r'([:;,{}])[^\S\n]*$', re.MULTILINE)
+WORD_RE = re.compile(r'[A-Za-z_]\w*')
+YAML_KEY_RE = re.compile(r'\n[ \t]*(?:- )?(?!(?:else|try|finally|except):)[A-Za-z_][\w.-]*:(?: |$)',
+                         re.MULTILINE)
+JSON_KEY_RE = re.compile(r'"[^"\n]*"[ \t]*:')
+TAG_RE = re.compile(r'</?([A-Za-z][\w:-]*)[\s>/]')
+CSS_PROPERTY_RE = re.compile(r'\n[ \t]*[a-z-]+[ \t]*:[ \t]*[^;\n]+;[ \t]*$', re.MULTILINE)
+MD_HEADER_RE = re.compile(r'\n#{1,6} ')
+FLAG_RE = re.compile(r'[ \t]--?[a-z]')
+VAR_RE = re.compile(r'\$\{?[A-Za-z_]')
+ASSIGNMENT_RE = re.compile(r'\n[ \t]*[A-Za-z_][\w.]* = ')
+ENV_ASSIGNMENT_RE = re.compile(r'\n(?:export )?[A-Z_][A-Z0-9_]*=')
+MAKE_RECIPE_RE = re.compile(r'\n\t[@$\w]')
+SYMBOL_FEATURES = [('=>', '@arrow'), ('===', '@strict-eq'), ('::', '@scope'),
+                   ('](', '@md-link'), ('**', '@md-bold'), (' | ', '@pipe')]
+
+# A guess needs at least this score, and this much of the total score
+MIN_SCORE = 3.0
+# Score at which a clear winner is fully confident
+CONFIDENT_SCORE = 10.0
+# Confidence the fixers require before labelling a fence
+MIN_CONFIDENCE = 0.2
+# Characters of a block that are scored; chosen on the tuning split (see
+# split_samples), where longer samples were slower and no more accurate
+MAX_SAMPLE = 512
+
+
+def _features(code: str) -> Counter:
+    """Count every feature of a block: a fixed handful of scans over the text.
+
+    Scans whose feature needs a particular character are skipped when the
+    block does not contain it.
+    """
+    # Every line, the first one included, now follows a newline
+    code = '\n' + code
+    features = Counter(WORD_RE.findall(code))
+    for token, count in Counter(FIRST_TOKEN_RE.findall(code)).items():
+        features['^' + token] = count
+    for char, count in Counter(LINE_END_RE.findall(code)).items():
+        features['$' + char] = count
+    if ':' in code:
+        features['@yaml-key'] = len(YAML_KEY_RE.findall(code))
+        if '"' in code:
+            features['@json-key'] = len(JSON_KEY_RE.findall(code))
+        if ';' in code:
+            features['@css-property'] = len(CSS_PROPERTY_RE.findall(code))
+    if '# ' in code:
+        features['@md-header'] = len(MD_HEADER_RE.findall(code))
+    if ' -' in code:
+        features['@flag'] = len(FLAG_RE.findall(code))
+    if '$' in code:
+        features['@var'] = len(VAR_RE.findall(code))
+    if '=' in code:
+        features['@assignment'] = len(ASSIGNMENT_RE.findall(code))
+        features['@env-assignment'] = len(ENV_ASSIGNMENT_RE.findall(code))
+    if '\t' in code:
+        features['@make-recipe'] = len(MAKE_RECIPE_RE.findall(code))
+    if '<' in code:
+        for tag in TAG_RE.findall(code):
+            features['@tag-html' if tag.lower() in HTML_TAGS else '@tag-xml'] += 1
+    for symbol, feature in SYMBOL_FEATURES:
+        if symbol in code:
+            features[feature] = code.count(symbol)
+    return features
+
+
+def score_languages(code: str) -> Counter:
+    """Score every language for a block of code at once."""
+    if len(code) > MAX_SAMPLE:
+        # The start of a big block is plenty of evidence
+        code = code[:code.rfind('\n', 0, MAX_SAMPLE) + 1 or MAX_SAMPLE]
+    scores = Counter()
+    table = _TABLE
+    features = _features(code)
+    # Most words are no feature; drop them with one set intersection
+    for feature in features.keys() & table.keys():
+        count = features[feature]
+        for language, weight in table[feature]:
+            scores[language] += weight * count
+
+    head = code.lstrip()
+    if 'json' in scores and not head.startswith(('{', '[')):
+        # JSON documents start with an object or array; "key": pairs
+        # elsewhere are dict literals in some other language
+        scores['json'] *= 0.1
+    if head.startswith('#!'):
+        shebang = head.split('\n', 1)[0]
+        for needle, language in SHEBANG_LANGUAGES:
+            if needle in shebang:
+                scores[language] += 10
+                break
+    return scores
+
+
+def detect_language(code: str) -> Tuple[str, float]:
+    """Return (language, confidence in 0..1), or ('', 0.0) with no clear guess.
+
+    Confidence is the winner's share of the total score, scaled down for
+    blocks with little evidence.
+    """
+    scores = score_languages(code)
+    if not scores:
+        return '', 0.0
+    # Ties go to the language listed first in LANGUAGES
+    language = max(LANGUAGES, key=lambda name: scores.get(name, 0))
+    best = scores[language]
+    if best < MIN_SCORE:
+        return '', 0.0
+    share = best / sum(scores.values())
+    return language, round(share * min(1.0, best / CONFIDENT_SCORE), 3)
+
+
+# -- benchmark --------------------------------------------------------------
+
+# Fence labels that name a supported language under another name
+LABEL_ALIASES = {'sh': 'bash', 'shell': 'bash', 'console': 'bash', 'zsh': 'bash',
+                 'py': 'python', 'python3': 'python', 'yml': 'yaml', 'c': 'cpp',
+                 'c++': 'cpp', 'arduino': 'cpp', 'ino': 'cpp', 'h': 'cpp', 'js': 'javascript',
+                 'jsx': 'javascript', 'ts': 'javascript', 'typescript': 'javascript',
+                 'md': 'markdown', 'docker': 'dockerfile', 'htm': 'html'}
+
+
+def labelled_fences(paths: List[str]) -> List[Tuple[str, str]]:
+    """(label, code) for every labelled, closed fence under ``paths``, deduplicated."""
+    from doc_model import get_document
+    from check_links import find_markdown_files
+
+    samples = []
+    seen = set()
+    for path in paths:
+        files = [path] if path.endswith('.md') else find_markdown_files(path)
+        for filepath in files:
+            doc = get_document(filepath)
+            for fence in doc.fences:
+                if fence['end'] is None or not fence['info'].strip():
+                    continue
+                label = fence['info'].split()[0].lower()
+                label = LABEL_ALIASES.get(label, label)
+                code = '\n'.join(doc.iter_lines(fence['start'] + 1, fence['end'] - 1))
+                if (label, code) not in seen:
+                    seen.add((label, code))
+                    samples.append((label, code))
+    return samples
+
+
+def split_samples(samples: List[Tuple[str, str]], holdout: int = 3):
+    """Split labelled samples into (tuning, held-out) lists.
+
+    Every ``holdout``-th block by the CRC of its text is held out, so the
+    split is the same on every run and a block repeated in several files
+    always lands on the same side.
+    """
+    tuning, held_out = [], []
+    for label, code in samples:
+        side = held_out if zlib.crc32(code.encode('utf-8')) % holdout == 0 else tuning
+        side.append((label, code))
+    return tuning, held_out
+
+
+def benchmark(detect, samples: List[Tuple[str, str]]) -> dict:
+    """Score ``detect(code) -> language or ''`` against labelled samples.
+
+    Blocks labelled with a supported language count as correct when the
+    detector names that language; blocks with other labels (text, msg,
+    ...) count as correct when it abstains.
+    """
+    supported = [(label, code) for label, code in samples if label in LANGUAGES]
+    other = [(label, code) for label, code in samples if label not in LANGUAGES]
+    confusion = Counter()
+    start = time.perf_counter()
+    correct = 0
+    for label, code in supported:
+        guess = detect(code) or ''
+        if guess == label:
+            correct += 1
+        else:
+            confusion[(label, guess or '-')] += 1
+    abstained = 0
+    for label, code in other:
+        guess = detect(code) or ''
+        if not guess:
+            abstained += 1
+        else:
+            confusion[(label, guess)] += 1
+    elapsed = time.perf_counter() - start
+    size = sum(len(code) for _, code in samples)
+    return {
+        'supported': len(supported),
+        'correct': correct,
+        'accuracy': correct / len(supported) if supported else 0.0,
+        'other': len(other),
+        'abstained': abstained,
+        'seconds': elapsed,
+        'kb_per_second': size / 1024 / elapsed if elapsed else 0.0,
+        'confusion': confusion.most_common(10)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark code block language detection')
+    parser.add_argument('paths', nargs='*', default=['.'],
+                        help='Markdown files or directories with labelled fences (default: .)')
+    parser.add_argument('--min-confidence', type=float, default=MIN_CONFIDENCE,
+                        help=f'Treat guesses below this confidence as no guess (default: {MIN_CONFIDENCE})')
+    args = parser.parse_args()
+
+    samples = labelled_fences(args.paths)
+    if not samples:
+        print("No labelled code fences found")
+        sys.exit(1)
+
+    def detect(code):
+        language, confidence = detect_language(code)
+        return language if confidence >= args.min_confidence else ''
+
+    result = benchmark(detect, samples)
+    print(f"🧪 {len(samples)} labelled fences "
+          f"({result['supported']} supported languages, {result['other']} other labels)")
+    print(f"   Accuracy: {result['correct']}/{result['supported']} ({result['accuracy']:.1%})")
+    print(f"   Abstained on other labels: {result['abstained']}/{result['other']}")
+    for name, part in zip(('Tuning split', 'Held-out split'), split_samples(samples)):
+        part_result = benchmark(detect, part)
+        print(f"   {name}: {part_result['correct']}/{part_result['supported']} "
+              f"({part_result['accuracy']:.1%}), abstained on "
+              f"{part_result['abstained']}/{part_result['other']}")
+    print(f"   Speed: {result['seconds'] * 1000:.1f} ms ({result['kb_per_second']:,.0f} KB/s)")
+    if result['confusion']:
+        print("   Most common mistakes (label -> guess):")
+        for (label, guess), count in result['confusion']:
+            print(f"     {count:>3}  {label} -> {guess}")
+
+
+if __name__ == "__main__":
+    main()
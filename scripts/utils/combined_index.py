@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Combined Documentation Index
+
+Random access into a2-complete-documentation.md, the concatenation of
+project docs in blocks of the form:
+
+    ---
+    ## File: <path>
+    ### Section: <name>
+    ---
+
+    <file content>
+    <!-- END OF FILE: <path> -->
+
+The index records the byte range of every embedded file and of every
+header section inside it (headers are tokenized per embedded file, so an
+unbalanced code fence cannot swallow the files after it), plus the
+``padding`` newline the generator added after the file content.
+Extracting a file or a section is a dictionary lookup plus one seek and
+read.
+
+The index is saved next to the combined file and rebuilt automatically
+when the combined file's size or mtime changes. regenerate() splices in
+only the embedded files whose source changed and shifts the offsets of
+everything after them instead of re-indexing the whole document.
+"""
+
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from markdown_tokens import tokenize, HEADER
+from check_links import LinkChecker
+
+FILE_RE = re.compile(r'^## File: (.+?)\s*$')
+SECTION_RE = re.compile(r'^### Section: (.*?)\s*$')
+END_RE = re.compile(r'^<!-- END OF FILE: (.+?) -->\s*$')
+
+
+def _index_headers(body_lines, first_line: int, first_offset: int, body_end: int) -> List[dict]:
+    """Index the headers of one embedded file.
+
+    ``body_lines`` are raw byte lines of the file body, starting at line
+    ``first_line`` and byte ``first_offset`` of the combined document.
+    """
+    offsets = []
+    text_lines = []
+    offset = first_offset
+    for raw in body_lines:
+        offsets.append(offset)
+        offset += len(raw)
+        text_lines.append(raw.decode('utf-8').rstrip('\r\n') + '\n')
+
+    headers = []
+    open_headers = []
+    for token in tokenize(text_lines):
+        if token.kind != HEADER:
+            continue
+        header = {
+            'level': token.level,
+            'text': token.text,
+            'anchor': LinkChecker._normalize_anchor(token.text),
+            'line': first_line + token.line - 1,
+            'start': offsets[token.line - 1],
+            'end': body_end
+        }
+        # A section ends where the next header of the same or a higher level starts
+        while open_headers and open_headers[-1]['level'] >= header['level']:
+            open_headers.pop()['end'] = header['start']
+        open_headers.append(header)
+        headers.append(header)
+    return headers
+
+
+def _temp_file(path: Path):
+    """Create a unique temp file next to ``path``; returns (fd, temp path)."""
+    return tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+
+
+class CombinedDocIndex:
+    VERSION = 2
+
+    def __init__(self, combined_path, index_path=None):
+        self.combined_path = Path(combined_path)
+        self.index_path = Path(index_path) if index_path else \
+            self.combined_path.with_name(f".{self.combined_path.stem}.index.json")
+        self.files: List[dict] = []
+        self.size = 0
+        self.mtime_ns = 0
+        self._by_path: Dict[str, dict] = {}
+        self._by_anchor: Dict[str, List[Tuple[dict, dict]]] = {}
+
+    # -- building and persistence ------------------------------------------
+
+    def load_or_build(self):
+        """Load the saved index, rebuilding it if the combined file changed."""
+        st = os.stat(self.combined_path)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') == self.VERSION and data.get('size') == st.st_size
+                    and data.get('mtime_ns') == st.st_mtime_ns):
+                self.files, self.size, self.mtime_ns = data['files'], data['size'], data['mtime_ns']
+                self._build_lookups()
+                return self
+        except (OSError, ValueError, KeyError):
+            pass
+        self.build()
+        self.save()
+        return self
+
+    def build(self):
+        """Scan the combined document once and record every byte range."""
+        files = []
+        current = None
+        body_lines = []
+        offset = 0
+        expect = None  # 'section' / 'separator' / 'blank' while reading a block header
+        previous = b''
+        previous_offset = 0
+
+        with open(self.combined_path, 'rb') as f:
+            for line_num, raw in enumerate(f, 1):
+                line = raw.decode('utf-8').rstrip('\r\n')
+                if current is None:
+                    match = FILE_RE.match(line)
+                    if match:
+                        block_start = previous_offset if previous.strip() == b'---' else offset
+                        current = {'path': match.group(1), 'section': '', 'start': block_start,
+                                   'line': line_num, 'body_start': None, 'body_line': None}
+                        expect = 'section'
+                elif expect is not None:
+                    # Block header: optional "### Section:", then "---", then a blank line
+                    if expect == 'section' and SECTION_RE.match(line):
+                        current['section'] = SECTION_RE.match(line).group(1)
+                        expect = 'separator'
+                    elif expect in ('section', 'separator') and line.strip() == '---':
+                        expect = 'blank'
+                    else:
+                        if not (expect == 'blank' and not line.strip()):
+                            body_lines.append(raw)
+                            current['body_start'], current['body_line'] = offset, line_num
+                        else:
+                            current['body_start'], current['body_line'] = offset + len(raw), line_num + 1
+                        expect = None
+                else:
+                    match = END_RE.match(line)
+                    if match and match.group(1) == current['path']:
+                        current['body_end'] = offset
+                        # The generator writes an extra newline before the END
+                        # OF FILE marker; without the source, a blank last
+                        # line is the only sign of it
+                        current['padding'] = 1 if len(body_lines) > 1 and body_lines[-1] == b'\n' else 0
+                        current['end'] = offset + len(raw)
+                        current['headers'] = _index_headers(body_lines, current['body_line'],
+                                                            current['body_start'], offset)
+                        files.append(current)
+                        current, body_lines = None, []
+                    else:
+                        body_lines.append(raw)
+
+                previous, previous_offset = raw, offset
+                offset += len(raw)
+
+        st = os.stat(self.combined_path)
+        self.files, self.size, self.mtime_ns = files, st.st_size, st.st_mtime_ns
+        self._build_lookups()
+        return self
+
+    def save(self):
+        """Write the index atomically."""
+        data = {
+            'version': self.VERSION,
+            'combined': str(self.combined_path),
+            'size': self.size,
+            'mtime_ns': self.mtime_ns,
+            'files': self.files
+        }
+        fd, tmp_path = _temp_file(self.index_path)
+        try:
+            # mkstemp creates the file private; give it the usual mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _build_lookups(self):
+        self._by_path = {}
+        self._by_anchor = {}
+        for entry in self.files:
+            self._by_path.setdefault(entry['path'], entry)
+            for header in entry['headers']:
+                self._by_anchor.setdefault(header['anchor'], []).append((entry, header))
+
+    # -- lookups -----------------------------------------------------------
+
+    def _read(self, start: int, end: int) -> str:
+        with open(self.combined_path, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start).decode('utf-8')
+
+    def extract(self, path: str) -> Optional[str]:
+        """Content of an embedded file, or None if it is not in the index."""
+        entry = self._by_path.get(path)
+        if entry is None:
+            return None
+        return self._read(entry['body_start'], entry['body_end'] - entry['padding'])
+
+    def find_sections(self, anchor: str, path: Optional[str] = None) -> List[Tuple[dict, dict]]:
+        """(file entry, header) pairs for an anchor, optionally within one file."""
+        matches = self._by_anchor.get(anchor.lstrip('#'), [])
+        if path is not None:
+            matches = [(entry, header) for entry, header in matches if entry['path'] == path]
+        return matches
+
+    def section(self, header: dict) -> str:
+        """Text of a header's section, header line included."""
+        return self._read(header['start'], header['end'])
+
+    # -- incremental regeneration ------------------------------------------
+
+    def regenerate(self, source_root, dry_run: bool = False) -> List[str]:
+        """Re-embed files whose source under ``source_root`` changed.
+
+        Only changed bodies are rewritten; unchanged byte ranges are copied
+        as-is and the index entries after each change are shifted rather
+        than rebuilt. Returns the paths that changed.
+        """
+        source_root = Path(source_root)
+        replacements = []
+        padding = {}
+        for entry in self.files:
+            source = source_root / entry['path']
+            if not source.is_file():
+                continue
+            content = source.read_bytes()
+            body = self._read(entry['body_start'], entry['body_end']).encode('utf-8')
+            # With the source at hand the padding is known, not inferred
+            if body == content + b'\n':
+                padding[id(entry)] = 1
+            elif body == content and content.endswith(b'\n'):
+                padding[id(entry)] = 0
+            else:
+                replacements.append((entry, content + b'\n', body.count(b'\n')))
+
+        if dry_run:
+            return [entry['path'] for entry, _, _ in replacements]
+        stale = False
+        for entry in self.files:
+            if entry['padding'] != padding.get(id(entry), entry['padding']):
+                entry['padding'] = padding[id(entry)]
+                stale = True
+        if not replacements:
+            if stale:
+                self.save()
+            return []
+
+        # Splice the new bodies into a copy of the combined file
+        fd, tmp_path = _temp_file(self.combined_path)
+        try:
+            with open(self.combined_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                position = 0
+                for entry, new_body, _ in replacements:
+                    dst.write(src.read(entry['body_start'] - position))
+                    dst.write(new_body)
+                    src.seek(entry['body_end'])
+                    position = entry['body_end']
+                while True:
+                    chunk = src.read(1 << 20)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+            shutil.copymode(self.combined_path, tmp_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        # Update the index: re-index changed files, shift everything after them
+        new_bodies = {id(entry): (new_body, old_lines) for entry, new_body, old_lines in replacements}
+        byte_delta = line_delta = 0
+        for entry in self.files:
+            if byte_delta or line_delta:
+                for key in ('start', 'body_start', 'body_end', 'end'):
+                    entry[key] += byte_delta
+                entry['line'] += line_delta
+                entry['body_line'] += line_delta
+                for header in entry['headers']:
+                    header['start'] += byte_delta
+                    header['end'] += byte_delta
+                    header['line'] += line_delta
+            if id(entry) in new_bodies:
+                new_body, old_lines = new_bodies[id(entry)]
+                old_length = entry['body_end'] - entry['body_start']
+                entry['body_end'] = entry['body_start'] + len(new_body)
+                entry['end'] += len(new_body) - old_length
+                entry['padding'] = 1
+                entry['headers'] = _index_headers(io.BytesIO(new_body), entry['body_line'],
+                                                  entry['body_start'], entry['body_end'])
+                byte_delta += len(new_body) - old_length
+                line_delta += new_body.count(b'\n') - old_lines
+
+        os.replace(tmp_path, self.combined_path)
+        st = os.stat(self.combined_path)
+        self.size, self.mtime_ns = st.st_size, st.st_mtime_ns
+        self._build_lookups()
+        self.save()
+        return [entry['path'] for entry, _, _ in replacements]
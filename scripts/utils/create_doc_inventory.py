@@ -8,43 +8,93 @@ Scan all repositories and create a complete inventory of:
 - All configuration files (*.yaml, *.json)
 - Identify temporary/test files
 - Flag inconsistencies in naming
+
+The tree is walked once with os.scandir. Directories matching the prune
+rules (VCS metadata, virtualenvs, node_modules, model directories, build
+output) are never entered, and files are dispatched to their inventory
+section by extension. Stat calls and file reads are gathered on a thread
+pool (--jobs).
+
+The inventory is kept in a SQLite database (InventoryDB) keyed by path.
+A re-scan re-reads only files whose size or mtime changed, records what
+was added, removed and modified since the previous scan, and the report
+and JSON are rendered from the database.
 """
 
 import os
-import glob
+import argparse
+import fnmatch
+import hashlib
 import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
 import re
 
+# Inventory section of each scanned extension
+EXTENSION_SECTIONS = {
+    '.md': 'markdown_files',
+    '.py': 'scripts',
+    '.sh': 'scripts',
+    '.yaml': 'config_files',
+    '.yml': 'config_files',
+    '.json': 'config_files'
+}
+
+# Directory names (fnmatch patterns) that are never entered. Hidden
+# directories and virtualenvs (any directory containing pyvenv.cfg) are
+# pruned as well.
+DEFAULT_PRUNE = [
+    'node_modules', '__pycache__', 'site-packages', 'venv', 'env',
+    'models', 'build', 'dist', '*.egg-info'
+]
+
+# Bytes read from the start of a file for its preview
+PREVIEW_BYTES = 4096
+PREVIEW_LINES = 5
+
 def get_file_info(filepath):
-    """Get file information including size, modification time, and basic content analysis."""
+    """Get file information including size, modification time, content hash
+    and a preview of the first lines, reading the file once."""
     try:
         stat = os.stat(filepath)
         size = stat.st_size
-        mtime = datetime.fromtimestamp(stat.st_mtime)
         
-        # Try to read first few lines for content analysis
+        # Hash the whole file; the preview comes from its first block
         content_preview = ""
+        digest = hashlib.sha1()
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()[:5]
-                content_preview = ''.join(lines).strip()
-        except:
+            with open(filepath, 'rb') as f:
+                head = f.read(PREVIEW_BYTES)
+                digest.update(head)
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+            lines = head.decode('utf-8', errors='ignore').splitlines(keepends=True)[:PREVIEW_LINES]
+            content_preview = ''.join(lines).strip()
+        except OSError:
             content_preview = "Binary or unreadable file"
             
         return {
             'size': size,
-            'modified': mtime.strftime('%Y-%m-%d %H:%M:%S'),
+            'mtime_ns': stat.st_mtime_ns,
+            'modified': _format_mtime(stat.st_mtime_ns),
+            'hash': digest.hexdigest(),
             'preview': content_preview[:200] + "..." if len(content_preview) > 200 else content_preview
         }
     except Exception as e:
         return {
             'size': 0,
+            'mtime_ns': 0,
             'modified': 'Unknown',
+            'hash': '',
             'preview': f'Error reading file: {e}'
         }
 
+def _format_mtime(mtime_ns):
+    if not mtime_ns:
+        return 'Unknown'
+    return datetime.fromtimestamp(mtime_ns // 1_000_000_000).strftime('%Y-%m-%d %H:%M:%S')
+
 def is_temporary_file(filepath):
     """Identify if a file appears to be temporary or test-related."""
     temp_patterns = [
@@ -67,106 +117,244 @@ def is_temporary_file(filepath):
     filename = os.path.basename(filepath).lower()
     return any(re.search(pattern, filename) for pattern in temp_patterns)
 
-def analyze_naming_consistency(filepaths):
-    """Analyze naming patterns and flag inconsistencies."""
+def file_naming_issues(filepath):
+    """Naming inconsistencies of a single file."""
     issues = []
+    filename = os.path.basename(filepath)
     
-    for filepath in filepaths:
-        filename = os.path.basename(filepath)
-        
-        # Check for mixed case in markdown files
-        if filepath.endswith('.md'):
-            if re.search(r'[A-Z]', filename.replace('.md', '')):
-                issues.append(f"Mixed case in markdown: {filepath}")
+    # Check for mixed case in markdown files
+    if filepath.endswith('.md'):
+        if re.search(r'[A-Z]', filename.replace('.md', '')):
+            issues.append(f"Mixed case in markdown: {filepath}")
+    
+    # Check for spaces in filenames
+    if ' ' in filename:
+        issues.append(f"Spaces in filename: {filepath}")
         
-        # Check for spaces in filenames
-        if ' ' in filename:
-            issues.append(f"Spaces in filename: {filepath}")
-            
-        # Check for inconsistent separators
-        if '_' in filename and '-' in filename:
-            issues.append(f"Mixed separators: {filepath}")
+    # Check for inconsistent separators
+    if '_' in filename and '-' in filename:
+        issues.append(f"Mixed separators: {filepath}")
     
     return issues
 
-def scan_directory(base_path):
-    """Scan directory for all relevant files."""
-    inventory = {
-        'scan_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'base_path': str(base_path),
-        'markdown_files': [],
-        'scripts': [],
-        'config_files': [],
-        'temporary_files': [],
-        'naming_issues': [],
-        'summary': {}
-    }
-    
-    # File patterns to scan
-    patterns = {
-        'markdown': '**/*.md',
-        'python': '**/*.py',
-        'shell': '**/*.sh',
-        'yaml': '**/*.yaml',
-        'yml': '**/*.yml',
-        'json': '**/*.json'
-    }
-    
-    all_files = []
+def analyze_naming_consistency(filepaths):
+    """Analyze naming patterns and flag inconsistencies."""
+    return [issue for filepath in filepaths for issue in file_naming_issues(filepath)]
+
+def is_pruned(name, prune):
+    """True if a directory called ``name`` matches a prune pattern."""
+    return name.startswith('.') or any(fnmatch.fnmatch(name, pattern) for pattern in prune)
+
+def walk_files(base_path, prune=DEFAULT_PRUNE):
+    """Yield (path, section) for every inventoried file, in one scandir walk."""
+    stack = [str(base_path)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        # A virtualenv can have any name; its pyvenv.cfg gives it away
+        if directory != str(base_path) and any(entry.name == 'pyvenv.cfg' for entry in entries):
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not is_pruned(entry.name, prune):
+                        subdirs.append(entry.path)
+                    continue
+                section = EXTENSION_SECTIONS.get(os.path.splitext(entry.name)[1])
+                if section and entry.is_file():
+                    yield entry.path, section
+            except OSError:
+                continue
+        stack.extend(sorted(subdirs, reverse=True))
+
+class InventoryDB:
+    """Inventory persisted in SQLite, one row per file keyed by relative path."""
+    VERSION = 1
+    SECTIONS = ('markdown_files', 'scripts', 'config_files')
     
-    for pattern_name, pattern in patterns.items():
-        files = list(Path(base_path).glob(pattern))
-        all_files.extend([str(f) for f in files])
+    def __init__(self, db_path, base_path):
+        self.db_path = str(db_path)
+        self.base_path = str(base_path)
+        self.db = sqlite3.connect(self.db_path)
+        self._ensure_schema()
         
-        for filepath in files:
-            filepath_str = str(filepath)
-            file_info = get_file_info(filepath_str)
+    def _ensure_schema(self):
+        """Create the tables, discarding an inventory from another version or tree."""
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        if meta.get('version') != str(self.VERSION) or meta.get('base_path') != self.base_path:
+            with self.db:
+                self.db.execute("DROP TABLE IF EXISTS files")
+                self.db.execute("DELETE FROM meta")
+                self.db.executemany("INSERT INTO meta VALUES (?, ?)",
+                                    [('version', str(self.VERSION)),
+                                     ('base_path', self.base_path)])
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS files "
+                            "(path TEXT PRIMARY KEY, section TEXT, size INTEGER, mtime INTEGER, "
+                            "hash TEXT, preview TEXT, is_temporary INTEGER, naming_issues TEXT)")
             
-            file_data = {
-                'path': filepath_str,
-                'relative_path': os.path.relpath(filepath_str, base_path),
-                'name': filepath.name,
-                'size': file_info['size'],
-                'modified': file_info['modified'],
-                'preview': file_info['preview'],
-                'is_temporary': is_temporary_file(filepath_str)
-            }
+    def close(self):
+        self.db.close()
+        
+    def meta(self, key, default=None):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+        
+    # -- scanning ----------------------------------------------------------
+    
+    def update(self, found, jobs=1):
+        """Bring the inventory up to date with ``found`` (path, section) pairs.
+        
+        Files whose (size, mtime) match the stored row are not read. A
+        changed file counts as modified only if its content hash changed.
+        Returns the delta {'added', 'removed', 'modified'} of relative paths,
+        which is also stored for the report.
+        """
+        known = {path: (size, mtime, digest) for path, size, mtime, digest
+                 in self.db.execute("SELECT path, size, mtime, hash FROM files")}
+        relative = [os.path.relpath(filepath, self.base_path) for filepath, _ in found]
+        
+        def probe(item):
+            """File info for a new or changed file, None for an unchanged one."""
+            filepath, rel = item
+            entry = known.get(rel)
+            if entry is not None:
+                try:
+                    st = os.stat(filepath)
+                except OSError:
+                    st = None
+                if st is not None and (st.st_size, st.st_mtime_ns) == entry[:2]:
+                    return None
+            return get_file_info(filepath)
+        
+        items = [(filepath, rel) for (filepath, _), rel in zip(found, relative)]
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        if jobs <= 1:
+            infos = [probe(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                infos = list(pool.map(probe, items))
+        
+        delta = {'added': [], 'removed': [], 'modified': []}
+        with self.db:
+            for (filepath, section), rel, info in zip(found, relative, infos):
+                if info is None:
+                    continue
+                entry = known.get(rel)
+                if entry is None:
+                    delta['added'].append(rel)
+                elif entry[2] != info['hash']:
+                    delta['modified'].append(rel)
+                self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                (rel, section, info['size'], info['mtime_ns'], info['hash'],
+                                 info['preview'], int(is_temporary_file(filepath)),
+                                 json.dumps(file_naming_issues(filepath))))
             
-            if pattern_name == 'markdown':
-                inventory['markdown_files'].append(file_data)
-            elif pattern_name in ['python', 'shell']:
-                inventory['scripts'].append(file_data)
-            elif pattern_name in ['yaml', 'yml', 'json']:
-                inventory['config_files'].append(file_data)
+            for rel in sorted(set(known) - set(relative)):
+                self.db.execute("DELETE FROM files WHERE path = ?", (rel,))
+                delta['removed'].append(rel)
             
-            if file_data['is_temporary']:
-                inventory['temporary_files'].append(file_data)
-    
-    # Analyze naming consistency
-    inventory['naming_issues'] = analyze_naming_consistency(all_files)
+            repositories = len([d for d in os.listdir(self.base_path)
+                                if os.path.isdir(os.path.join(self.base_path, d)) and d.startswith('a2-')])
+            self.db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                                [('scan_date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                                 ('repositories_scanned', str(repositories)),
+                                 ('delta', json.dumps(delta))])
+        return delta
+        
+    # -- querying ----------------------------------------------------------
     
-    # Generate summary
-    inventory['summary'] = {
-        'total_markdown': len(inventory['markdown_files']),
-        'total_scripts': len(inventory['scripts']),
-        'total_configs': len(inventory['config_files']),
-        'total_temporary': len(inventory['temporary_files']),
-        'naming_issues_count': len(inventory['naming_issues']),
-        'repositories_scanned': len([d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d)) and d.startswith('a2-')])
-    }
+    def files(self, section=None, temporary=None):
+        """File entries ordered by relative path, optionally filtered."""
+        query = "SELECT path, section, size, mtime, preview, is_temporary FROM files"
+        conditions, params = [], []
+        if section is not None:
+            conditions.append("section = ?")
+            params.append(section)
+        if temporary is not None:
+            conditions.append("is_temporary = ?")
+            params.append(int(temporary))
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY path"
+        return [{'path': os.path.join(self.base_path, rel),
+                 'relative_path': rel,
+                 'name': os.path.basename(rel),
+                 'size': size,
+                 'modified': _format_mtime(mtime),
+                 'preview': preview,
+                 'is_temporary': bool(is_temporary)}
+                for rel, section, size, mtime, preview, is_temporary
+                in self.db.execute(query, params)]
+        
+    def naming_issues(self):
+        return [issue for (issues,) in self.db.execute("SELECT naming_issues FROM files ORDER BY path")
+                for issue in json.loads(issues)]
+        
+    def delta(self):
+        return json.loads(self.meta('delta', '{"added": [], "removed": [], "modified": []}'))
+        
+    def summary(self):
+        counts = dict(self.db.execute("SELECT section, COUNT(*) FROM files GROUP BY section"))
+        (temporary,) = self.db.execute("SELECT COUNT(*) FROM files WHERE is_temporary").fetchone()
+        return {
+            'total_markdown': counts.get('markdown_files', 0),
+            'total_scripts': counts.get('scripts', 0),
+            'total_configs': counts.get('config_files', 0),
+            'total_temporary': temporary,
+            'naming_issues_count': len(self.naming_issues()),
+            'repositories_scanned': int(self.meta('repositories_scanned', 0))
+        }
+        
+    def inventory(self):
+        """The inventory as the dict scan_directory has always returned."""
+        inventory = {
+            'scan_date': self.meta('scan_date'),
+            'base_path': self.base_path
+        }
+        for section in self.SECTIONS:
+            inventory[section] = self.files(section)
+        inventory['temporary_files'] = self.files(temporary=True)
+        inventory['naming_issues'] = self.naming_issues()
+        inventory['summary'] = self.summary()
+        inventory['delta'] = self.delta()
+        return inventory
+
+def scan_directory(base_path, prune=DEFAULT_PRUNE, jobs=1, db=None, exclude=()):
+    """Scan directory for all relevant files.
     
-    return inventory
+    Updates ``db`` (an InventoryDB; an in-memory one when omitted) and
+    returns the inventory dict. ``jobs`` threads gather file stats and
+    reads (0 = one per CPU); files in ``exclude`` (e.g. the generated
+    report) are left out.
+    """
+    if db is None:
+        db = InventoryDB(':memory:', base_path)
+    exclude = {os.path.abspath(path) for path in exclude}
+    found = sorted((filepath, section) for filepath, section in walk_files(base_path, prune)
+                   if os.path.abspath(filepath) not in exclude)
+    db.update(found, jobs=jobs)
+    return db.inventory()
 
-def generate_report(inventory, output_file):
-    """Generate a human-readable report."""
+def generate_report(db, output_file):
+    """Generate a human-readable report from an InventoryDB."""
     with open(output_file, 'w') as f:
         f.write("# A2 Robot Project - Documentation Inventory Report\n\n")
-        f.write(f"**Generated:** {inventory['scan_date']}  \n")
-        f.write(f"**Base Path:** {inventory['base_path']}  \n\n")
+        f.write(f"**Generated:** {db.meta('scan_date')}  \n")
+        f.write(f"**Base Path:** {db.base_path}  \n\n")
         
         # Summary
         f.write("## Summary\n\n")
-        summary = inventory['summary']
+        summary = db.summary()
         f.write(f"- **Markdown Files:** {summary['total_markdown']}\n")
         f.write(f"- **Scripts:** {summary['total_scripts']}\n")
         f.write(f"- **Config Files:** {summary['total_configs']}\n")
@@ -174,12 +362,23 @@ def generate_report(inventory, output_file):
         f.write(f"- **Naming Issues:** {summary['naming_issues_count']}\n")
         f.write(f"- **Repositories Scanned:** {summary['repositories_scanned']}\n\n")
         
+        # Changes since the previous scan
+        delta = db.delta()
+        f.write("## Changes Since Last Scan\n\n")
+        f.write(f"- **Added:** {len(delta['added'])}\n")
+        f.write(f"- **Removed:** {len(delta['removed'])}\n")
+        f.write(f"- **Modified:** {len(delta['modified'])}\n")
+        for kind, label in (('added', '➕'), ('removed', '➖'), ('modified', '✏️')):
+            for path in delta[kind]:
+                f.write(f"  - {label} `{path}`\n")
+        f.write("\n")
+        
         # Markdown Files
         f.write("## Markdown Documentation Files\n\n")
         f.write("| File | Size | Last Modified | Status |\n")
         f.write("|------|------|---------------|--------|\n")
         
-        for doc in sorted(inventory['markdown_files'], key=lambda x: x['relative_path']):
+        for doc in db.files('markdown_files'):
             status = "🔴 TEMP" if doc['is_temporary'] else "✅ OK"
             f.write(f"| `{doc['relative_path']}` | {doc['size']} bytes | {doc['modified']} | {status} |\n")
         
@@ -188,7 +387,7 @@ def generate_report(inventory, output_file):
         f.write("| Script | Size | Last Modified | Purpose | Status |\n")
         f.write("|--------|------|---------------|---------|--------|\n")
         
-        for script in sorted(inventory['scripts'], key=lambda x: x['relative_path']):
+        for script in db.files('scripts'):
             # Try to extract purpose from first line or filename
             purpose = "Unknown"
             if script['preview']:
@@ -206,20 +405,22 @@ def generate_report(inventory, output_file):
         f.write("| Config | Size | Last Modified | Status |\n")
         f.write("|--------|------|---------------|--------|\n")
         
-        for config in sorted(inventory['config_files'], key=lambda x: x['relative_path']):
+        for config in db.files('config_files'):
             status = "🔴 TEMP" if config['is_temporary'] else "✅ OK"
             f.write(f"| `{config['relative_path']}` | {config['size']} bytes | {config['modified']} | {status} |\n")
         
         # Temporary Files
-        if inventory['temporary_files']:
+        temporary_files = db.files(temporary=True)
+        if temporary_files:
             f.write("\n## 🔴 Temporary Files (Need Review)\n\n")
-            for temp_file in sorted(inventory['temporary_files'], key=lambda x: x['relative_path']):
+            for temp_file in temporary_files:
                 f.write(f"- `{temp_file['relative_path']}` ({temp_file['size']} bytes, modified {temp_file['modified']})\n")
         
         # Naming Issues
-        if inventory['naming_issues']:
+        naming_issues = db.naming_issues()
+        if naming_issues:
             f.write("\n## 🔴 Naming Consistency Issues\n\n")
-            for issue in inventory['naming_issues']:
+            for issue in naming_issues:
                 f.write(f"- {issue}\n")
         
         f.write("\n---\n")
@@ -227,19 +428,37 @@ def generate_report(inventory, output_file):
 
 def main():
     """Main execution function."""
-    base_path = os.getcwd()
+    parser = argparse.ArgumentParser(description='Create an inventory of A2 Robot documentation, scripts and configs')
+    parser.add_argument('base_path', nargs='?', default=os.getcwd(),
+                        help='Directory to scan (default: current directory)')
+    parser.add_argument('--output-dir', help='Where to write the JSON and report (default: BASE_PATH/scripts)')
+    parser.add_argument('--prune', nargs='*', default=DEFAULT_PRUNE, metavar='PATTERN',
+                        help=f"Directory name patterns to skip (default: {' '.join(DEFAULT_PRUNE)}); "
+                             "hidden directories and virtualenvs are always skipped")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Threads gathering file stats and reads (default: 1, 0 = one per CPU)')
+    parser.add_argument('--db', help='Inventory database (default: OUTPUT_DIR/.doc_inventory.sqlite)')
+    args = parser.parse_args()
     
-    print("🔍 Scanning A2 Robot Project for documentation inventory...")
-    inventory = scan_directory(base_path)
+    base_path = os.path.abspath(args.base_path)
+    output_dir = args.output_dir or os.path.join(base_path, 'scripts')
     
-    # Save JSON data
-    json_output = os.path.join(base_path, 'scripts', 'doc_inventory.json')
-    with open(json_output, 'w') as f:
-        json.dump(inventory, f, indent=2)
-    
-    # Generate human-readable report
-    report_output = os.path.join(base_path, 'scripts', 'DOC_INVENTORY_REPORT.md')
-    generate_report(inventory, report_output)
+    print("🔍 Scanning A2 Robot Project for documentation inventory...")
+    json_output = os.path.join(output_dir, 'doc_inventory.json')
+    report_output = os.path.join(output_dir, 'DOC_INVENTORY_REPORT.md')
+    db = InventoryDB(args.db or os.path.join(output_dir, '.doc_inventory.sqlite'), base_path)
+    try:
+        inventory = scan_directory(base_path, prune=args.prune, jobs=args.jobs, db=db,
+                                   exclude=[json_output, report_output])
+        
+        # Save JSON data
+        with open(json_output, 'w') as f:
+            json.dump(inventory, f, indent=2)
+        
+        # Generate human-readable report
+        generate_report(db, report_output)
+    finally:
+        db.close()
     
     print(f"✅ Inventory complete!")
     print(f"📊 JSON data: {json_output}")
@@ -250,6 +469,9 @@ def main():
     print(f"   - {inventory['summary']['total_configs']} config files")
     print(f"   - {inventory['summary']['total_temporary']} temporary files")
     print(f"   - {inventory['summary']['naming_issues_count']} naming issues")
+    delta = inventory['delta']
+    print(f"\n🔄 Since last scan: {len(delta['added'])} added, {len(delta['removed'])} removed, "
+          f"{len(delta['modified'])} modified")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
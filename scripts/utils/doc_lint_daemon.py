@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Documentation Lint Daemon
+
+Long-running process that keeps LinkChecker and DocumentValidator state
+(parsed links, anchor index, suggestion indexes) in memory:
+- watch: watches the tree (inotify, or polling as a fallback) and prints
+  fresh diagnostics for every saved markdown file
+- lsp: serves the same diagnostics over a stdio Language Server Protocol
+  interface so editors get live results
+
+When a file's anchors change, the files linking to it are re-linted too.
+
+Usage:
+    python3 doc_lint_daemon.py watch a2-docs
+    python3 doc_lint_daemon.py lsp a2-docs
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import re
+import select
+import struct
+import sys
+import threading
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from check_links import LinkChecker, LinkGraph, find_markdown_files
+from doc_model import default_cache
+from validate_docs import DocumentValidator
+
+IGNORED_DIRS = ['node_modules', '__pycache__']
+VALIDATOR_LINE_RE = re.compile(r'^(\d+): ')
+
+
+class DocLintDaemon:
+    """In-memory lint state for one documentation tree."""
+
+    def __init__(self, directory, strict=False):
+        self.directory = directory
+        self.link_checker = LinkChecker(directory)
+        self.validator = DocumentValidator(strict=strict)
+        self.diagnostics: Dict[str, List[dict]] = {}
+
+    def lint_all(self) -> Dict[str, List[dict]]:
+        """Lint every markdown file, building the in-memory model."""
+        for filepath in find_markdown_files(self.directory):
+            self.lint(filepath)
+        return self.diagnostics
+
+    def lint(self, filepath, content=None) -> List[dict]:
+        """Lint one file (or an unsaved buffer for it) and return diagnostics."""
+        filepath = os.path.abspath(filepath)
+        checker = self.link_checker
+        checker.broken_links = []
+        checker.warnings = []
+        checker.check_file(filepath, content=content)
+
+        validator = self.validator
+        validator.errors = []
+        validator.warnings = []
+        validator.validate_file(filepath, content=content)
+
+        diagnostics = []
+        for link in checker.broken_links:
+            diagnostics.append(self._diagnostic(link['line'], 'error', 'check_links',
+                                                f"{link['error']} ({link.get('link', '')})"))
+        for warning in checker.warnings:
+            diagnostics.append(self._diagnostic(warning['line'], 'warning', 'check_links',
+                                                f"{warning['warning']} ({warning['link']})"))
+        prefix = f"{os.path.relpath(filepath)}:"
+        for severity, messages in (('error', validator.errors), ('warning', validator.warnings)):
+            for message in messages:
+                diagnostics.append(self._validator_diagnostic(message, prefix, severity))
+
+        diagnostics.sort(key=lambda d: d['line'])
+        self.diagnostics[filepath] = diagnostics
+        return diagnostics
+
+    def on_change(self, filepath, content=None) -> Dict[str, List[dict]]:
+        """Re-lint a changed file plus the files whose links it can affect."""
+        filepath = os.path.abspath(filepath)
+        relative = os.path.relpath(filepath, self.link_checker.base_directory)
+        previous = self.link_checker.parsed_files.get(relative)
+        if previous is None:
+            # A new file can resolve links and suggestions anywhere in the tree
+            self.link_checker._path_trigrams = None
+
+        updated = {filepath: self.lint(filepath, content=content)}
+        current = self.link_checker.parsed_files.get(relative)
+        if previous is None or current is None or previous['anchors'] != current['anchors']:
+            updated.update(self._relint_dependents(relative))
+        return updated
+
+    def on_delete(self, filepath) -> Dict[str, List[dict]]:
+        """Forget a deleted file and re-lint the files linking to it."""
+        filepath = os.path.abspath(filepath)
+        checker = self.link_checker
+        relative = os.path.relpath(filepath, checker.base_directory)
+        checker.parsed_files.pop(relative, None)
+        checker.checked_files.discard(filepath)
+        checker._anchor_index.pop(filepath, None)
+        checker._path_trigrams = None
+        default_cache().invalidate(filepath)
+        self.diagnostics.pop(filepath, None)
+
+        updated = {filepath: []}
+        updated.update(self._relint_dependents(relative))
+        return updated
+
+    def _relint_dependents(self, relative) -> Dict[str, List[dict]]:
+        checker = self.link_checker
+        graph = LinkGraph.from_parsed(checker.parsed_files)
+        updated = {}
+        for source in sorted(graph.dependents({relative}) - {relative}):
+            source_path = os.path.join(checker.base_directory, source)
+            if os.path.isfile(source_path):
+                updated[source_path] = self.lint(source_path)
+        return updated
+
+    @staticmethod
+    def _diagnostic(line, severity, source, message) -> dict:
+        return {'line': max(int(line or 1), 1), 'severity': severity,
+                'source': source, 'message': message}
+
+    def _validator_diagnostic(self, message, prefix, severity) -> dict:
+        """Turn a DocumentValidator 'path:line: message' string into a diagnostic."""
+        text = message[len(prefix):].lstrip() if message.startswith(prefix) else message
+        line = 1
+        match = VALIDATOR_LINE_RE.match(text)
+        if match:
+            line = int(match.group(1))
+            text = text[match.end():]
+        return self._diagnostic(line, severity, 'validate_docs', text)
+
+
+class PollingWatcher:
+    """Fallback watcher that compares markdown mtimes every ``interval`` seconds."""
+
+    def __init__(self, directory, interval=0.25):
+        self.directory = directory
+        self.interval = interval
+        self._mtimes = self._snapshot()
+
+    def _snapshot(self) -> Dict[str, int]:
+        mtimes = {}
+        for filepath in find_markdown_files(self.directory):
+            try:
+                mtimes[os.path.abspath(filepath)] = os.stat(filepath).st_mtime_ns
+            except OSError:
+                pass
+        return mtimes
+
+    def events(self) -> Iterator[List[Tuple[str, str]]]:
+        """Yield batches of ('changed' | 'deleted', path) events."""
+        while True:
+            time.sleep(self.interval)
+            current = self._snapshot()
+            batch = [('changed', path) for path, mtime in current.items()
+                     if self._mtimes.get(path) != mtime]
+            batch += [('deleted', path) for path in self._mtimes if path not in current]
+            self._mtimes = current
+            if batch:
+                yield sorted(batch)
+
+
+class InotifyWatcher:
+    """Linux inotify watcher (via libc), recursing into new directories."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, directory):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs: Dict[int, str] = {}
+        self._add_tree(directory)
+
+    def _add_watch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {path}')
+        self._dirs[wd] = os.path.abspath(path)
+
+    def _add_tree(self, directory) -> List[str]:
+        """Watch a directory and its subdirectories; returns the markdown files in them."""
+        markdown = []
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in IGNORED_DIRS]
+            self._add_watch(root)
+            markdown.extend(os.path.join(os.path.abspath(root), name)
+                            for name in files if name.endswith('.md'))
+        return markdown
+
+    def _remove_tree(self, directory):
+        """Stop watching a directory that left the tree, and everything below it."""
+        directory = os.path.abspath(directory)
+        for wd, path in list(self._dirs.items()):
+            if path == directory or path.startswith(directory + os.sep):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._dirs[wd]
+
+    def events(self) -> Iterator[List[Tuple[str, str]]]:
+        """Yield batches of ('changed' | 'deleted', path) events."""
+        while True:
+            select.select([self._fd], [], [])
+            # Let the rest of an editor's save sequence arrive, then batch it
+            time.sleep(0.02)
+            data = os.read(self._fd, 65536)
+            batch = {}
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+                name = data[offset + self.EVENT.size:offset + self.EVENT.size + length]
+                offset += self.EVENT.size + length
+                name = os.fsdecode(name.rstrip(b'\0'))
+                path = os.path.join(self._dirs.get(wd, ''), name)
+                if mask & self.IN_ISDIR:
+                    if name.startswith('.') or name in IGNORED_DIRS:
+                        continue
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        # A directory moved (or copied) in may already hold files
+                        try:
+                            for filepath in self._add_tree(path):
+                                batch[filepath] = 'changed'
+                        except OSError:
+                            pass  # Gone again before it could be watched
+                    elif mask & self.IN_MOVED_FROM:
+                        self._remove_tree(path)
+                        batch[path] = 'deleted'
+                    continue
+                if not name.endswith('.md'):
+                    continue
+                if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    batch[path] = 'deleted'
+                elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                    batch[path] = 'changed'
+            if batch:
+                yield sorted((event, path) for path, event in batch.items())
+
+
+def make_watcher(directory, polling=False, interval=0.25):
+    """Return an inotify watcher where available, else a polling watcher."""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, interval)
+
+
+def apply_events(daemon, batch) -> Dict[str, List[dict]]:
+    """Feed a watcher batch to the daemon and return updated diagnostics."""
+    updated = {}
+    for event, path in batch:
+        if event == 'deleted' and not path.endswith('.md'):
+            # A directory moved out of the tree takes its files with it
+            prefix = os.path.abspath(path) + os.sep
+            for filepath in [f for f in daemon.diagnostics if f.startswith(prefix)]:
+                updated.update(daemon.on_delete(filepath))
+        elif event == 'deleted' or not os.path.exists(path):
+            updated.update(daemon.on_delete(path))
+        else:
+            updated.update(daemon.on_change(path))
+    return updated
+
+
+def print_diagnostics(updated, elapsed_ms):
+    """Console output for watch mode."""
+    for filepath, diagnostics in updated.items():
+        relative = os.path.relpath(filepath)
+        if not os.path.exists(filepath):
+            print(f"🗑️  {relative} (deleted)")
+            continue
+        if not diagnostics:
+            print(f"✅ {relative}")
+            continue
+        print(f"📄 {relative}")
+        for d in diagnostics:
+            mark = "🔴" if d['severity'] == 'error' else "🟡"
+            print(f"  {mark} {d['line']}: {d['message']} [{d['source']}]")
+    print(f"⏱️  {elapsed_ms:.1f} ms")
+    print()
+
+
+def run_watch(daemon, watcher):
+    start = time.perf_counter()
+    diagnostics = daemon.lint_all()
+    issues = sum(len(d) for d in diagnostics.values())
+    print(f"🔍 Loaded {len(diagnostics)} files ({issues} diagnostics) "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"👀 Watching {daemon.directory} ({type(watcher).__name__})...")
+    print()
+    for batch in watcher.events():
+        start = time.perf_counter()
+        updated = apply_events(daemon, batch)
+        print_diagnostics(updated, (time.perf_counter() - start) * 1000)
+        sys.stdout.flush()
+
+
+class LanguageServer:
+    """Minimal stdio LSP server publishing lint diagnostics."""
+
+    SEVERITY = {'error': 1, 'warning': 2}
+
+    def __init__(self, daemon, watcher=None, stdin=None, stdout=None):
+        self.daemon = daemon
+        self.watcher = watcher
+        self.stdin = stdin or sys.stdin.buffer
+        self.stdout = stdout or sys.stdout.buffer
+        self._write_lock = threading.Lock()
+        self._lint_lock = threading.Lock()
+        self._shutdown = False
+
+    def read_message(self) -> Optional[dict]:
+        length = None
+        while True:
+            line = self.stdin.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value.strip())
+        if length is None:
+            return None
+        return json.loads(self.stdin.read(length))
+
+    def send(self, payload):
+        body = json.dumps(payload).encode('utf-8')
+        with self._write_lock:
+            self.stdout.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+            self.stdout.flush()
+
+    def publish(self, updated):
+        for filepath, diagnostics in updated.items():
+            self.send({
+                'jsonrpc': '2.0',
+                'method': 'textDocument/publishDiagnostics',
+                'params': {
+                    'uri': Path(filepath).resolve().as_uri(),
+                    'diagnostics': [{
+                        'range': {'start': {'line': d['line'] - 1, 'character': 0},
+                                  'end': {'line': d['line'], 'character': 0}},
+                        'severity': self.SEVERITY[d['severity']],
+                        'source': d['source'],
+                        'message': d['message']
+                    } for d in diagnostics]
+                }
+            })
+
+    @staticmethod
+    def _path(uri) -> str:
+        return unquote(urlparse(uri).path)
+
+    def _watch(self):
+        for batch in self.watcher.events():
+            with self._lint_lock:
+                updated = apply_events(self.daemon, batch)
+            self.publish(updated)
+
+    def serve(self) -> int:
+        """Serve until 'exit'; returns 0 if a 'shutdown' request came first, else 1."""
+        with self._lint_lock:
+            self.daemon.lint_all()
+        if self.watcher is not None:
+            threading.Thread(target=self._watch, daemon=True).start()
+
+        while True:
+            message = self.read_message()
+            if message is None:
+                return 0 if self._shutdown else 1
+            method = message.get('method')
+            params = message.get('params') or {}
+
+            if self._shutdown and method != 'exit':
+                # After shutdown only 'exit' is valid
+                if 'id' in message:
+                    self.send({'jsonrpc': '2.0', 'id': message['id'],
+                               'error': {'code': -32600, 'message': 'Server is shutting down'}})
+                continue
+
+            if method == 'initialize':
+                self.send({'jsonrpc': '2.0', 'id': message['id'], 'result': {
+                    'capabilities': {
+                        'textDocumentSync': {'openClose': True, 'change': 1,
+                                             'save': {'includeText': False}}
+                    },
+                    'serverInfo': {'name': 'a2-doc-lint'}
+                }})
+            elif method == 'shutdown':
+                self._shutdown = True
+                self.send({'jsonrpc': '2.0', 'id': message['id'], 'result': None})
+            elif method == 'exit':
+                return 0 if self._shutdown else 1
+            elif method in ('textDocument/didOpen', 'textDocument/didChange', 'textDocument/didSave'):
+                document = params['textDocument']
+                path = self._path(document['uri'])
+                if not path.endswith('.md'):
+                    continue
+                content = None
+                if method == 'textDocument/didOpen':
+                    content = document.get('text')
+                elif method == 'textDocument/didChange':
+                    content = params['contentChanges'][-1]['text']
+                with self._lint_lock:
+                    if content is None:
+                        updated = self.daemon.on_change(path)
+                    else:
+                        updated = {os.path.abspath(path): self.daemon.lint(path, content=content)}
+                self.publish(updated)
+            elif 'id' in message:
+                self.send({'jsonrpc': '2.0', 'id': message['id'],
+                           'error': {'code': -32601, 'message': f"Method not found: {method}"}})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='A2 documentation lint daemon')
+    parser.add_argument('mode', choices=['watch', 'lsp'], help='Console watch mode or stdio LSP server')
+    parser.add_argument('directory', nargs='?', default='a2-docs',
+                       help='Directory to lint (default: a2-docs)')
+    parser.add_argument('--strict', action='store_true', help='Enable strict validation')
+    parser.add_argument('--poll', action='store_true', help='Use the polling watcher instead of inotify')
+    parser.add_argument('--interval', type=float, default=0.25,
+                       help='Polling interval in seconds (default: 0.25)')
+    parser.add_argument('--no-watch', action='store_true',
+                       help='LSP mode only: rely on editor notifications, do not watch the tree')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.directory):
+        print(f"❌ Directory '{args.directory}' not found", file=sys.stderr)
+        sys.exit(1)
+
+    daemon = DocLintDaemon(args.directory, strict=args.strict)
+    if args.mode == 'watch':
+        try:
+            run_watch(daemon, make_watcher(args.directory, args.poll, args.interval))
+        except KeyboardInterrupt:
+            print("\n👋 Stopped")
+    else:
+        watcher = None if args.no_watch else make_watcher(args.directory, args.poll, args.interval)
+        sys.exit(LanguageServer(daemon, watcher).serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Shared Document Model
+
+One parsed view of a markdown file for all scripts/utils doc tools:
+- text, lines and line start offsets
+- YAML front matter and old-style ``> **Document Status:**`` metadata
+- headers, code fences and links (from markdown_tokens)
+
+Documents are cached by path and validated against (mtime, size), so a
+combined run (``docs_tool.py all``) reads each file exactly once and a
+file rewritten by a fixer is transparently re-read. Parsed parts are
+computed lazily on first use.
+
+Files of LARGE_FILE_THRESHOLD bytes or more are memory-mapped instead
+(MappedDocument): a line-offset index is built once, and lines, line
+ranges and header sections are decoded on demand, so tools that stream
+lines never hold the whole file as a list of strings.
+"""
+
+import codecs
+import io
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_right
+from functools import cached_property
+from itertools import accumulate, islice
+from typing import Dict, Iterator, List, Optional
+
+from markdown_tokens import tokenize, HEADER, LINK, REF_LINK, REF_DEF, FENCE_OPEN, FENCE_CLOSE
+
+METADATA_FIELD_RE = re.compile(r'^>\s*\*\*([^*]+?):\*\*\s*(.*?)\s*$')
+# Old-style metadata must appear near the top of the document
+METADATA_LINES = 20
+# Files at least this large are memory-mapped rather than read into memory
+LARGE_FILE_THRESHOLD = 256 * 1024
+# Lines decoded per batch when streaming a mapped document
+LINE_BATCH = 1024
+# Bytes scanned per step while building a mapped document's line index
+INDEX_CHUNK = 1 << 20
+
+
+class Document:
+    """Parsed markdown document. Construct through DocumentCache.get()."""
+
+    def __init__(self, path: str, text: str, mtime_ns: int = 0, size: int = 0):
+        self.path = path
+        self.text = text
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Lines as produced by ``text.split('\\n')``."""
+        return self.text.split('\n')
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Character offset at which each line starts."""
+        offsets = [0]
+        for line in self.lines[:-1]:
+            offsets.append(offsets[-1] + len(line) + 1)
+        return offsets
+
+    def line_at(self, offset: int) -> int:
+        """1-based line number containing a character offset."""
+        return bisect_right(self.line_offsets, offset)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    def line(self, number: int) -> str:
+        """Line ``number`` (1-based), without its newline."""
+        return self.lines[number - 1]
+
+    def iter_lines(self, start: int = 1, end: Optional[int] = None) -> Iterator[str]:
+        """Lines ``start`` through ``end`` (1-based, inclusive), without newlines."""
+        return islice(self.lines, start - 1, end)
+
+    def contains(self, needle: str, ignore_case: bool = False) -> bool:
+        """Substring test over the whole document."""
+        if ignore_case:
+            return needle.lower() in self._lowered_text
+        return needle in self.text
+
+    @cached_property
+    def _lowered_text(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self) -> list:
+        """All markdown tokens, from a single tokenizer pass."""
+        return list(tokenize(self.text))
+
+    @cached_property
+    def headers(self) -> List[dict]:
+        """Headers outside code fences: {'level', 'text', 'line'}."""
+        return [{'level': t.level, 'text': t.text, 'line': t.line}
+                for t in self.tokens if t.kind == HEADER]
+
+    @cached_property
+    def sections(self) -> List[dict]:
+        """Headers with the line range of their section: {'level', 'text',
+        'line', 'end'}. A section ends before the next header of the same
+        or a higher level, or at the end of the document."""
+        sections = [dict(header, end=self.line_count) for header in self.headers]
+        open_sections = []
+        for section in sections:
+            while open_sections and open_sections[-1]['level'] >= section['level']:
+                open_sections.pop()['end'] = section['line'] - 1
+            open_sections.append(section)
+        return sections
+
+    def section_text(self, section: dict) -> str:
+        """Text of a section from ``sections``, header line included."""
+        return '\n'.join(self.iter_lines(section['line'], section['end']))
+
+    @cached_property
+    def fences(self) -> List[dict]:
+        """Code fences: {'start', 'end', 'info'} (end is None if unclosed)."""
+        fences = []
+        for token in self.tokens:
+            if token.kind == FENCE_OPEN:
+                fences.append({'start': token.line, 'end': None, 'info': token.text})
+            elif token.kind == FENCE_CLOSE and fences:
+                fences[-1]['end'] = token.line
+        return fences
+
+    @cached_property
+    def links(self) -> list:
+        """Inline links, reference links and reference definitions."""
+        return [t for t in self.tokens if t.kind in (LINK, REF_LINK, REF_DEF)]
+
+    @cached_property
+    def front_matter(self) -> Optional[dict]:
+        """YAML front matter: {'start', 'end', 'text'} with 0-based line
+        indexes of the opening and closing ``---``, or None."""
+        lines = self.iter_lines()
+        if next(lines, '').strip() != '---':
+            return None
+        body = []
+        for i, line in enumerate(lines, 1):
+            if line.strip() == '---':
+                return {'start': 0, 'end': i, 'text': '\n'.join(body)}
+            body.append(line)
+        return None
+
+    @cached_property
+    def metadata(self) -> Dict[str, str]:
+        """Old-style ``> **Field:** value`` metadata from the top of the file."""
+        fields = {}
+        for line in self.iter_lines(1, METADATA_LINES):
+            match = METADATA_FIELD_RE.match(line.strip())
+            if match:
+                fields.setdefault(match.group(1), match.group(2))
+        return fields
+
+    @cached_property
+    def metadata_line(self) -> Optional[int]:
+        """0-based index of the ``> **Document Status:**`` line, or None."""
+        for i, line in enumerate(self.iter_lines(1, METADATA_LINES)):
+            if line.strip().startswith('> **Document Status:**'):
+                return i
+        return None
+
+
+class MappedDocument(Document):
+    """Memory-mapped document with a byte-offset line index.
+
+    Lines are decoded from the map on demand; ``text`` and ``lines`` are
+    still available but materialize the whole file, so prefer
+    ``iter_lines``, ``line``, ``contains`` and ``sections``. Line breaks
+    are normalized like text-mode reads (``\\r\\n`` -> ``\\n``).
+
+    A file must not be truncated in place while a mapped document of it is
+    still being read; replace it (temp file + ``os.replace``) instead.
+    """
+
+    def __init__(self, path: str, filename: str):
+        with open(filename, 'rb') as f:
+            st = os.fstat(f.fileno())
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # ``text`` is a lazy property here, so Document.__init__ is not used
+        self.path = path
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self._filename = filename
+        self._check_encoding()
+
+    def _check_encoding(self):
+        """Fail on invalid UTF-8 up front, as a text-mode read would."""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for start in range(0, self.size, 1 << 20):
+            decoder.decode(self._map[start:start + (1 << 20)])
+        decoder.decode(b'', final=True)
+
+    # Pickled copies (e.g. sent to worker processes) re-map the file
+    def __getstate__(self):
+        return {'path': self.path, '_filename': self._filename}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['_filename'])
+
+    @cached_property
+    def text(self) -> str:
+        return self._map[:].decode('utf-8').replace('\r\n', '\n')
+
+    @cached_property
+    def _byte_offsets(self) -> array:
+        """Byte offset of the start of every line, plus the end of the file."""
+        offsets = array('q', [0])
+        carry = 0
+        for start in range(0, self.size, INDEX_CHUNK):
+            lengths = list(map(len, self._map[start:start + INDEX_CHUNK].split(b'\n')))
+            lengths[0] += carry
+            carry = lengths.pop()  # Line continuing into the next chunk
+            # Each line starts len(previous line) + 1 bytes after the last
+            offsets.extend(islice(accumulate(map((1).__add__, lengths), initial=offsets[-1]), 1, None))
+        offsets.append(self.size + 1)
+        return offsets
+
+    @property
+    def line_count(self) -> int:
+        return len(self._byte_offsets) - 1
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return list(self.iter_lines())
+
+    def _decode_line(self, index: int) -> str:
+        raw = self._map[self._byte_offsets[index]:self._byte_offsets[index + 1] - 1]
+        if raw.endswith(b'\r'):
+            raw = raw[:-1]
+        return raw.decode('utf-8')
+
+    def line(self, number: int) -> str:
+        if not 1 <= number <= self.line_count:
+            raise IndexError(f"line {number} out of range")
+        return self._decode_line(number - 1)
+
+    def iter_lines(self, start: int = 1, end: Optional[int] = None) -> Iterator[str]:
+        for chunk in self._decoded_batches(start, end):
+            yield from chunk.split('\n')
+
+    def _decoded_batches(self, start: int = 1, end: Optional[int] = None) -> Iterator[str]:
+        """Decode lines in batches: far cheaper than one decode per line,
+        while only ever holding one batch in memory. Batches are joined by
+        newlines (not terminated by one)."""
+        offsets = self._byte_offsets
+        stop = self.line_count if end is None else min(end, self.line_count)
+        for first in range(max(start, 1) - 1, stop, LINE_BATCH):
+            last = min(first + LINE_BATCH, stop)
+            chunk = self._map[offsets[first]:offsets[last] - 1].decode('utf-8')
+            yield chunk.replace('\r\n', '\n')
+
+    def contains(self, needle: str, ignore_case: bool = False) -> bool:
+        encoded = needle.encode('utf-8')
+        if ignore_case:
+            # ASCII case folding, which covers the section names checked
+            return re.search(re.escape(encoded), self._map, re.IGNORECASE) is not None
+        return self._map.find(encoded) != -1
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        offsets = [0]
+        for line in self.iter_lines(1, self.line_count - 1):
+            offsets.append(offsets[-1] + len(line) + 1)
+        return offsets
+
+    @cached_property
+    def tokens(self) -> list:
+        # Newline-terminated lines, as the tokenizer counts offsets from them
+        return list(tokenize(line for chunk in self._decoded_batches()
+                             for line in io.StringIO(chunk + '\n')))
+
+
+class DocumentCache:
+    """Path -> Document cache validated by (mtime, size)."""
+
+    def __init__(self, mapped_threshold: Optional[int] = LARGE_FILE_THRESHOLD):
+        self.mapped_threshold = mapped_threshold
+        self._documents: Dict[str, Document] = {}
+        self.reads = 0
+        self.hits = 0
+        self.bytes_read = 0
+
+    def get(self, path) -> Document:
+        """Return the parsed document, reading the file only if it changed."""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        document = self._documents.get(key)
+        if document is not None and document.mtime_ns == st.st_mtime_ns and document.size == st.st_size:
+            self.hits += 1
+            return document
+
+        if self.mapped_threshold is not None and st.st_size >= self.mapped_threshold:
+            document = MappedDocument(str(path), key)
+        else:
+            with open(key, 'r', encoding='utf-8') as f:
+                text = f.read()
+            document = Document(str(path), text, st.st_mtime_ns, st.st_size)
+        self.reads += 1
+        self.bytes_read += st.st_size
+        self._documents[key] = document
+        return document
+
+    def invalidate(self, path=None):
+        """Drop one cached document, or all of them."""
+        if path is None:
+            self._documents.clear()
+        else:
+            self._documents.pop(os.path.abspath(path), None)
+
+
+# Process-wide cache shared by every tool imported into the same run
+_default_cache = DocumentCache()
+
+
+def get_document(path) -> Document:
+    """Load a document through the shared process-wide cache."""
+    return _default_cache.get(path)
+
+
+def default_cache() -> DocumentCache:
+    return _default_cache
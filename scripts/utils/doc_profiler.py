@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Documentation Tool Profiler
+
+Lightweight timing for the documentation validators (``--profile``):
+- Wall time and call count per rule/check
+- Wall time per file and the slowest N files
+- Files and bytes read
+
+Reports print to the console or save as JSON with sorted keys, so two
+runs can be compared with a plain diff.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class Profiler:
+    def __init__(self):
+        self.rules: Dict[str, list] = {}   # name -> [calls, seconds]
+        self.files: Dict[str, float] = {}  # path -> seconds
+        self.files_read = 0
+        self.bytes_read = 0
+        self._start = time.perf_counter()
+
+    def add_rule(self, name: str, seconds: float, calls: int = 1):
+        """Record ``calls`` invocations of a rule taking ``seconds`` in total."""
+        stats = self.rules.setdefault(name, [0, 0.0])
+        stats[0] += calls
+        stats[1] += seconds
+
+    @contextmanager
+    def rule(self, name: str):
+        """Time one invocation of a rule."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_rule(name, time.perf_counter() - start)
+
+    @contextmanager
+    def file(self, path: str):
+        """Time work on a file; repeated visits accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.files[path] = self.files.get(path, 0.0) + time.perf_counter() - start
+
+    def add_read(self, size: int):
+        """Record one file read of ``size`` bytes."""
+        self.files_read += 1
+        self.bytes_read += size
+
+    def report(self, top: int = 10) -> dict:
+        """Return the profile as a JSON-serializable dict."""
+        slowest = sorted(self.files.items(), key=lambda item: (-item[1], item[0]))[:top]
+        return {
+            'total_seconds': round(time.perf_counter() - self._start, 6),
+            'files_profiled': len(self.files),
+            'files_read': self.files_read,
+            'bytes_read': self.bytes_read,
+            'rules': {name: {'calls': calls, 'seconds': round(seconds, 6)}
+                      for name, (calls, seconds) in sorted(self.rules.items())},
+            'slowest_files': [{'file': path, 'seconds': round(seconds, 6)}
+                              for path, seconds in slowest]
+        }
+
+    def print_report(self, top: int = 10):
+        """Print the profile to the console."""
+        report = self.report(top)
+        print("⏱️  PROFILE:")
+        print(f"  Total: {report['total_seconds'] * 1000:.1f} ms, "
+              f"{report['files_profiled']} files, "
+              f"{report['files_read']} reads ({report['bytes_read']:,} bytes)")
+        print()
+        print(f"  {'Rule':<32} {'Calls':>8} {'Total ms':>10} {'µs/call':>9}")
+        for name, stats in sorted(report['rules'].items(), key=lambda item: -item[1]['seconds']):
+            per_call = stats['seconds'] / stats['calls'] * 1e6 if stats['calls'] else 0.0
+            print(f"  {name:<32} {stats['calls']:>8} {stats['seconds'] * 1000:>10.2f} {per_call:>9.1f}")
+        if report['slowest_files']:
+            print()
+            print(f"  Slowest {len(report['slowest_files'])} files:")
+            for entry in report['slowest_files']:
+                print(f"    {entry['seconds'] * 1000:>8.2f} ms  {entry['file']}")
+        print()
+
+    def save(self, path: str, top: int = 10):
+        """Write the profile as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.report(top), f, indent=2, sort_keys=True)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Documentation Tool
+
+Single entry point for the scripts/utils documentation tools. All
+subcommands share one document cache (doc_model), so a combined run
+reads and parses each markdown file exactly once.
+
+Usage:
+    python3 scripts/utils/docs_tool.py all [directory] [--strict] [--output FILE]
+    python3 scripts/utils/docs_tool.py extract <path>
+    python3 scripts/utils/docs_tool.py section <anchor> [--file PATH]
+    python3 scripts/utils/docs_tool.py regenerate [--source-root DIR] [--dry-run]
+    python3 scripts/utils/docs_tool.py search "teensy crc" [--directory DIR] [--limit N]
+    python3 scripts/utils/docs_tool.py fix [directory] [--fixers SET ...] [--dry-run] [--diff] [--jobs N]
+
+extract/section/regenerate work on a2-complete-documentation.md (see
+combined_index.py); use --combined to point at another combined file.
+search keeps its index (search_index.py) in DIR/.docs_search_index.sqlite
+and refreshes it for changed files before every query.
+fix chains the fixer sets of the fix_*.py scripts into one streaming pass
+per file (see fix_engine.py).
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+
+from doc_model import default_cache
+from validate_docs import DocumentValidator, find_markdown_files
+from check_links import LinkChecker
+from combined_index import CombinedDocIndex
+from search_index import SearchIndex
+from fix_engine import FixPipeline, write_change_log
+import fix_formatting
+import fix_code_blocks
+import fix_remaining_warnings
+import fix_advanced_formatting
+
+# Fixer sets for 'fix', in the order they are chained. fix_formatting adds
+# '> **Document Status:**' metadata and fix_advanced_formatting YAML front
+# matter, so 'advanced' is opt-in.
+FIXER_SETS = {
+    'formatting': lambda: fix_formatting.DocumentFormatter().pipeline.fixers,
+    'advanced': lambda: fix_advanced_formatting.FIXERS,
+    'code-blocks': lambda: fix_code_blocks.FIXERS,
+    'warnings': lambda: fix_remaining_warnings.FIXERS,
+}
+DEFAULT_FIXER_SETS = ['formatting', 'code-blocks', 'warnings']
+
+
+def run_all(args):
+    """Validate documents and check links in one pass over the tree."""
+    if not os.path.exists(args.directory):
+        print(f"❌ Directory '{args.directory}' not found")
+        return 1
+
+    files = find_markdown_files(args.directory)
+    if not files:
+        print("No markdown files found")
+        return 0
+
+    print(f"🔍 Validating and checking links in {len(files)} markdown files...")
+    print()
+
+    validator = DocumentValidator(strict=args.strict)
+    for filepath in files:
+        validator.validate_file(filepath)
+
+    checker = LinkChecker(args.directory)
+    checker.check_files(files)
+
+    print("=" * 60)
+    print("📋 VALIDATION")
+    print("=" * 60)
+    valid = validator.print_results()
+    print()
+    print("=" * 60)
+    print("🔗 LINKS")
+    print("=" * 60)
+    links_ok = checker.print_results()
+
+    cache = default_cache()
+    print()
+    print(f"📚 {cache.reads} files read, {cache.hits} cache hits")
+
+    if args.output:
+        results = {
+            'validation': validator.get_results(),
+            'links': checker.get_results(),
+            'files': files,
+            'run_date': datetime.now().isoformat()
+        }
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"📄 Results saved to {args.output}")
+
+    return 0 if valid and links_ok else 1
+
+
+def _load_index(args):
+    if not os.path.exists(args.combined):
+        print(f"❌ Combined document '{args.combined}' not found", file=sys.stderr)
+        return None
+    return CombinedDocIndex(args.combined).load_or_build()
+
+
+def run_extract(args):
+    """Print one embedded file from the combined document."""
+    index = _load_index(args)
+    if index is None:
+        return 1
+    content = index.extract(args.path)
+    if content is None:
+        print(f"❌ '{args.path}' is not embedded in {args.combined}", file=sys.stderr)
+        return 1
+    sys.stdout.write(content)
+    return 0
+
+
+def run_section(args):
+    """Print one header section from the combined document."""
+    index = _load_index(args)
+    if index is None:
+        return 1
+    matches = index.find_sections(args.anchor, args.file)
+    if not matches:
+        print(f"❌ No section '#{args.anchor.lstrip('#')}' in {args.combined}", file=sys.stderr)
+        return 1
+    entry, header = matches[0]
+    if len(matches) > 1:
+        others = ', '.join(f"{e['path']}:{h['line']}" for e, h in matches[1:])
+        print(f"⚠️  Showing {entry['path']}:{header['line']}; also in {others} (use --file)",
+              file=sys.stderr)
+    sys.stdout.write(index.section(header))
+    return 0
+
+
+def run_regenerate(args):
+    """Re-embed changed source files into the combined document."""
+    index = _load_index(args)
+    if index is None:
+        return 1
+    changed = index.regenerate(args.source_root, dry_run=args.dry_run)
+    if not changed:
+        print(f"✅ {args.combined} is up to date ({len(index.files)} embedded files)")
+        return 0
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"🔧 {verb} {len(changed)} of {len(index.files)} embedded files:")
+    for path in changed:
+        print(f"   - {path}")
+    return 0
+
+
+def run_search(args):
+    """Search the documentation by header section."""
+    if not os.path.exists(args.directory):
+        print(f"❌ Directory '{args.directory}' not found")
+        return 1
+
+    index = SearchIndex(args.index_file or os.path.join(args.directory, '.docs_search_index.sqlite'),
+                        args.directory)
+    try:
+        if not args.no_update:
+            index.update(find_markdown_files(args.directory))
+            if index.stats['indexed'] or index.stats['removed']:
+                print(f"📚 Indexed {index.stats['indexed']} changed files, "
+                      f"removed {index.stats['removed']}", file=sys.stderr)
+        results = index.search(args.query, args.limit)
+    finally:
+        index.close()
+
+    if not results:
+        print(f"🔍 No sections match '{args.query}'")
+        return 1
+    for result in results:
+        anchor = f"#{result['anchor']}" if result['anchor'] else ''
+        print(f"{result['score']:6.2f}  {result['path']}{anchor}  (line {result['line']})")
+        print(f"        {result['title']}: {result['snippet']}")
+    return 0
+
+
+def run_fix(args):
+    """Apply several fixer sets to every file in a single pass."""
+    if not os.path.exists(args.directory):
+        print(f"❌ Directory '{args.directory}' not found")
+        return 1
+
+    files = find_markdown_files(args.directory)
+    fixers = [fixer for name in FIXER_SETS if name in args.fixers
+              for fixer in FIXER_SETS[name]()]
+    pipeline = FixPipeline(fixers, dry_run=args.dry_run, diff=args.diff)
+
+    action = "Checking" if args.dry_run else "Fixing"
+    print(f"🔧 {action} {len(files)} markdown files ({', '.join(args.fixers)})...")
+    total_changes = 0
+    modified_files = 0
+    failed = 0
+    results = pipeline.fix_files(files, jobs=args.jobs)
+    for result in results:
+        filepath = result['file']
+        if not result['success']:
+            failed += 1
+            print(f"❌ Error processing {filepath}: {result['error']}")
+        elif result['changes']:
+            if result.get('skipped'):
+                print(f"⚠️  Skipped {filepath}: {result['skipped']}")
+            else:
+                modified_files += 1
+                total_changes += len(result['changes'])
+                print(f"✅ {'Would fix' if args.dry_run else 'Fixed'} {filepath}")
+            for change in result['changes']:
+                print(f"   - {change}")
+            if result.get('diff'):
+                print(result['diff'], end='')
+
+    action = "would be modified" if args.dry_run else "modified"
+    print(f"\n📊 Summary: {modified_files} files {action} with {total_changes} total changes.")
+    if args.change_log:
+        write_change_log(args.change_log, results, args.dry_run)
+        print(f"📄 Change log saved to {args.change_log}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='A2 Robot documentation tool')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    all_parser = subparsers.add_parser('all', help='Validate documents and check links')
+    all_parser.add_argument('directory', nargs='?', default='a2-docs',
+                           help='Directory to process (default: a2-docs)')
+    all_parser.add_argument('--strict', action='store_true',
+                           help='Enable strict validation (more warnings)')
+    all_parser.add_argument('--output', help='Output combined results to JSON file')
+    all_parser.set_defaults(func=run_all)
+
+    combined_parent = argparse.ArgumentParser(add_help=False)
+    combined_parent.add_argument('--combined', default='a2-complete-documentation.md',
+                                 help='Combined document (default: a2-complete-documentation.md)')
+
+    extract_parser = subparsers.add_parser('extract', parents=[combined_parent],
+                                           help='Print an embedded file from the combined document')
+    extract_parser.add_argument('path', help="Embedded file path, as in its '## File:' marker")
+    extract_parser.set_defaults(func=run_extract)
+
+    section_parser = subparsers.add_parser('section', parents=[combined_parent],
+                                           help='Print a header section from the combined document')
+    section_parser.add_argument('anchor', help='Header anchor, e.g. quick-start')
+    section_parser.add_argument('--file', help='Only look in this embedded file')
+    section_parser.set_defaults(func=run_section)
+
+    regenerate_parser = subparsers.add_parser('regenerate', parents=[combined_parent],
+                                              help='Re-embed source files that changed')
+    regenerate_parser.add_argument('--source-root', default='.',
+                                   help='Directory the embedded paths are relative to (default: .)')
+    regenerate_parser.add_argument('--dry-run', action='store_true',
+                                   help='Only list the embedded files that would change')
+    regenerate_parser.set_defaults(func=run_regenerate)
+
+    search_parser = subparsers.add_parser('search', help='Full-text search by header section')
+    search_parser.add_argument('query', help='Search terms; sections matching all terms rank first')
+    search_parser.add_argument('--directory', default='a2-docs',
+                               help='Directory to search (default: a2-docs)')
+    search_parser.add_argument('--limit', type=int, default=10,
+                               help='Maximum number of results (default: 10)')
+    search_parser.add_argument('--index-file',
+                               help='Index location (default: DIRECTORY/.docs_search_index.sqlite)')
+    search_parser.add_argument('--no-update', action='store_true',
+                               help='Query the index as-is without checking for changed files')
+    search_parser.set_defaults(func=run_search)
+
+    fix_parser = subparsers.add_parser('fix', help='Run the fixers in one pass per file')
+    fix_parser.add_argument('directory', nargs='?', default='a2-docs',
+                            help='Directory to fix (default: a2-docs)')
+    fix_parser.add_argument('--fixers', nargs='+', choices=list(FIXER_SETS), default=DEFAULT_FIXER_SETS,
+                            help=f"Fixer sets to chain (default: {' '.join(DEFAULT_FIXER_SETS)})")
+    fix_parser.add_argument('--dry-run', action='store_true',
+                            help='Show what would be changed without making changes')
+    fix_parser.add_argument('--diff', action='store_true',
+                            help='Print a unified diff of every changed file')
+    fix_parser.add_argument('--jobs', '-j', type=int, default=1,
+                            help='Number of worker processes (default: 1, 0 = one per CPU)')
+    fix_parser.add_argument('--change-log', help='Write a JSON change log to this file')
+    fix_parser.set_defaults(func=run_fix)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
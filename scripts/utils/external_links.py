@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - External Link Checker
+
+Checks http(s) links found in the documentation:
+- asyncio scheduler with a global and a per-host concurrency limit
+- Per-host rate limiting (minimum interval between requests)
+- Pooled keep-alive connections, reused across requests to the same host
+- HEAD first, falling back to GET for servers that reject HEAD
+- On-disk cache of status, ETag and Last-Modified with a TTL; expired
+  entries are revalidated with conditional requests
+
+Used by check_links.py --external, or directly:
+    python3 external_links.py https://example.com/datasheet.pdf
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+import argparse
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = 'A2-Doc-Link-Checker/1.0'
+MAX_REDIRECTS = 5
+# Status codes that suggest the server does not accept HEAD requests
+HEAD_REJECTED = {400, 403, 404, 405, 406, 429, 500, 501, 503}
+
+
+class ConnectionPool:
+    """Keep-alive http.client connections grouped by (scheme, host, port)."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._idle: Dict[tuple, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+class ExternalLinkChecker:
+    def __init__(self, cache_path: Optional[str] = None, ttl: float = 24 * 3600,
+                 concurrency: int = 16, per_host: int = 4, rate: float = 4.0,
+                 timeout: float = 10.0):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.min_interval = 1.0 / rate if rate > 0 else 0.0
+        self.timeout = timeout
+        self.cache: Dict[str, dict] = {}
+        self.stats = {'cached': 0, 'revalidated': 0, 'fetched': 0}
+        self._pool = ConnectionPool(timeout)
+        # asyncio primitives are bound to the event loop of the run that
+        # uses them, so they are created afresh by each _check_all()
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next: Dict[str, float] = {}
+        self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f)
+        except (OSError, ValueError):
+            self.cache = {}
+
+    def save_cache(self):
+        """Write the cache file atomically."""
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def check_urls(self, urls) -> Dict[str, dict]:
+        """Check URLs and return url -> {'ok', 'status', 'error'}."""
+        return asyncio.run(self._check_all(sorted(set(urls))))
+
+    async def _check_all(self, urls) -> Dict[str, dict]:
+        limit = asyncio.Semaphore(self.concurrency)
+        self._host_limits = {}
+        self._host_locks = {}
+
+        async def run(url):
+            async with limit:
+                return url, await self._check_url(url)
+
+        try:
+            results = await asyncio.gather(*(run(url) for url in urls))
+        finally:
+            self._pool.close()
+        return dict(results)
+
+    async def _check_url(self, url: str) -> dict:
+        now = time.time()
+        entry = self.cache.get(url)
+        if entry and now - entry['checked_at'] < self.ttl:
+            self.stats['cached'] += 1
+            return self._result(entry)
+
+        conditional = {}
+        if entry and entry.get('ok'):
+            if entry.get('etag'):
+                conditional['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                conditional['If-Modified-Since'] = entry['last_modified']
+
+        status, headers, error = await self._request_with_fallback(url, conditional)
+        if status == 304 and entry:
+            self.stats['revalidated'] += 1
+            entry['checked_at'] = now
+            return self._result(entry)
+
+        self.stats['fetched'] += 1
+        entry = {
+            'ok': error is None and status is not None and status < 400,
+            'status': status,
+            'error': error,
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'checked_at': now
+        }
+        self.cache[url] = entry
+        return self._result(entry)
+
+    @staticmethod
+    def _result(entry: dict) -> dict:
+        return {'ok': entry['ok'], 'status': entry['status'], 'error': entry['error']}
+
+    async def _request_with_fallback(self, url, conditional):
+        status, headers, error = await self._request('HEAD', url, conditional)
+        if error is not None or status in HEAD_REJECTED:
+            status, headers, error = await self._request('GET', url, conditional)
+        return status, headers, error
+
+    async def _request(self, method: str, url: str, extra_headers: dict):
+        """Issue a request, following redirects. Returns (status, headers, error)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            host = parts.netloc.lower()
+            async with self._host_slot(host):
+                try:
+                    status, headers = await asyncio.to_thread(
+                        self._send, method, parts, extra_headers)
+                except (OSError, http.client.HTTPException) as e:
+                    return None, {}, f"{type(e).__name__}: {e}"
+            if status in (301, 302, 303, 307, 308) and headers.get('location'):
+                url = urljoin(url, headers['location'])
+                continue
+            return status, headers, None
+        return None, {}, 'Too many redirects'
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str):
+        """Per-host concurrency limit plus minimum spacing between requests."""
+        semaphore = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with semaphore:
+            async with self._host_locks.setdefault(host, asyncio.Lock()):
+                wait = self._host_next.get(host, 0.0) - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._host_next[host] = time.monotonic() + self.min_interval
+            yield
+
+    def _send(self, method, parts, extra_headers):
+        """Blocking request on a pooled connection (runs in a worker thread)."""
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = {'User-Agent': USER_AGENT, 'Accept': '*/*', **extra_headers}
+
+        conn = self._pool.acquire(parts.scheme, parts.netloc)
+        try:
+            try:
+                conn.request(method, path, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # A pooled keep-alive connection was closed by the server; retry once
+                conn.close()
+                conn.request(method, path, headers=headers)
+                response = conn.getresponse()
+
+            status = response.status
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            # Only keep the connection for reuse if the body is small enough
+            # to drain; large downloads are abandoned by closing the socket
+            length = response.getheader('content-length') or ''
+            if method == 'HEAD' or (length.isdigit() and int(length) <= 65536):
+                response.read()
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._pool.release(parts.scheme, parts.netloc, conn)
+            else:
+                conn.close()
+            return status, response_headers
+        except Exception:
+            conn.close()
+            raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check external links')
+    parser.add_argument('urls', nargs='+', help='URLs to check')
+    parser.add_argument('--cache-file', help='ETag/status cache file')
+    parser.add_argument('--ttl', type=float, default=24, help='Cache TTL in hours (default: 24)')
+    args = parser.parse_args()
+
+    checker = ExternalLinkChecker(cache_path=args.cache_file, ttl=args.ttl * 3600)
+    results = checker.check_urls(args.urls)
+    checker.save_cache()
+
+    for url, result in results.items():
+        mark = "✅" if result['ok'] else "🔴"
+        print(f"{mark} {result['status'] or result['error']} {url}")
+    sys.exit(0 if all(r['ok'] for r in results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,24 +8,31 @@ import os
 import re
 import argparse
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-import json
+from typing import Iterator, List, Dict, Optional
 
-def fix_header_spacing(content: str) -> Tuple[str, List[str]]:
-    """Fix headers missing space after #"""
-    changes = []
-    lines = content.split('\n')
-    
+from code_language import detect_language, MIN_CONFIDENCE
+from fix_engine import FixPipeline, write_change_log, fence_opening, closes_fence, label_code_blocks
+
+HEADER_NO_SPACE_RE = re.compile(r'^(#{1,6})([^#\s].*)')
+
+def fix_header_spacing(lines: Iterator[str], ctx) -> Iterator[str]:
+    """Fix headers missing space after # (code blocks are left alone)"""
+    fence = None
     for i, line in enumerate(lines):
-        # Match headers without space after #
-        match = re.match(r'^(#{1,6})([^#\s].*)', line)
-        if match:
-            level = match.group(1)
-            text = match.group(2)
-            lines[i] = f"{level} {text}"
-            changes.append(f"Line {i+1}: Fixed header spacing")
-    
-    return '\n'.join(lines), changes
+        if fence is not None:
+            if closes_fence(line, fence):
+                fence = None
+        elif fence_opening(line):
+            fence = fence_opening(line)[0]
+        else:
+            # Match headers without space after #
+            match = HEADER_NO_SPACE_RE.match(line)
+            if match:
+                level = match.group(1)
+                text = match.group(2)
+                line = f"{level} {text}"
+                ctx.change(f"Line {i+1}: Fixed header spacing")
+        yield line
 
 def should_have_metadata(filepath: str, content: str) -> bool:
     """Determine if a file should have metadata block"""
@@ -91,106 +98,46 @@ updated: "2024-01-01"
 """
     return metadata
 
-def add_metadata_blocks(content: str, filepath: str) -> Tuple[str, List[str]]:
+def add_metadata_blocks(lines: Iterator[str], ctx) -> Iterator[str]:
     """Add metadata blocks to appropriate documents"""
-    changes = []
-    
-    if should_have_metadata(filepath, content):
-        metadata = generate_metadata_block(filepath, content)
-        content = metadata + content
-        changes.append("Added metadata block")
-    
-    return content, changes
-
-def fix_code_block_languages(content: str) -> Tuple[str, List[str]]:
-    """Add language specifications to code blocks where obvious"""
-    changes = []
-    lines = content.split('\n')
-    
-    for i, line in enumerate(lines):
-        if line.strip() == '```':
-            # Look at the next few lines to guess the language
-            next_lines = lines[i+1:i+5]
-            language = guess_code_language(next_lines)
-            if language:
-                lines[i] = f'```{language}'
-                changes.append(f"Line {i+1}: Added language specification '{language}'")
-    
-    return '\n'.join(lines), changes
+    # should_have_metadata only needs the first lines: enough to know the
+    # file is at least 10 lines long and to find its first non-blank line
+    head = []
+    for line in lines:
+        head.append(line)
+        if len(head) >= 10 and any(l.strip() for l in head):
+            break
+    
+    if should_have_metadata(ctx.filepath, '\n'.join(head)):
+        yield from generate_metadata_block(ctx.filepath, '').split('\n')[:-1]
+        ctx.change("Added metadata block")
+    yield from head
+    yield from lines
 
 def guess_code_language(lines: List[str]) -> Optional[str]:
     """Guess the programming language from code content"""
-    content = '\n'.join(lines).lower()
-    
-    # Python indicators
-    if any(keyword in content for keyword in ['def ', 'import ', 'from ', 'class ', 'if __name__']):
-        return 'python'
-    
-    # Bash/shell indicators
-    if any(indicator in content for indicator in ['#!/bin/bash', '#!/bin/sh', 'sudo ', 'apt-get', 'cd ', 'ls ', 'mkdir']):
-        return 'bash'
-    
-    # C++ indicators
-    if any(keyword in content for keyword in ['#include', 'void setup()', 'void loop()', 'arduino']):
-        return 'cpp'
-    
-    # YAML indicators
-    if any(indicator in content for indicator in ['version:', 'services:', 'volumes:', 'environment:']):
-        return 'yaml'
-    
-    # JSON indicators
-    if content.strip().startswith('{') and '"' in content:
-        return 'json'
-    
-    # XML indicators
-    if '<' in content and '>' in content and content.strip().startswith('<'):
-        return 'xml'
-    
-    return None
+    language, confidence = detect_language('\n'.join(lines))
+    return language if confidence >= MIN_CONFIDENCE else None
+
+fix_code_block_languages = label_code_blocks(
+    guess_code_language, "Line {line_num}: Added language specification '{language}'")
+
+# Line-stream fixers applied by process_file, in order
+FIXERS = [fix_header_spacing, add_metadata_blocks, fix_code_block_languages]
 
 def process_file(filepath: str, dry_run: bool = False) -> Dict:
     """Process a single markdown file"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-        
-        content = original_content
-        all_changes = []
-        
-        # Apply fixes in order
-        content, changes = fix_header_spacing(content)
-        all_changes.extend(changes)
-        
-        content, changes = add_metadata_blocks(content, filepath)
-        all_changes.extend(changes)
-        
-        content, changes = fix_code_block_languages(content)
-        all_changes.extend(changes)
-        
-        # Write back if changes were made and not dry run
-        if all_changes and not dry_run:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-        
-        return {
-            'file': filepath,
-            'changes': all_changes,
-            'success': True
-        }
-    
-    except Exception as e:
-        return {
-            'file': filepath,
-            'changes': [],
-            'success': False,
-            'error': str(e)
-        }
+    return FixPipeline(FIXERS, dry_run=dry_run).fix_file(filepath)
 
 def main():
     parser = argparse.ArgumentParser(description='Advanced formatting fixes for A2 Robot documentation')
     parser.add_argument('--directory', default='a2-docs', help='Directory to process')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without making changes')
     parser.add_argument('--files', nargs='*', help='Specific files to process')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--diff', action='store_true', help='Print a unified diff of every changed file')
+    parser.add_argument('--change-log', help='Write a JSON change log to this file')
     
     args = parser.parse_args()
     
@@ -213,22 +160,25 @@ def main():
     if args.dry_run:
         print("🔍 DRY RUN MODE - No changes will be made")
     
-    results = []
     total_changes = 0
     modified_files = 0
     
-    for filepath in files_to_process:
-        result = process_file(filepath, args.dry_run)
-        results.append(result)
-        
+    pipeline = FixPipeline(FIXERS, dry_run=args.dry_run, diff=args.diff)
+    results = pipeline.fix_files(files_to_process, jobs=args.jobs)
+    for result in results:
         if result['success']:
             if result['changes']:
-                modified_files += 1
-                total_changes += len(result['changes'])
-                status = "Would fix" if args.dry_run else "Fixed"
-                print(f"✅ {status} {result['file']}")
+                if result.get('skipped'):
+                    print(f"⚠️  Skipped {result['file']}: {result['skipped']}")
+                else:
+                    modified_files += 1
+                    total_changes += len(result['changes'])
+                    status = "Would fix" if args.dry_run else "Fixed"
+                    print(f"✅ {status} {result['file']}")
                 for change in result['changes']:
                     print(f"   - {change}")
+                if result.get('diff'):
+                    print(result['diff'], end='')
             else:
                 print(f"✅ No changes needed for {result['file']}")
         else:
@@ -238,6 +188,10 @@ def main():
     action = "would be modified" if args.dry_run else "modified"
     print(f"\n📊 Summary: {len(files_to_process)}/{len(files_to_process)} files processed successfully")
     print(f"{modified_files} files {action} with {total_changes} total changes.")
+    
+    if args.change_log:
+        write_change_log(args.change_log, results, args.dry_run)
+        print(f"📄 Change log saved to {args.change_log}")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 """
 Fix common broken link issues in markdown files.
+
+Same-file anchors are repaired against the file's own headers. Cross-file
+``path.md#anchor`` links are repaired against an AnchorIndex of the whole
+tree, built once per run: a link to a file that no longer exists is
+pointed at the file it moved to (same content fingerprint, or same
+basename), and a misformatted anchor gets the mechanical fixes. A
+cross-file anchor that would need a guess is only reported, with
+suggestions; it is never rewritten.
 """
 
 import os
 import re
 import argparse
+import hashlib
+import subprocess
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
+
+from markdown_tokens import tokenize, HEADER
+from doc_model import get_document
+from check_links import LinkChecker, find_markdown_files
+from trigram_index import TrigramIndex
 
 def normalize_anchor(text: str) -> str:
     """Convert text to proper markdown anchor format."""
@@ -25,16 +40,29 @@ def normalize_anchor(text: str) -> str:
     
     return text
 
-def extract_headers(content: str) -> Dict[str, str]:
-    """Extract all headers and their normalized anchors."""
+HEADER_LINE_RE = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+# Inline links, matched regardless of code fences (see extract_headers)
+LINK_PATTERN_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+def extract_headers(content: str, tokens=None, include_code: bool = False) -> Dict[str, str]:
+    """Extract all headers and their normalized anchors.
+    
+    Pass ``tokens`` to reuse an existing tokenizer pass over ``content``.
+    With ``include_code`` every header-like line counts, even inside code
+    blocks: an unbalanced fence (common in concatenated documents such as
+    a2-complete-documentation.md) would otherwise hide real headers, and
+    links to them would look broken.
+    """
     headers = {}
     
-    # Find all headers
-    header_pattern = r'^(#{1,6})\s+(.+)$'
-    for match in re.finditer(header_pattern, content, re.MULTILINE):
-        level = len(match.group(1))
-        header_text = match.group(2).strip()
-        
+    if include_code:
+        header_texts = (match.group(2).strip() for match in HEADER_LINE_RE.finditer(content))
+    else:
+        # Headers inside code blocks are skipped
+        header_texts = (token.text for token in (tokens if tokens is not None else tokenize(content))
+                        if token.kind == HEADER)
+    
+    for header_text in header_texts:
         # Remove markdown formatting from header text
         clean_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', header_text)  # Bold
         clean_text = re.sub(r'\*([^*]+)\*', r'\1', clean_text)       # Italic
@@ -77,85 +105,261 @@ def find_similar_anchor(target: str, available: List[str]) -> str:
     
     return best_match
 
-def fix_links_in_file(filepath: str, dry_run: bool = False) -> int:
-    """Fix broken links in a single file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+# Common fixes for anchor formatting
+ANCHOR_FIXES = [
+    # Remove special characters that don't belong in anchors
+    (r'[&]', '-'),
+    (r'[/]', '-'),
+    (r'[:]', ''),
+    (r'[+]', ''),
+    (r'[@]', ''),
+    (r'[()]', ''),
+    (r'["]', ''),
+    (r"[']", ''),
+    (r'[!]', ''),
+    (r'[?]', ''),
+    (r'[*]', ''),
+    (r'[✅]', ''),
+    (r'[⬅️]', ''),
+    (r'[🎉]', ''),
+    # Fix multiple hyphens
+    (r'-+', '-'),
+    # Remove leading/trailing hyphens
+    (r'^-+|-+$', ''),
+]
+
+def clean_anchor(anchor: str) -> str:
+    """Apply the mechanical anchor formatting fixes."""
+    fixed_anchor = anchor
+    for pattern, replacement in ANCHOR_FIXES:
+        fixed_anchor = re.sub(pattern, replacement, fixed_anchor)
+    
+    # Convert to lowercase
+    return fixed_anchor.lower()
+
+def repair_anchor(anchor: str, available_anchors: List[str]) -> Optional[str]:
+    """Return the same-file anchor ``anchor`` was meant to be, or None to leave it."""
+    fixed_anchor = clean_anchor(anchor)
+    
+    # If the fixed anchor is different and exists, use it
+    if fixed_anchor != anchor and fixed_anchor in available_anchors:
+        return fixed_anchor
+    
+    # Try to find a similar anchor
+    if anchor not in available_anchors and fixed_anchor not in available_anchors:
+        similar = find_similar_anchor(anchor, available_anchors)
+        if similar:
+            return similar
+    return None
+
+def git_blob_id(data: bytes) -> str:
+    """Return the id git gives a blob with this content."""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+class AnchorIndex:
+    """Anchors, basenames and content fingerprints of every file in a tree.
+    
+    Built once per run with one read of each file (through the shared
+    document cache, which the per-file fixes then reuse). Fingerprints are
+    git blob ids, so a link to a path that no longer exists can be matched
+    to the file git last knew at that path, wherever it moved and whatever
+    it is called now.
+    """
+    
+    def __init__(self, base_directory):
+        self.base_directory = os.path.abspath(base_directory)
+        self.anchors: Dict[str, set] = {}
+        self.headers: Dict[str, List[str]] = {}
+        self.by_basename: Dict[str, List[str]] = {}
+        self.by_fingerprint: Dict[str, List[str]] = {}
+        self._moved: Dict[str, Optional[str]] = {}
+        self._trigrams: Dict[str, TrigramIndex] = {}
+        self._git_root = None
+        
+    def build(self, filepaths):
+        """Index ``filepaths``; returns self."""
+        for filepath in filepaths:
+            key = os.path.abspath(filepath)
+            doc = get_document(key)
+            # Anchors as this script spells them plus as check_links accepts them
+            headers = list(dict.fromkeys(extract_headers(doc.text, include_code=True).values()))
+            self.headers[key] = headers
+            anchors = set(headers)
+            anchors.update(LinkChecker._normalize_anchor(header['text']) for header in doc.headers)
+            self.anchors[key] = anchors
+            self.by_basename.setdefault(os.path.basename(key), []).append(key)
+            fingerprint = git_blob_id(doc.text.encode('utf-8'))
+            self.by_fingerprint.setdefault(fingerprint, []).append(key)
+        return self
         
-        original_content = content
-        changes_made = 0
+    def repair(self, target: str, anchor: str) -> Optional[str]:
+        """Mechanically repaired form of ``anchor`` in the indexed file ``target``.
+        
+        Only the formatting fixes are applied; returns None when the anchor
+        is valid or needs a guess (see suggest()).
+        """
+        if anchor in self.anchors[target]:
+            return None
+        fixed_anchor = clean_anchor(anchor)
+        return fixed_anchor if fixed_anchor in self.anchors[target] else None
+        
+    def suggest(self, target: str, anchor: str, limit: int = 3) -> List[str]:
+        """Similar anchors in ``target``, best first, for the report only.
+        
+        Similar headers are often different sections (2.11 vs 2.13 of a
+        numbered list), so these are never written into a link.
+        """
+        suggestions = []
+        similar = find_similar_anchor(anchor, self.headers[target])
+        if similar:
+            suggestions.append(similar)
+        trigrams = self._trigrams.get(target)
+        if trigrams is None:
+            trigrams = self._trigrams[target] = TrigramIndex()
+            for available in self.headers[target]:
+                trigrams.add(available)
+        for match, _ in trigrams.search(clean_anchor(anchor), limit=limit):
+            if match not in suggestions:
+                suggestions.append(match)
+        return suggestions[:limit]
+        
+    def locate(self, target: str, anchor: Optional[str] = None) -> Optional[str]:
+        """Where the missing file ``target`` (absolute path) lives now.
+        
+        An exact content match of the file's last committed version wins;
+        otherwise a unique file with the same basename, narrowed to the
+        files that have ``anchor`` when there are several. Ambiguous
+        matches return None rather than a guess.
+        """
+        if target not in self._moved:
+            self._moved[target] = self._locate(target)
+        located = self._moved[target]
+        if located is not None:
+            return located
+        
+        candidates = self.by_basename.get(os.path.basename(target), [])
+        if len(candidates) > 1 and anchor:
+            candidates = [c for c in candidates if anchor in self.anchors[c]]
+        return candidates[0] if len(candidates) == 1 else None
+        
+    def _locate(self, target):
+        """Fingerprint match for ``target``, or None."""
+        fingerprint = self._last_blob_id(target)
+        matches = self.by_fingerprint.get(fingerprint, []) if fingerprint else []
+        if len(matches) > 1:
+            # Identical copies: prefer the one that kept the basename
+            matches = [m for m in matches
+                       if os.path.basename(m) == os.path.basename(target)] or matches
+        return matches[0] if matches else None
+        
+    def _last_blob_id(self, target):
+        """Blob id of the last committed content at ``target``, if git has one."""
+        if self._git_root is None:
+            try:
+                self._git_root = subprocess.run(
+                    ['git', '-C', self.base_directory, 'rev-parse', '--show-toplevel'],
+                    capture_output=True, text=True, check=True).stdout.strip()
+            except (OSError, subprocess.CalledProcessError):
+                self._git_root = ''
+        if not self._git_root:
+            return None
+        
+        # The last commit touching the path: a deletion records the old blob
+        # as source, a modification the current one as destination
+        relative = os.path.relpath(target, self._git_root)
+        try:
+            raw = subprocess.run(
+                ['git', '-C', self._git_root, 'log', '-1', '--format=', '--raw',
+                 '--no-abbrev', '--no-renames', '--', relative],
+                capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        for line in raw.splitlines():
+            fields = line.split('\t', 1)[0].split()
+            if len(fields) >= 5 and line.startswith(':'):
+                source_blob, destination_blob = fields[2], fields[3]
+                return destination_blob if destination_blob.strip('0') else source_blob
+        return None
+
+def fix_links_in_file(filepath: str, dry_run: bool = False, index: Optional[AnchorIndex] = None) -> int:
+    """Fix broken links in a single file.
+    
+    With an ``index`` of the tree, cross-file links are repaired too;
+    without one only same-file anchors are.
+    """
+    try:
+        doc = get_document(filepath)
+        content = doc.text
+        source_dir = os.path.dirname(os.path.abspath(filepath))
         
         # Extract headers from this file
-        headers = extract_headers(content)
+        headers = extract_headers(content, include_code=True)
         available_anchors = list(headers.values())
+        suggestions = []
         
-        # Find all internal links
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-        
-        def fix_link(match):
-            nonlocal changes_made
-            link_text = match.group(1)
-            link_url = match.group(2)
+        def fix_file_link(link_text, link_url):
+            """Repair a ``path.md#anchor`` link against the tree index."""
+            path, _, anchor = link_url.partition('#')
+            target = os.path.normpath(os.path.join(source_dir, path))
             
+            if os.path.exists(target):
+                if not anchor or target not in index.anchors:
+                    return None
+                fixed_anchor = index.repair(target, anchor)
+                if fixed_anchor is None:
+                    if anchor not in index.anchors[target]:
+                        suggestions.append((link_url, [f"{path}#{similar}" for similar
+                                                       in index.suggest(target, anchor)]))
+                    return None
+                return f'[{link_text}]({path}#{fixed_anchor})'
+            
+            if not path.endswith('.md'):
+                return None
+            moved = index.locate(target, anchor or None)
+            if moved is None:
+                return None
+            new_path = os.path.relpath(moved, source_dir)
+            if anchor:
+                if anchor not in index.anchors[moved]:
+                    fixed_anchor = index.repair(moved, anchor)
+                    if fixed_anchor is None:
+                        suggestions.append((f"{new_path}#{anchor}", [f"{new_path}#{similar}" for similar
+                                                                     in index.suggest(moved, anchor)]))
+                    else:
+                        anchor = fixed_anchor
+                return f'[{link_text}]({new_path}#{anchor})'
+            return f'[{link_text}]({new_path})'
+        
+        def fix_link(link_text, link_url):
+            """Return the repaired link markup, or None to leave it alone."""
             # Skip external links
             if link_url.startswith(('http://', 'https://', 'mailto:')):
-                return match.group(0)
-            
-            # Skip file links (for now)
-            if '/' in link_url and not link_url.startswith('#'):
-                return match.group(0)
+                return None
             
             # Handle anchor links
             if link_url.startswith('#'):
-                anchor = link_url[1:]  # Remove #
-                
-                # Common fixes for anchor formatting
-                fixes = [
-                    # Remove special characters that don't belong in anchors
-                    (r'[&]', '-'),
-                    (r'[/]', '-'),
-                    (r'[:]', ''),
-                    (r'[+]', ''),
-                    (r'[@]', ''),
-                    (r'[()]', ''),
-                    (r'["]', ''),
-                    (r"[']", ''),
-                    (r'[!]', ''),
-                    (r'[?]', ''),
-                    (r'[*]', ''),
-                    (r'[✅]', ''),
-                    (r'[⬅️]', ''),
-                    (r'[🎉]', ''),
-                    # Fix multiple hyphens
-                    (r'-+', '-'),
-                    # Remove leading/trailing hyphens
-                    (r'^-+|-+$', ''),
-                ]
-                
-                fixed_anchor = anchor
-                for pattern, replacement in fixes:
-                    fixed_anchor = re.sub(pattern, replacement, fixed_anchor)
-                
-                # Convert to lowercase
-                fixed_anchor = fixed_anchor.lower()
-                
-                # If the fixed anchor is different and exists, use it
-                if fixed_anchor != anchor and fixed_anchor in available_anchors:
-                    changes_made += 1
+                fixed_anchor = repair_anchor(link_url[1:], available_anchors)
+                if fixed_anchor:
                     return f'[{link_text}](#{fixed_anchor})'
-                
-                # Try to find a similar anchor
-                if anchor not in available_anchors and fixed_anchor not in available_anchors:
-                    similar = find_similar_anchor(anchor, available_anchors)
-                    if similar:
-                        changes_made += 1
-                        return f'[{link_text}](#{similar})'
+                return None
             
-            return match.group(0)
+            # File links need the tree index
+            if index is not None:
+                return fix_file_link(link_text, link_url)
+            return None
+        
+        # Links are matched like headers, ignoring code fences: an unbalanced
+        # fence would hide real links from the tokenizer. Fixes are spliced
+        # in from the end so earlier offsets stay valid
+        replacements = []
+        for match in LINK_PATTERN_RE.finditer(content):
+            fixed = fix_link(match.group(1), match.group(2))
+            if fixed is not None:
+                replacements.append((match.start(), match.end(), fixed))
         
-        # Apply fixes
-        content = re.sub(link_pattern, fix_link, content)
+        for start, end, fixed in reversed(replacements):
+            content = content[:start] + fixed + content[end:]
+        changes_made = len(replacements)
         
         # Write back if changes were made
         if changes_made > 0 and not dry_run:
@@ -165,6 +369,11 @@ def fix_links_in_file(filepath: str, dry_run: bool = False) -> int:
         elif changes_made > 0 and dry_run:
             print(f"🔍 Would fix {changes_made} links in {filepath}")
         
+        # Guesses are reported, never applied
+        for link_url, similar in suggestions:
+            hint = f"did you mean {', '.join(similar)}?" if similar else "no similar anchor"
+            print(f"💡 {filepath}: anchor in '{link_url}' not found; {hint}")
+        
         return changes_made
         
     except Exception as e:
@@ -193,10 +402,15 @@ def main():
     total_changes = 0
     files_changed = 0
     
+    # One index of the whole tree resolves every cross-file link of the run
+    tree_files = find_markdown_files(args.directory) if os.path.isdir(args.directory) else []
+    index = AnchorIndex(args.directory).build(
+        sorted(set(tree_files) | {f for f in files_to_process if os.path.isfile(f)}))
+    
     print(f"🔧 {'Analyzing' if args.dry_run else 'Fixing'} broken links in {len(files_to_process)} files...")
     
     for filepath in files_to_process:
-        changes = fix_links_in_file(filepath, args.dry_run)
+        changes = fix_links_in_file(filepath, args.dry_run, index)
         if changes > 0:
             total_changes += changes
             files_changed += 1
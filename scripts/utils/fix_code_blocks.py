@@ -4,138 +4,31 @@ Fix code blocks missing language specifications.
 """
 
 import os
-import re
 from typing import List, Tuple
 
+from code_language import detect_language, MIN_CONFIDENCE
+from fix_engine import FixPipeline, write_change_log, label_code_blocks
+
 def detect_language_from_content(code_content: str) -> str:
-    """Detect programming language from code content."""
-    content = code_content.strip().lower()
-    
-    # Python indicators
-    if any(keyword in content for keyword in [
-        'def ', 'import ', 'from ', 'class ', 'if __name__', 'print(', 
-        'python', '#!/usr/bin/env python', '#!/usr/bin/python'
-    ]):
-        return 'python'
-    
-    # Bash/shell indicators
-    if any(indicator in content for indicator in [
-        '#!/bin/bash', '#!/bin/sh', 'sudo ', 'apt-get', 'apt ', 'pip install',
-        'npm ', 'cd ', 'ls ', 'mkdir', 'chmod', 'export ', 'echo $', '${', 'curl '
-    ]):
-        return 'bash'
-    
-    # YAML indicators
-    if any(indicator in content for indicator in [
-        'version:', 'services:', 'volumes:', 'environment:', 'ports:', 'image:',
-        'depends_on:', 'networks:', 'build:', 'command:'
-    ]) or re.search(r'^[a-zA-Z_][a-zA-Z0-9_]*:\s*$', content, re.MULTILINE):
-        return 'yaml'
-    
-    # JSON indicators
-    if (content.strip().startswith('{') and content.strip().endswith('}')) or \
-       (content.strip().startswith('[') and content.strip().endswith(']')) or \
-       re.search(r'"[^"]*":\s*["\d\[\{]', content):
-        return 'json'
-    
-    # C++/Arduino indicators
-    if any(keyword in content for keyword in [
-        '#include', 'void setup()', 'void loop()', 'digitalwrite', 'digitalread',
-        'analogread', 'arduino', 'int main(', 'std::', 'cout <<'
-    ]):
-        return 'cpp'
-    
-    # HTML indicators
-    if any(indicator in content for indicator in [
-        '<!doctype', '<html', '<head>', '<body>', '<div', '<span', '<p>', '<a href'
-    ]):
-        return 'html'
-    
-    # XML indicators
-    if content.startswith('<?xml') or re.search(r'<[a-zA-Z][^>]*>', content):
-        return 'xml'
-    
-    # SQL indicators
-    if any(keyword in content for keyword in [
-        'select ', 'insert ', 'update ', 'delete ', 'create table', 'alter table',
-        'drop table', 'from ', 'where ', 'join ', 'group by', 'order by'
-    ]):
-        return 'sql'
-    
-    # Markdown indicators
-    if any(indicator in content for indicator in [
-        '# ', '## ', '### ', '[', '](', '**', '*', '- ', '1. '
-    ]):
-        return 'markdown'
-    
-    # CSS indicators
-    if any(indicator in content for indicator in [
-        '{', '}', ':', ';', 'color:', 'background:', 'margin:', 'padding:'
-    ]) and not content.startswith('{'):
-        return 'css'
-    
-    # If we can't detect, return empty string
-    return ''
+    """Detect programming language from code content ('' if unsure)."""
+    language, confidence = detect_language(code_content)
+    return language if confidence >= MIN_CONFIDENCE else ''
+
+def _detect_block_language(block_lines: List[str]) -> str:
+    return detect_language_from_content('\n'.join(block_lines))
+
+# Line-stream fixers applied by process_file, in order
+FIXERS = [
+    label_code_blocks(_detect_block_language, "Added '{language}' language to code block"),
+]
 
-def fix_code_blocks_in_content(content: str) -> Tuple[str, List[str]]:
+def fix_code_blocks_in_content(content: str, filepath: str = '') -> Tuple[str, List[str]]:
     """Fix code blocks missing language specifications."""
-    changes = []
-    
-    # Find all code blocks
-    pattern = r'```(\w*)\n(.*?)\n```'
-    matches = list(re.finditer(pattern, content, re.DOTALL))
-    
-    # Process matches in reverse order to avoid offset issues
-    for match in reversed(matches):
-        current_lang = match.group(1)
-        code_content = match.group(2)
-        
-        # Only process if no language is specified
-        if not current_lang:
-            detected_lang = detect_language_from_content(code_content)
-            
-            if detected_lang:
-                # Replace the code block
-                start, end = match.span()
-                new_block = f'```{detected_lang}\n{code_content}\n```'
-                content = content[:start] + new_block + content[end:]
-                changes.append(f"Added '{detected_lang}' language to code block")
-    
-    return content, changes
+    return FixPipeline(FIXERS).fix_text(filepath, content)
 
 def process_file(filepath: str, dry_run: bool = False) -> dict:
     """Process a single file to fix code blocks."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-    except Exception as e:
-        return {
-            'file': filepath,
-            'changes': [],
-            'success': False,
-            'error': str(e)
-        }
-    
-    content, changes = fix_code_blocks_in_content(original_content)
-    
-    # Write back if changes were made and not dry run
-    if changes and not dry_run:
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-        except Exception as e:
-            return {
-                'file': filepath,
-                'changes': changes,
-                'success': False,
-                'error': str(e)
-            }
-    
-    return {
-        'file': filepath,
-        'changes': changes,
-        'success': True
-    }
+    return FixPipeline(FIXERS, dry_run=dry_run).fix_file(filepath)
 
 def main():
     """Fix code blocks missing language specifications."""
@@ -145,6 +38,10 @@ def main():
     parser.add_argument('--directory', default='a2-docs', help='Directory to process')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed')
     parser.add_argument('--files', nargs='*', help='Specific files to process')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--diff', action='store_true', help='Print a unified diff of every changed file')
+    parser.add_argument('--change-log', help='Write a JSON change log to this file')
     
     args = parser.parse_args()
     
@@ -170,23 +67,32 @@ def main():
     total_changes = 0
     modified_files = 0
     
-    for filepath in files_to_process:
-        result = process_file(filepath, args.dry_run)
-        
+    pipeline = FixPipeline(FIXERS, dry_run=args.dry_run, diff=args.diff)
+    results = pipeline.fix_files(files_to_process, jobs=args.jobs)
+    for result in results:
         if result['success']:
             if result['changes']:
-                modified_files += 1
-                total_changes += len(result['changes'])
-                status = "Would fix" if args.dry_run else "Fixed"
-                print(f"✅ {status} {result['file']}")
+                if result.get('skipped'):
+                    print(f"⚠️  Skipped {result['file']}: {result['skipped']}")
+                else:
+                    modified_files += 1
+                    total_changes += len(result['changes'])
+                    status = "Would fix" if args.dry_run else "Fixed"
+                    print(f"✅ {status} {result['file']}")
                 for change in result['changes']:
                     print(f"   - {change}")
+                if result.get('diff'):
+                    print(result['diff'], end='')
         else:
             print(f"❌ Error processing {result['file']}: {result.get('error', 'Unknown error')}")
     
     # Summary
     action = "would be modified" if args.dry_run else "modified"
     print(f"\n📊 Summary: {modified_files} files {action} with {total_changes} total changes.")
+    
+    if args.change_log:
+        write_change_log(args.change_log, results, args.dry_run)
+        print(f"📄 Change log saved to {args.change_log}")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Streaming Fixer Engine
+
+Shared engine for the documentation fixers (fix_formatting.py,
+fix_code_blocks.py, fix_remaining_warnings.py, fix_advanced_formatting.py):
+- Each fixer is a line-stream transform: ``fixer(lines, ctx)`` takes an
+  iterator of lines (without newlines) and yields the fixed lines
+- All fixers of a run are chained, so a file is read and rewritten in a
+  single pass however many fixers apply
+- The output is collected and hashed first; only when its hash differs
+  from the input hash is it written to a uniquely named temp file next to
+  the original, which replaces it with ``os.replace``. Unchanged files
+  never touch the disk
+
+Fixers that need a whole-document fact (e.g. "is there an Overview
+section anywhere?") read it from ``ctx.doc``, the parsed source document,
+instead of buffering the stream. Fixers that must see the whole stream
+before emitting anything (a table of contents built from every header)
+buffer it themselves, and only for files they actually change.
+
+fix_files() fans files out over a process pool (``--jobs``). Before each
+atomic write the file's mtime and size are checked against the version
+that was read; a file edited in the meantime is skipped, not clobbered.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from doc_model import Document, get_document
+
+
+class FixContext:
+    """Per-file state handed to one fixer during a pass."""
+
+    def __init__(self, filepath: str, doc):
+        self.filepath = filepath
+        self.doc = doc
+        self.changes: List[str] = []
+
+    def change(self, message: str):
+        """Record a change description for the report."""
+        self.changes.append(message)
+
+
+def _hashed(lines: Iterator[str], digest) -> Iterator[str]:
+    """Pass lines through, feeding them to ``digest``."""
+    for line in lines:
+        digest.update(line.encode('utf-8'))
+        digest.update(b'\n')
+        yield line
+
+
+# A ``` or ~~~ fence line (indented fences in list items count too)
+FENCE_LINE_RE = re.compile(r'^\s*(`{3,}|~{3,})(.*)$')
+
+
+def fence_opening(line: str) -> Optional[Tuple[str, str]]:
+    """(marker, info string) if ``line`` opens a code fence, else None."""
+    if '`' not in line and '~' not in line:
+        return None
+    match = FENCE_LINE_RE.match(line)
+    if not match or (match.group(1)[0] == '`' and '`' in match.group(2)):
+        return None
+    return match.group(1), match.group(2)
+
+
+def closes_fence(line: str, marker: str) -> bool:
+    """True if ``line`` closes a fence opened with ``marker``.
+
+    The closing fence uses the same character, at least as many times,
+    and nothing else, so a ``` line inside a ~~~ block is plain content.
+    """
+    match = FENCE_LINE_RE.match(line)
+    return bool(match and match.group(1)[0] == marker[0]
+                and len(match.group(1)) >= len(marker) and not match.group(2).strip())
+
+
+def _temp_file(path: str):
+    """Create a unique temp file next to ``path``; returns (fd, temp path)."""
+    directory, name = os.path.split(path)
+    return tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory or '.')
+
+
+class label_code_blocks:
+    """Fixer that adds a language to unlabelled code fences.
+
+    ``detect(block_lines)`` returns a language or None for the lines
+    between an unlabelled opening fence (``` or ~~~) and its closing
+    fence; ``message`` is formatted with ``line_num`` and ``language`` for
+    the change report. Only unlabelled blocks are buffered, and only until
+    their closing fence. Instances pickle (for worker processes) as long
+    as ``detect`` is a module-level function.
+    """
+
+    def __init__(self, detect: Callable[[List[str]], Optional[str]], message: str):
+        self.detect = detect
+        self.message = message
+
+    def __call__(self, lines, ctx):
+        lines = iter(lines)
+        line_num = 0
+        for line in lines:
+            line_num += 1
+            opening = fence_opening(line)
+            if opening is None:
+                yield line
+                continue
+            marker, info = opening
+
+            if info.strip():
+                # Labelled block: pass it through up to its closing fence
+                yield line
+                for candidate in lines:
+                    line_num += 1
+                    yield candidate
+                    if closes_fence(candidate, marker):
+                        break
+                continue
+
+            # Unlabelled opening fence: buffer the block up to its close
+            opening_num = line_num
+            block = []
+            closing = None
+            for candidate in lines:
+                line_num += 1
+                if closes_fence(candidate, marker):
+                    closing = candidate
+                    break
+                block.append(candidate)
+            language = self.detect(block)
+            if language:
+                indent = line[:len(line) - len(line.lstrip())]
+                line = f"{indent}{marker}{language}"
+                ctx.change(self.message.format(line_num=opening_num, language=language))
+            yield line
+            yield from block
+            if closing is not None:
+                yield closing
+
+
+class FixPipeline:
+    """Chain of fixers applied to files in one streaming pass each."""
+
+    def __init__(self, fixers: List[Callable], dry_run: bool = False, diff: bool = False):
+        self.fixers = fixers
+        self.dry_run = dry_run
+        self.diff = diff
+
+    def _stream(self, filepath: str, doc: Document, lines: Iterator[str]):
+        """Chain the fixers over ``lines``; returns (output lines, contexts)."""
+        contexts = []
+        for fixer in self.fixers:
+            ctx = FixContext(filepath, doc)
+            lines = fixer(lines, ctx)
+            contexts.append(ctx)
+        return lines, contexts
+
+    def fix_text(self, filepath: str, text: str):
+        """Apply the fixers to ``text`` in memory; returns (text, changes)."""
+        doc = Document(filepath, text)
+        lines, contexts = self._stream(filepath, doc, doc.iter_lines())
+        content = '\n'.join(lines)
+        return content, [change for ctx in contexts for change in ctx.changes]
+
+    def fix_file(self, filepath: str) -> dict:
+        """Fix one file.
+
+        Returns {'file', 'changes', 'written', 'success'} plus 'error' on
+        failure, 'skipped' when the file changed on disk while it was being
+        fixed (it is then left alone) and 'diff' (unified diff text) when
+        the pipeline was created with ``diff=True``.
+        """
+        result = {'file': filepath, 'changes': [], 'written': False, 'success': True}
+        tmp_path = None  # Only ever a temp file this call created
+        try:
+            doc = get_document(filepath)
+            source_digest = hashlib.sha1()
+            output_digest = hashlib.sha1()
+            source = _hashed(doc.iter_lines(), source_digest)
+            if self.diff:
+                before = []
+                source = _recorded(source, before)
+            lines, contexts = self._stream(filepath, doc, source)
+            output = list(_hashed(lines, output_digest))
+
+            if output_digest.digest() != source_digest.digest():
+                result['changes'] = [change for ctx in contexts for change in ctx.changes]
+                if self.diff:
+                    result['diff'] = ''.join(difflib.unified_diff(
+                        [line + '\n' for line in before], [line + '\n' for line in output],
+                        fromfile=f"a/{filepath}", tofile=f"b/{filepath}"))
+                if not self.dry_run:
+                    # Never overwrite an edit made while we were working
+                    st = os.stat(filepath)
+                    if st.st_mtime_ns != doc.mtime_ns or st.st_size != doc.size:
+                        result['skipped'] = 'changed on disk while fixing'
+                    else:
+                        fd, tmp_path = _temp_file(filepath)
+                        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+                            out.write('\n'.join(output))
+                        shutil.copymode(filepath, tmp_path)
+                        os.replace(tmp_path, filepath)
+                        tmp_path = None
+                        result['written'] = True
+        except Exception as e:
+            result.update(success=False, error=str(e))
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return result
+
+    def fix_files(self, filepaths: List[str], jobs: int = 1) -> List[dict]:
+        """Fix a list of files, optionally fanning them out across processes.
+
+        Results come back in the order of ``filepaths`` so the output
+        matches a serial run. ``jobs`` of 0 means one worker per CPU.
+        """
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        if jobs <= 1 or len(filepaths) < 2:
+            return [self.fix_file(filepath) for filepath in filepaths]
+
+        chunksize = max(1, len(filepaths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=_init_worker,
+                                 initargs=(self,)) as pool:
+            return list(pool.map(_fix_file_in_worker, filepaths, chunksize=chunksize))
+
+
+def _recorded(lines: Iterator[str], record: List[str]) -> Iterator[str]:
+    """Pass lines through, appending them to ``record``."""
+    for line in lines:
+        record.append(line)
+        yield line
+
+
+def write_change_log(path: str, results: List[dict], dry_run: bool):
+    """Write the per-file results of a fixer run as a JSON change log."""
+    changed = [result for result in results if result['changes']]
+    log = {
+        'run_date': datetime.now().isoformat(),
+        'dry_run': dry_run,
+        'summary': {
+            'files_processed': len(results),
+            'files_changed': len(changed),
+            'files_written': sum(1 for result in results if result.get('written')),
+            'files_skipped': sum(1 for result in results if result.get('skipped')),
+            'files_failed': sum(1 for result in results if not result['success']),
+            'total_changes': sum(len(result['changes']) for result in results)
+        },
+        'files': [{key: value for key, value in result.items() if key != 'diff'}
+                  for result in results if result['changes'] or not result['success']]
+    }
+    fd, tmp_path = _temp_file(path)
+    try:
+        # mkstemp creates the file private; give it the usual mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(log, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+_worker_pipeline = None
+
+def _init_worker(pipeline):
+    """Install the FixPipeline owned by a pool worker process."""
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+def _fix_file_in_worker(filepath):
+    """Fix one file in a pool worker and return its result."""
+    return _worker_pipeline.fix_file(filepath)
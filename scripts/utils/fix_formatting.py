@@ -16,89 +16,115 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 
+from fix_engine import FixPipeline, label_code_blocks, write_change_log
+
+BULLET_RE = re.compile(r'^(\s*)\*(\s+)')
+
+# Common patterns to detect a code block's language from its start
+CODE_LANGUAGE_RES = [(re.compile(pattern, re.IGNORECASE | re.MULTILINE), language) for pattern, language in [
+    (r'(#!/usr/bin/env python|#!/usr/bin/python|import |from |def |class )', 'python'),
+    (r'(#!/bin/bash|#!/bin/sh|\$ |sudo |apt |pip |npm )', 'bash'),
+    (r'(\{|\[|"[^"]*":\s*)', 'json'),
+    (r'([a-zA-Z_][a-zA-Z0-9_]*:\s*\n|\s*-\s+[a-zA-Z])', 'yaml'),
+    (r'(<[^>]+>|<!DOCTYPE)', 'html'),
+    (r'(SELECT |INSERT |UPDATE |DELETE |CREATE )', 'sql'),
+]]
+
+def _detect_code_language(block_lines):
+    """Detect the language of a code block from its first line(s)."""
+    # The closing fence's newline is part of the text the patterns see
+    block = '\n'.join(block_lines) + '\n'
+    for regex, language in CODE_LANGUAGE_RES:
+        if regex.match(block):
+            return language
+    return None
+
 class DocumentFormatter:
-    def __init__(self, dry_run=False):
+    def __init__(self, dry_run=False, diff=False):
         self.dry_run = dry_run
         self.changes_made = []
+        self.results = []
+        self.pipeline = FixPipeline([
+            self._fix_trailing_whitespace,
+            self._fix_bullets,
+            self._add_metadata,
+            # Fix common code block language issues
+            label_code_blocks(_detect_code_language, "Fixed code block language specification"),
+        ], dry_run=dry_run, diff=diff)
         
     def fix_file(self, filepath):
-        """Fix formatting issues in a single file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-        except Exception as e:
-            print(f"❌ Cannot read {filepath}: {e}")
+        """Fix formatting issues in a single file, in one streaming pass."""
+        return self._report(self.pipeline.fix_file(filepath))
+        
+    def fix_files(self, filepaths, jobs=1):
+        """Fix a list of files across ``jobs`` worker processes.
+        
+        Results are reported in the order of ``filepaths``. Returns the
+        number of files processed successfully.
+        """
+        return sum(self._report(result) for result in self.pipeline.fix_files(filepaths, jobs))
+        
+    def _report(self, result):
+        """Print one file's result and add it to the change log."""
+        filepath = result['file']
+        self.results.append(result)
+        if not result['success']:
+            print(f"❌ Cannot fix {filepath}: {result['error']}")
             return False
             
-        content = original_content
-        changes = []
-        
-        # Fix trailing whitespace
-        lines = content.split('\n')
-        fixed_lines = []
-        for i, line in enumerate(lines):
-            original_line = line
-            line = line.rstrip()
-            if original_line != line:
-                changes.append(f"Line {i+1}: Removed trailing whitespace")
-            fixed_lines.append(line)
-        content = '\n'.join(fixed_lines)
-        
-        # Fix bullet points (* to -)
-        bullet_pattern = r'^(\s*)\*(\s+)'
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if re.match(bullet_pattern, line):
-                new_line = re.sub(bullet_pattern, r'\1-\2', line)
-                if new_line != line:
-                    lines[i] = new_line
-                    changes.append(f"Line {i+1}: Changed * to - for bullet point")
-        content = '\n'.join(lines)
-        
-        # Add metadata block if missing (for main docs, not prompts/archives)
-        if self._should_add_metadata(filepath):
-            if not self._has_metadata_block(content):
-                metadata = self._generate_metadata_block(filepath)
-                # Insert after title
-                lines = content.split('\n')
-                title_line = -1
-                for i, line in enumerate(lines):
-                    if line.startswith('# '):
-                        title_line = i
-                        break
-                        
-                if title_line >= 0:
-                    lines.insert(title_line + 1, '')
-                    lines.insert(title_line + 2, metadata)
-                    content = '\n'.join(lines)
-                    changes.append("Added missing metadata block")
-        
-        # Fix common code block language issues
-        content = self._fix_code_blocks(content, changes)
-        
-        # Save changes if any were made
-        if content != original_content:
-            if not self.dry_run:
-                try:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    print(f"✅ Fixed {filepath}")
-                    for change in changes:
-                        print(f"   - {change}")
-                except Exception as e:
-                    print(f"❌ Cannot write {filepath}: {e}")
-                    return False
+        changes = result['changes']
+        if changes:
+            if result.get('skipped'):
+                print(f"⚠️  Skipped {filepath}: {result['skipped']}")
+            elif not self.dry_run:
+                print(f"✅ Fixed {filepath}")
             else:
                 print(f"🔍 Would fix {filepath}:")
-                for change in changes:
-                    print(f"   - {change}")
+            for change in changes:
+                print(f"   - {change}")
+            if result.get('diff'):
+                print(result['diff'], end='')
                     
-            self.changes_made.extend([(filepath, change) for change in changes])
-            return True
+            if not result.get('skipped'):
+                self.changes_made.extend([(filepath, change) for change in changes])
         else:
             print(f"✅ No changes needed for {filepath}")
-            return True
+        return True
+        
+    def _fix_trailing_whitespace(self, lines, ctx):
+        """Remove trailing whitespace."""
+        for i, line in enumerate(lines):
+            stripped = line.rstrip()
+            if stripped != line:
+                ctx.change(f"Line {i+1}: Removed trailing whitespace")
+            yield stripped
+            
+    def _fix_bullets(self, lines, ctx):
+        """Convert bullet points from * to -."""
+        for i, line in enumerate(lines):
+            if BULLET_RE.match(line):
+                new_line = BULLET_RE.sub(r'\1-\2', line)
+                if new_line != line:
+                    line = new_line
+                    ctx.change(f"Line {i+1}: Changed * to - for bullet point")
+            yield line
             
+    def _add_metadata(self, lines, ctx):
+        """Add metadata block after the title if missing (for main docs, not prompts/archives)."""
+        if not self._should_add_metadata(ctx.filepath) or self._has_metadata_block(ctx.doc):
+            yield from lines
+            return
+            
+        for line in lines:
+            yield line
+            if line.startswith('# '):
+                # Insert after title
+                yield ''
+                yield from self._generate_metadata_block(ctx.filepath).split('\n')
+                ctx.change("Added missing metadata block")
+                break
+        yield from lines
+        
     def _should_add_metadata(self, filepath):
         """Determine if file should have metadata block."""
         # Skip certain file types
@@ -110,9 +136,9 @@ class DocumentFormatter:
         filepath_str = str(filepath).lower()
         return not any(pattern.lower() in filepath_str for pattern in skip_patterns)
         
-    def _has_metadata_block(self, content):
-        """Check if content already has metadata block."""
-        return '> **Document Status:**' in content
+    def _has_metadata_block(self, doc):
+        """Check if the document already has metadata block."""
+        return doc.contains('> **Document Status:**')
         
     def _generate_metadata_block(self, filepath):
         """Generate appropriate metadata block."""
@@ -135,31 +161,6 @@ class DocumentFormatter:
 > **Version:** 1.0.0  
 > **Scope:** Phase 1"""
 
-    def _fix_code_blocks(self, content, changes):
-        """Fix common code block language specification issues."""
-        # Pattern for code blocks without language
-        pattern = r'```\n'
-        
-        # Common patterns to detect language
-        replacements = [
-            (r'```\n(#!/usr/bin/env python|#!/usr/bin/python|import |from |def |class )', r'```python\n\1'),
-            (r'```\n(#!/bin/bash|#!/bin/sh|\$ |sudo |apt |pip |npm )', r'```bash\n\1'),
-            (r'```\n(\{|\[|"[^"]*":\s*)', r'```json\n\1'),
-            (r'```\n([a-zA-Z_][a-zA-Z0-9_]*:\s*\n|\s*-\s+[a-zA-Z])', r'```yaml\n\1'),
-            (r'```\n(<[^>]+>|<!DOCTYPE)', r'```html\n\1'),
-            (r'```\n(SELECT |INSERT |UPDATE |DELETE |CREATE )', r'```sql\n\1'),
-        ]
-        
-        original_content = content
-        for pattern, replacement in replacements:
-            new_content = re.sub(pattern, replacement, content, flags=re.IGNORECASE | re.MULTILINE)
-            if new_content != content:
-                changes.append("Fixed code block language specification")
-                content = new_content
-                break  # Only apply first match to avoid conflicts
-                
-        return content
-        
     def get_summary(self):
         """Get summary of changes made."""
         if not self.changes_made:
@@ -190,10 +191,15 @@ def main():
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be changed without making changes')
     parser.add_argument('--files', nargs='*', help='Specific files to fix')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--diff', action='store_true',
+                       help='Print a unified diff of every changed file')
+    parser.add_argument('--change-log', help='Write a JSON change log to this file')
     
     args = parser.parse_args()
     
-    formatter = DocumentFormatter(dry_run=args.dry_run)
+    formatter = DocumentFormatter(dry_run=args.dry_run, diff=args.diff)
     
     if args.files:
         # Fix specific files
@@ -214,15 +220,16 @@ def main():
     print(f"🔧 {action} {len(files_to_fix)} markdown files...")
     print()
     
-    success_count = 0
-    for filepath in files_to_fix:
-        if formatter.fix_file(filepath):
-            success_count += 1
+    success_count = formatter.fix_files(files_to_fix, jobs=args.jobs)
             
     print()
     print(f"📊 Summary: {success_count}/{len(files_to_fix)} files processed successfully")
     print(formatter.get_summary())
     
+    if args.change_log:
+        write_change_log(args.change_log, formatter.results, args.dry_run)
+        print(f"📄 Change log saved to {args.change_log}")
+    
     if args.dry_run:
         print("\n💡 Run without --dry-run to apply these changes")
 
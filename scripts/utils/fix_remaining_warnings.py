@@ -1,129 +1,168 @@
 #!/usr/bin/env python3
 """
 Fix remaining common warnings in documentation.
+
+Generated tables of contents carry a hidden ``<!-- toc-outline: HASH -->``
+comment with a hash of the document's header outline (level 2-4 headers).
+A document whose outline still matches its hash needs neither a new TOC
+nor an Overview check and is passed through untouched; when the outline
+changed, only the TOC's entry lines are rewritten.
 """
 
+import hashlib
 import os
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
-def fix_code_block_languages(content: str) -> Tuple[str, List[str]]:
-    """Add language specifications to code blocks where possible."""
-    changes = []
-    
-    # More comprehensive language detection patterns
-    patterns = [
-        # Python
-        (r'```\n(#!/usr/bin/env python|#!/usr/bin/python|import |from |def |class |if __name__|print\()', r'```python\n\1'),
-        # Bash/Shell
-        (r'```\n(#!/bin/bash|#!/bin/sh|\$ |sudo |apt |pip install|npm |cd |ls |mkdir |chmod)', r'```bash\n\1'),
-        # JSON
-        (r'```\n(\s*\{[\s\S]*?"[^"]*":\s*)', r'```json\n\1'),
-        # YAML
-        (r'```\n([a-zA-Z_][a-zA-Z0-9_]*:\s*\n|\s*-\s+[a-zA-Z]|version:|services:|environment:)', r'```yaml\n\1'),
-        # HTML
-        (r'```\n(<[^>]+>|<!DOCTYPE)', r'```html\n\1'),
-        # SQL
-        (r'```\n(SELECT |INSERT |UPDATE |DELETE |CREATE |ALTER )', r'```sql\n\1'),
-        # C++/Arduino
-        (r'```\n(#include|void setup\(\)|void loop\(\)|digitalWrite|digitalRead)', r'```cpp\n\1'),
-        # Markdown
-        (r'```\n(# |## |### |\[.*\]\(.*\))', r'```markdown\n\1'),
-        # XML
-        (r'```\n(<\?xml|<[a-zA-Z][^>]*>)', r'```xml\n\1'),
-    ]
-    
-    for pattern, replacement in patterns:
-        new_content = re.sub(pattern, replacement, content, flags=re.IGNORECASE | re.MULTILINE)
-        if new_content != content:
-            changes.append("Fixed code block language specification")
-            content = new_content
-            break  # Only apply first match to avoid conflicts
-    
-    return content, changes
+from fix_engine import FixPipeline, write_change_log, label_code_blocks
+from markdown_tokens import tokenize, HEADER
 
-def add_overview_section(content: str, filepath: str) -> Tuple[str, List[str]]:
-    """Add Overview section if missing."""
-    changes = []
-    
-    # Check if Overview section already exists
-    if '## Overview' in content or '# Overview' in content:
-        return content, changes
-    
-    lines = content.split('\n')
+TOC_TITLE = "## Table of Contents"
+TOC_MARKER = "<!-- toc-outline: {} -->"
+TOC_MARKER_RE = re.compile(r'^<!-- toc-outline: ([0-9a-f]+) -->\s*$')
+# Lines of a TOC body that a refresh replaces
+TOC_ENTRY_RE = re.compile(r'^\s*(- \[.*\]\(#.*\))?\s*$')
+
+# Language detection patterns, matched against the start of a code block
+CODE_LANGUAGE_PATTERNS = [
+    # Python
+    (r'(#!/usr/bin/env python|#!/usr/bin/python|import |from |def |class |if __name__|print\()', 'python'),
+    # Bash/Shell
+    (r'(#!/bin/bash|#!/bin/sh|\$ |sudo |apt |pip install|npm |cd |ls |mkdir |chmod)', 'bash'),
+    # JSON
+    (r'(\s*\{[\s\S]*?"[^"]*":\s*)', 'json'),
+    # YAML
+    (r'([a-zA-Z_][a-zA-Z0-9_]*:\s*\n|\s*-\s+[a-zA-Z]|version:|services:|environment:)', 'yaml'),
+    # HTML
+    (r'(<[^>]+>|<!DOCTYPE)', 'html'),
+    # SQL
+    (r'(SELECT |INSERT |UPDATE |DELETE |CREATE |ALTER )', 'sql'),
+    # C++/Arduino
+    (r'(#include|void setup\(\)|void loop\(\)|digitalWrite|digitalRead)', 'cpp'),
+    # Markdown
+    (r'(# |## |### |\[.*\]\(.*\))', 'markdown'),
+    # XML
+    (r'(<\?xml|<[a-zA-Z][^>]*>)', 'xml'),
+]
+CODE_LANGUAGE_RES = [(re.compile(pattern, re.IGNORECASE | re.MULTILINE), language)
+                     for pattern, language in CODE_LANGUAGE_PATTERNS]
+
+def _detect_block_language(block_lines: List[str]) -> Optional[str]:
+    """Language of the first pattern matching the start of a code block."""
+    # The closing fence's newline is part of the text the patterns see
+    block = '\n'.join(block_lines) + '\n'
+    for regex, language in CODE_LANGUAGE_RES:
+        if regex.match(block):
+            return language
+    return None
+
+fix_code_block_languages = label_code_blocks(
+    _detect_block_language, "Fixed code block language specification")
+
+def _overview_text(filepath: str) -> str:
+    """Generate appropriate overview text based on filename."""
+    filename = os.path.basename(filepath).lower()
+    if 'guide' in filename:
+        return "This guide provides step-by-step instructions for implementation and configuration."
+    elif 'design' in filename:
+        return "This document outlines the design architecture and implementation approach."
+    elif 'spec' in filename:
+        return "This specification defines the technical requirements and constraints."
+    elif 'api' in filename:
+        return "This document describes the API interfaces and usage patterns."
+    return "This document provides detailed information and implementation guidance."
+
+def _outline(headers) -> List[Tuple[int, str]]:
+    """(level, text) of the level 2-4 headers a TOC lists, minus the TOC's own."""
+    return [(header['level'], header['text']) for header in headers
+            if 2 <= header['level'] <= 4 and header['text'] != 'Table of Contents']
+
+def _stream_headers(lines) -> List[dict]:
+    """Headers (outside code blocks) of lines taken from the fixer stream."""
+    return [{'level': token.level, 'text': token.text, 'line': token.line}
+            for token in tokenize(line + '\n' for line in lines) if token.kind == HEADER]
+
+def _outline_hash(outline: List[Tuple[int, str]]) -> str:
+    """Short hash identifying a header outline."""
+    text = '\n'.join(f"{level} {text}" for level, text in outline)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+def _toc_marker(doc) -> Optional[Tuple[str, int]]:
+    """(outline hash, line number) of a document's TOC marker, or None."""
+    if not doc.contains('<!-- toc-outline: '):
+        return None
+    for line_num, line in enumerate(doc.iter_lines(), 1):
+        match = TOC_MARKER_RE.match(line)
+        if match:
+            return match.group(1), line_num
+    return None
+
+def _outline_unchanged(doc) -> bool:
+    """True if the document's TOC marker matches its current outline."""
+    marker = _toc_marker(doc)
+    return marker is not None and marker[0] == _outline_hash(_outline(doc.headers))
+
+def _toc_entries(outline: List[Tuple[int, str]]) -> List[str]:
+    """TOC list lines for an outline."""
+    entries = []
+    for level, text in outline:
+        anchor = text.lower().replace(' ', '-').replace('(', '').replace(')', '').replace(',', '').replace('.', '')
+        indent = "  " * (level - 2)  # Level 2 = no indent, Level 3 = 2 spaces, etc.
+        entries.append(f"{indent}- [{text}](#{anchor})")
+    return entries
+
+def add_overview_section(lines: Iterator[str], ctx) -> Iterator[str]:
+    """Add Overview section after the main title if missing."""
+    # An outline matching the TOC marker was already checked when the TOC
+    # was generated; check if Overview section already exists ('## Overview'
+    # contains it too)
+    if _outline_unchanged(ctx.doc) or ctx.doc.contains('# Overview'):
+        yield from lines
+        return
     
-    # Find the first header after metadata
-    insert_line = -1
     in_yaml = False
-    
-    for i, line in enumerate(lines):
+    for line in lines:
+        yield line
         if line.strip() == '---':
             in_yaml = not in_yaml
             continue
         
         if not in_yaml and line.startswith('# '):
             # Found main title, insert Overview after it
-            insert_line = i + 1
+            yield from ["", "## Overview", "", _overview_text(ctx.filepath), ""]
+            ctx.change("Added Overview section")
             break
-    
-    if insert_line > 0:
-        # Generate appropriate overview text based on filename
-        filename = os.path.basename(filepath)
-        
-        if 'guide' in filename.lower():
-            overview_text = "This guide provides step-by-step instructions for implementation and configuration."
-        elif 'design' in filename.lower():
-            overview_text = "This document outlines the design architecture and implementation approach."
-        elif 'spec' in filename.lower():
-            overview_text = "This specification defines the technical requirements and constraints."
-        elif 'api' in filename.lower():
-            overview_text = "This document describes the API interfaces and usage patterns."
-        else:
-            overview_text = "This document provides detailed information and implementation guidance."
-        
-        overview_section = [
-            "",
-            "## Overview",
-            "",
-            overview_text,
-            ""
-        ]
-        
-        # Insert overview section
-        for j, overview_line in enumerate(overview_section):
-            lines.insert(insert_line + j, overview_line)
-        
-        changes.append("Added Overview section")
-        content = '\n'.join(lines)
-    
-    return content, changes
+    yield from lines
 
-def add_table_of_contents(content: str) -> Tuple[str, List[str]]:
-    """Add Table of Contents for long documents."""
-    changes = []
+def add_table_of_contents(lines: Iterator[str], ctx) -> Iterator[str]:
+    """Add Table of Contents for long documents, or refresh a generated one."""
+    marker = _toc_marker(ctx.doc)
+    if marker is not None:
+        yield from _refresh_table_of_contents(lines, ctx, *marker)
+        return
     
-    # Check if TOC already exists
-    if 'Table of Contents' in content or '## Contents' in content:
-        return content, changes
+    # Leave hand-written TOCs alone
+    if ctx.doc.contains('Table of Contents') or ctx.doc.contains('## Contents'):
+        yield from lines
+        return
     
-    lines = content.split('\n')
+    # The TOC lists every header, so it can only be placed once the whole
+    # document has been seen
+    lines = list(lines)
     
     # Only add TOC if document is long (>100 lines) and has multiple sections
     if len(lines) < 100:
-        return content, changes
+        yield from lines
+        return
     
-    # Extract headers
-    headers = []
-    for line in lines:
-        if re.match(r'^#{2,4}\s+', line):  # Level 2-4 headers
-            level = len(line) - len(line.lstrip('#'))
-            text = line.strip('#').strip()
-            anchor = text.lower().replace(' ', '-').replace('(', '').replace(')', '').replace(',', '').replace('.', '')
-            headers.append((level, text, anchor))
+    # Extract headers (outside code blocks) from the stream, which may
+    # already include headers added by earlier fixers
+    outline = _outline(_stream_headers(lines))
     
     # Only add TOC if there are enough sections
-    if len(headers) < 3:
-        return content, changes
+    if len(outline) < 3:
+        yield from lines
+        return
     
     # Find where to insert TOC (after Overview section if it exists)
     insert_line = -1
@@ -149,71 +188,65 @@ def add_table_of_contents(content: str) -> Tuple[str, List[str]]:
     if insert_line > 0:
         toc_lines = [
             "",
-            "## Table of Contents",
+            TOC_TITLE,
+            TOC_MARKER.format(_outline_hash(outline)),
             ""
         ]
-        
-        for level, text, anchor in headers:
-            indent = "  " * (level - 2)  # Level 2 = no indent, Level 3 = 2 spaces, etc.
-            toc_lines.append(f"{indent}- [{text}](#{anchor})")
-        
+        toc_lines.extend(_toc_entries(outline))
         toc_lines.append("")
         toc_lines.append("---")
         toc_lines.append("")
         
-        # Insert TOC
-        for j, toc_line in enumerate(toc_lines):
-            lines.insert(insert_line + j, toc_line)
-        
-        changes.append("Added Table of Contents")
-        content = '\n'.join(lines)
+        lines[insert_line:insert_line] = toc_lines
+        ctx.change("Added Table of Contents")
     
-    return content, changes
+    yield from lines
+
+def _refresh_table_of_contents(lines: Iterator[str], ctx, stored_hash: str, marker_line: int) -> Iterator[str]:
+    """Rewrite a generated TOC's entries if the outline changed since it was made.
+    
+    Headers after the TOC come from the parsed document; headers before
+    it are taken from the stream, since earlier fixers (the Overview
+    section) insert there. Nothing is buffered past the TOC.
+    """
+    lines = iter(lines)
+    before = []
+    for line in lines:
+        if not TOC_MARKER_RE.match(line):
+            before.append(line)
+            yield line
+            continue
+        
+        outline = _outline(_stream_headers(before))
+        outline += _outline(header for header in ctx.doc.headers if header['line'] > marker_line)
+        new_hash = _outline_hash(outline)
+        if new_hash == stored_hash:
+            yield line
+            yield from lines
+            return
+        
+        # Drop the old entries (and blank lines around them), keep what follows
+        following = None
+        for candidate in lines:
+            if not TOC_ENTRY_RE.match(candidate):
+                following = candidate
+                break
+        yield TOC_MARKER.format(new_hash)
+        yield ""
+        yield from _toc_entries(outline)
+        yield ""
+        if following is not None:
+            yield following
+        ctx.change("Updated Table of Contents")
+        break
+    yield from lines
+
+# Line-stream fixers applied by process_file, in order
+FIXERS = [fix_code_block_languages, add_overview_section, add_table_of_contents]
 
 def process_file(filepath: str, dry_run: bool = False) -> dict:
     """Process a single file to fix warnings."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-    except Exception as e:
-        return {
-            'file': filepath,
-            'changes': [],
-            'success': False,
-            'error': str(e)
-        }
-    
-    content = original_content
-    all_changes = []
-    
-    # Apply fixes
-    content, changes = fix_code_block_languages(content)
-    all_changes.extend(changes)
-    
-    content, changes = add_overview_section(content, filepath)
-    all_changes.extend(changes)
-    
-    content, changes = add_table_of_contents(content)
-    all_changes.extend(changes)
-    
-    # Write back if changes were made and not dry run
-    if all_changes and not dry_run:
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-        except Exception as e:
-            return {
-                'file': filepath,
-                'changes': all_changes,
-                'success': False,
-                'error': str(e)
-            }
-    
-    return {
-        'file': filepath,
-        'changes': all_changes,
-        'success': True
-    }
+    return FixPipeline(FIXERS, dry_run=dry_run).fix_file(filepath)
 
 def main():
     """Fix remaining warnings in documentation."""
@@ -223,6 +256,10 @@ def main():
     parser.add_argument('--directory', default='a2-docs', help='Directory to process')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed')
     parser.add_argument('--files', nargs='*', help='Specific files to process')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--diff', action='store_true', help='Print a unified diff of every changed file')
+    parser.add_argument('--change-log', help='Write a JSON change log to this file')
     
     args = parser.parse_args()
     
@@ -248,23 +285,32 @@ def main():
     total_changes = 0
     modified_files = 0
     
-    for filepath in files_to_process:
-        result = process_file(filepath, args.dry_run)
-        
+    pipeline = FixPipeline(FIXERS, dry_run=args.dry_run, diff=args.diff)
+    results = pipeline.fix_files(files_to_process, jobs=args.jobs)
+    for result in results:
         if result['success']:
             if result['changes']:
-                modified_files += 1
-                total_changes += len(result['changes'])
-                status = "Would fix" if args.dry_run else "Fixed"
-                print(f"✅ {status} {result['file']}")
+                if result.get('skipped'):
+                    print(f"⚠️  Skipped {result['file']}: {result['skipped']}")
+                else:
+                    modified_files += 1
+                    total_changes += len(result['changes'])
+                    status = "Would fix" if args.dry_run else "Fixed"
+                    print(f"✅ {status} {result['file']}")
                 for change in result['changes']:
                     print(f"   - {change}")
+                if result.get('diff'):
+                    print(result['diff'], end='')
         else:
             print(f"❌ Error processing {result['file']}: {result.get('error', 'Unknown error')}")
     
     # Summary
     action = "would be modified" if args.dry_run else "modified"
     print(f"\n📊 Summary: {modified_files} files {action} with {total_changes} total changes.")
+    
+    if args.change_log:
+        write_change_log(args.change_log, results, args.dry_run)
+        print(f"📄 Change log saved to {args.change_log}")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
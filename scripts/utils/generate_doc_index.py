@@ -1,14 +1,131 @@
 #!/usr/bin/env python3
-"""Generate living documentation index for A2 project."""
+"""Generate living documentation index for A2 project.
+
+Each document is read once: extract_metadata() parses its status, last
+updated date and title from the first METADATA_BYTES, where the
+``> **Document Status:**`` block and the title live. Extraction runs on a
+thread pool (--jobs) and is cached in DIR/.doc_index_cache.json by
+(size, mtime), so regenerating the index only reads changed documents.
+"""
 
 import os
+import sys
+import argparse
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import re
 
-def generate_index():
-    """Generate DOCUMENTATION_INDEX.md"""
-    doc_dir = Path("/home/waragainstwork/A2/a2-docs")
+# Bytes read from the start of each document for its metadata
+METADATA_BYTES = 8192
+STATUS_RE = re.compile(r'Document Status:\*\* (\w+)')
+DATE_RE = re.compile(r'Last Updated:\*\* ([\d-]+)')
+
+def extract_metadata(filepath):
+    """Status, last updated date and title of a document, from its first few KB."""
+    with open(filepath, 'rb') as f:
+        head = f.read(METADATA_BYTES)
+    text = head.decode('utf-8', errors='ignore')
+    lines = text.split('\n')
+    if len(head) == METADATA_BYTES:
+        lines = lines[:-1]  # The last line may be cut off
+    
+    status_match = STATUS_RE.search(text)
+    date_match = DATE_RE.search(text)
+    
+    # First title that is not the project banner
+    title = None
+    for line in lines:
+        if line.startswith('# ') and not line.startswith('# A2'):
+            title = line.strip('# ')
+            break
+    
+    return {
+        'status': status_match.group(1) if status_match else "Unknown",
+        'last_updated': date_match.group(1) if date_match else "Unknown",
+        'title': title
+    }
+
+def _temp_file(path):
+    """Create a unique temp file next to ``path``; returns (fd, temp path)."""
+    directory, name = os.path.split(os.fspath(path))
+    return tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory or '.')
+
+class MetadataCache:
+    """Persisted per-document metadata, keyed by file name.
+    
+    Entries are reused while a document's size and mtime are unchanged;
+    documents that disappeared are dropped on save.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.files = {}
+        self.stats = {'reused': 0, 'extracted': 0}
+        
+    def load(self):
+        """Load the cache file, discarding it if it is stale or unreadable."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.VERSION:
+            self.files = data.get('files', {})
+            
+    def save(self):
+        """Write the cache file atomically."""
+        fd, tmp_path = _temp_file(self.cache_path)
+        try:
+            # mkstemp creates the file private; give it the usual mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'files': self.files}, f)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        
+    def metadata(self, filepaths, jobs=1):
+        """Metadata for every path, extracting only new or changed documents."""
+        stale = []
+        current = {}
+        for filepath in filepaths:
+            st = os.stat(filepath)
+            entry = self.files.get(filepath.name)
+            if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+                current[filepath.name] = entry
+            else:
+                stale.append((filepath, st))
+                
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        paths = [filepath for filepath, _ in stale]
+        if jobs <= 1 or len(paths) < 2:
+            extracted = [extract_metadata(filepath) for filepath in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                extracted = list(pool.map(extract_metadata, paths))
+        for (filepath, st), metadata in zip(stale, extracted):
+            current[filepath.name] = dict(metadata, size=st.st_size, mtime=st.st_mtime_ns)
+            
+        self.stats = {'reused': len(filepaths) - len(stale), 'extracted': len(stale)}
+        self.files = current
+        return {filepath: current[filepath.name] for filepath in filepaths}
+
+def generate_index(doc_dir, output=None, jobs=1, cache_path=None):
+    """Generate DOCUMENTATION_INDEX.md for ``doc_dir``; returns its path.
+    
+    ``cache_path`` of None uses DIR/.doc_index_cache.json; pass False to
+    extract everything without a cache.
+    """
+    doc_dir = Path(doc_dir)
     
     categories = {
         "Architecture": ["-overview", "-architecture", "-design"],
@@ -36,6 +153,14 @@ def generate_index():
         if not categorized:
             docs_by_category["Other"].append(md_file)
     
+    # Extract the metadata of every document once
+    cache = MetadataCache(doc_dir / ".doc_index_cache.json" if cache_path is None else cache_path)
+    if cache_path is not False:
+        cache.load()
+    metadata = cache.metadata([doc for docs in docs_by_category.values() for doc in docs], jobs=jobs)
+    if cache_path is not False:
+        cache.save()
+    
     # Generate index content
     content = f"""# A2 Robot Documentation Index
 
@@ -60,26 +185,11 @@ def generate_index():
         content += "|----------|--------|--------------|-------------|\n"
         
         for doc in docs:
-            # Extract metadata
-            doc_content = doc.read_text()
-            status = "Unknown"
-            last_updated = "Unknown"
+            status = metadata[doc]['status']
+            last_updated = metadata[doc]['last_updated']
             
-            status_match = re.search(r'Document Status:\*\* (\w+)', doc_content)
-            if status_match:
-                status = status_match.group(1)
-                
-            date_match = re.search(r'Last Updated:\*\* ([\d-]+)', doc_content)
-            if date_match:
-                last_updated = date_match.group(1)
-                
-            # Get first line as description
-            for line in doc_content.split('\n'):
-                if line.startswith('# ') and not line.startswith('# A2'):
-                    first_line = line.strip('# ')
-                    break
-            else:
-                first_line = doc.stem.replace('-', ' ').title()
+            # Title as description, falling back to the file name
+            first_line = metadata[doc]['title'] or doc.stem.replace('-', ' ').title()
             
             # Status emoji
             status_emoji = {
@@ -93,9 +203,10 @@ def generate_index():
     # Add statistics section
     content += f"\n## Documentation Statistics\n\n"
     content += f"- **Total Documents**: {sum(len(docs) for docs in docs_by_category.values())}\n"
-    content += f"- **Current**: {sum(1 for cat in docs_by_category.values() for doc in cat if 'CURRENT' in doc.read_text())}\n"
-    content += f"- **Draft**: {sum(1 for cat in docs_by_category.values() for doc in cat if 'DRAFT' in doc.read_text())}\n"
-    content += f"- **Deprecated**: {sum(1 for cat in docs_by_category.values() for doc in cat if 'DEPRECATED' in doc.read_text())}\n"
+    statuses = [entry['status'] for entry in metadata.values()]
+    content += f"- **Current**: {statuses.count('CURRENT')}\n"
+    content += f"- **Draft**: {statuses.count('DRAFT')}\n"
+    content += f"- **Deprecated**: {statuses.count('DEPRECATED')}\n"
     
     content += "\n## Maintenance Notes\n\n"
     content += "This index is auto-generated. To update:\n"
@@ -104,9 +215,29 @@ def generate_index():
     content += "```\n"
     
     # Save index
-    index_path = doc_dir / "DOCUMENTATION_INDEX.md"
+    index_path = Path(output) if output else doc_dir / "DOCUMENTATION_INDEX.md"
     index_path.write_text(content)
-    print(f"✅ Generated: {index_path}")
+    print(f"✅ Generated: {index_path} ({cache.stats['extracted']} documents read, "
+          f"{cache.stats['reused']} from cache)")
+    return index_path
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the A2 documentation index')
+    parser.add_argument('directory', nargs='?', default='a2-docs',
+                        help='Documentation directory to index (default: a2-docs)')
+    parser.add_argument('--output', help='Index file to write (default: DIRECTORY/DOCUMENTATION_INDEX.md)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Threads extracting metadata (default: 1, 0 = one per CPU)')
+    parser.add_argument('--cache-file', help='Metadata cache (default: DIRECTORY/.doc_index_cache.json)')
+    parser.add_argument('--no-cache', action='store_true', help='Read every document, ignoring the cache')
+    args = parser.parse_args()
+    
+    if not os.path.isdir(args.directory):
+        print(f"❌ Directory '{args.directory}' not found")
+        return 1
+    generate_index(args.directory, output=args.output, jobs=args.jobs,
+                   cache_path=False if args.no_cache else args.cache_file)
+    return 0
 
 if __name__ == "__main__":
-    generate_index()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
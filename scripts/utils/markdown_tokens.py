@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Streaming Markdown Tokenizer
+
+Single pass over a markdown document that yields:
+- ATX headers (``# Title``)
+- Inline links (``[text](url)``)
+- Reference-style links (``[text][label]``, ``[label][]``) and their
+  definitions (``[label]: url``)
+- Code fence boundaries (```` ``` ```` / ``~~~``)
+
+Lines inside fenced code blocks and inline code spans never produce
+headers or links, and ``[i][j]`` directly after an identifier (``arr[i][j]``,
+``matrix[0][1]``) is an index expression, not a reference link. Shared by
+check_links.py and fix_broken_links.py.
+"""
+
+import io
+import re
+from typing import Iterable, Iterator, NamedTuple, Union
+
+# Token kinds
+HEADER = 'header'
+LINK = 'link'
+REF_LINK = 'ref_link'
+REF_DEF = 'ref_def'
+FENCE_OPEN = 'fence_open'
+FENCE_CLOSE = 'fence_close'
+
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})(.*)$')
+HEADER_RE = re.compile(r'^(#{1,6})\s+(.+)')
+REF_DEF_RE = re.compile(r'^ {0,3}\[([^\]]+)\]:\s*<?([^\s>]+)>?')
+LINK_RE = re.compile(r'\[([^\]]*)\](?:\(([^)]+)\)|\[([^\]]*)\])')
+CODE_SPAN_RE = re.compile(r'(`+)(.+?)\1')
+
+
+class Token(NamedTuple):
+    """A markdown token.
+
+    ``text`` is the header text, link text, reference label or fence info
+    string; ``target`` is the link destination (or reference label for
+    REF_LINK). ``start``/``end`` are absolute character offsets of the
+    token in the document.
+    """
+    kind: str
+    line: int
+    text: str = ''
+    target: str = ''
+    level: int = 0
+    start: int = 0
+    end: int = 0
+
+
+def normalize_label(label: str) -> str:
+    """Normalize a reference label for case-insensitive matching."""
+    return ' '.join(label.split()).lower()
+
+
+def _mask_code_spans(line: str) -> str:
+    """Blank out inline code spans while keeping character positions."""
+    if '`' not in line:
+        return line
+    return CODE_SPAN_RE.sub(lambda m: ' ' * len(m.group(0)), line)
+
+
+def _is_index_expression(line: str, start: int) -> bool:
+    """True if the brackets at ``start`` subscript the word or call before them."""
+    if not start:
+        return False
+    previous = line[start - 1]
+    return previous.isalnum() or previous in '_])'
+
+
+def tokenize(source: Union[str, Iterable[str]]) -> Iterator[Token]:
+    """Yield tokens from a markdown string or an iterable of lines.
+
+    File objects are consumed lazily, so large documents are never held
+    in memory as a list of lines.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+
+    offset = 0
+    fence = None  # (fence char, fence length) while inside a code block
+
+    for line_num, raw_line in enumerate(source, 1):
+        line = raw_line.rstrip('\r\n')
+        line_start = offset
+        offset += len(raw_line)
+
+        fence_match = FENCE_RE.match(line) if ('`' in line or '~' in line) else None
+        if fence is not None:
+            if fence_match:
+                marker = fence_match.group(1)
+                if (marker[0] == fence[0] and len(marker) >= fence[1]
+                        and not fence_match.group(2).strip()):
+                    fence = None
+                    yield Token(FENCE_CLOSE, line_num, start=line_start, end=line_start + len(line))
+            continue
+
+        if fence_match and not (fence_match.group(1)[0] == '`' and '`' in fence_match.group(2)):
+            marker = fence_match.group(1)
+            fence = (marker[0], len(marker))
+            yield Token(FENCE_OPEN, line_num, text=fence_match.group(2).strip(),
+                        start=line_start, end=line_start + len(line))
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith('#'):
+            header_match = HEADER_RE.match(stripped)
+            if header_match:
+                yield Token(HEADER, line_num, text=header_match.group(2).strip(),
+                            level=len(header_match.group(1)),
+                            start=line_start, end=line_start + len(line))
+                continue
+
+        if '[' not in line:
+            continue
+
+        ref_match = REF_DEF_RE.match(line)
+        if ref_match:
+            yield Token(REF_DEF, line_num, text=ref_match.group(1), target=ref_match.group(2),
+                        start=line_start, end=line_start + ref_match.end())
+            continue
+
+        masked = _mask_code_spans(line)
+        for match in LINK_RE.finditer(masked):
+            if match.group(2) is None and _is_index_expression(masked, match.start()):
+                continue
+            start, end = line_start + match.start(), line_start + match.end()
+            text = line[match.start(1):match.end(1)]
+            if match.group(2) is not None:
+                yield Token(LINK, line_num, text=text,
+                            target=line[match.start(2):match.end(2)], start=start, end=end)
+            else:
+                label = line[match.start(3):match.end(3)] or text
+                yield Token(REF_LINK, line_num, text=text, target=label, start=start, end=end)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Documentation Search Index
+
+Offline full-text search over the markdown tree, backed by SQLite FTS5:
+- Every header section is one search chunk (headers come from the same
+  tokenizer pass check_links uses, so anchors match its link checks)
+- Text before the first header is indexed as a chunk without an anchor
+- Results are ranked with BM25, header text weighted above body text
+
+The index is stored in one SQLite file and updated incrementally: files
+are re-chunked only when their size/mtime and content hash changed, and
+files that disappeared are dropped.
+"""
+
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import List
+
+from doc_model import get_document
+from check_links import LinkChecker, _hash_file
+
+# BM25 column weights: (title, body)
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+QUERY_TERM_RE = re.compile(r'\w+')
+
+
+class SearchIndex:
+    VERSION = 1
+
+    def __init__(self, db_path, base_directory):
+        self.db_path = str(db_path)
+        self.base_directory = str(Path(base_directory).resolve())
+        self.stats = {'indexed': 0, 'reused': 0, 'removed': 0}
+        self._checker = LinkChecker(base_directory)
+        self.db = sqlite3.connect(self.db_path)
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Create the tables, discarding an index from another version or tree."""
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        if meta.get('version') != str(self.VERSION) or meta.get('base_directory') != self.base_directory:
+            with self.db:
+                self.db.execute("DROP TABLE IF EXISTS files")
+                self.db.execute("DROP TABLE IF EXISTS sections")
+                self.db.execute("DELETE FROM meta")
+                self.db.executemany("INSERT INTO meta VALUES (?, ?)",
+                                    [('version', str(self.VERSION)),
+                                     ('base_directory', self.base_directory)])
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS files "
+                            "(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, hash TEXT)")
+            self.db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5("
+                            "title, body, path UNINDEXED, anchor UNINDEXED, line UNINDEXED, "
+                            "tokenize='porter unicode61')")
+
+    def close(self):
+        self.db.close()
+
+    # -- indexing ----------------------------------------------------------
+
+    def update(self, filepaths, prune=True):
+        """Bring the index up to date with ``filepaths``.
+
+        With ``prune`` (a full-tree run) indexed files missing from
+        ``filepaths`` are removed.
+        """
+        known = {path: (size, mtime, digest) for path, size, mtime, digest
+                 in self.db.execute("SELECT path, size, mtime, hash FROM files")}
+        current = set()
+        self.stats = {'indexed': 0, 'reused': 0, 'removed': 0}
+
+        with self.db:
+            for filepath in filepaths:
+                rel = os.path.relpath(filepath, self.base_directory)
+                current.add(rel)
+                st = os.stat(filepath)
+                entry = known.get(rel)
+                if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                    self.stats['reused'] += 1
+                    continue
+                digest = _hash_file(filepath)
+                if entry and entry[2] == digest:
+                    self.db.execute("UPDATE files SET size = ?, mtime = ? WHERE path = ?",
+                                    (st.st_size, st.st_mtime_ns, rel))
+                    self.stats['reused'] += 1
+                    continue
+                self._index_file(filepath, rel)
+                self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                (rel, st.st_size, st.st_mtime_ns, digest))
+                self.stats['indexed'] += 1
+
+            if prune:
+                for rel in set(known) - current:
+                    self.db.execute("DELETE FROM sections WHERE path = ?", (rel,))
+                    self.db.execute("DELETE FROM files WHERE path = ?", (rel,))
+                    self.stats['removed'] += 1
+
+    def _index_file(self, filepath, rel):
+        """Replace the chunks of one file."""
+        self.db.execute("DELETE FROM sections WHERE path = ?", (rel,))
+        self.db.executemany("INSERT INTO sections (title, body, path, anchor, line) VALUES (?, ?, ?, ?, ?)",
+                            ((title, body, rel, anchor, line)
+                             for title, body, anchor, line in self._chunks(filepath)))
+
+    def _chunks(self, filepath):
+        """Yield (title, body, anchor, line) for every header section of a file.
+
+        A chunk runs from its header to the next header of any level, so
+        text nested under a subheading is indexed only once.
+        """
+        doc = get_document(filepath)
+        headers = self._checker._scan(tokens=doc.tokens)[1]
+        starts = [header['line'] for header in headers] + [doc.line_count + 1]
+
+        if starts[0] > 1:
+            preamble = '\n'.join(doc.iter_lines(1, starts[0] - 1)).strip()
+            if preamble:
+                yield os.path.basename(filepath), preamble, '', 1
+        for header, end in zip(headers, starts[1:]):
+            body = '\n'.join(doc.iter_lines(header['line'] + 1, end - 1))
+            yield header['text'], body, header['anchor'], header['line']
+
+    # -- querying ----------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        """Ranked sections matching every term of ``query``.
+
+        Falls back to matching any term when no section contains all of
+        them. Returns {'path', 'anchor', 'line', 'title', 'score', 'snippet'}
+        dicts, best match first.
+        """
+        terms = QUERY_TERM_RE.findall(query)
+        if not terms:
+            return []
+        quoted = ['"' + term + '"' for term in terms]
+        results = self._match(' '.join(quoted), limit)
+        if not results and len(quoted) > 1:
+            results = self._match(' OR '.join(quoted), limit)
+        return results
+
+    def _match(self, expression, limit):
+        rows = self.db.execute(
+            "SELECT path, anchor, line, title, bm25(sections, ?, ?) AS score, "
+            "snippet(sections, 1, '**', '**', '…', 12) "
+            "FROM sections WHERE sections MATCH ? ORDER BY score LIMIT ?",
+            (TITLE_WEIGHT, BODY_WEIGHT, expression, limit))
+        return [{'path': path, 'anchor': anchor, 'line': line, 'title': title,
+                 'score': -score, 'snippet': ' '.join(snippet.split())}
+                for path, anchor, line, title, score, snippet in rows]
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+A2 Robot Project - Trigram Similarity Index
+
+Fuzzy lookup used to suggest fixes for broken links and anchors:
+- Splits keys into padded, lowercase character trigrams
+- Keeps an inverted index from trigram to entries
+- Ranks candidates by trigram Jaccard similarity
+
+The index is built once per run; a lookup only touches the entries that
+share at least one trigram with the query.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+def trigrams(text: str, n: int = 3) -> set:
+    """Return the set of padded character n-grams of ``text``."""
+    padded = f"{' ' * (n - 1)}{text.lower()} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class TrigramIndex:
+    """Inverted n-gram index over string keys."""
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.values: List[str] = []
+        self.gram_counts: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, key: str, value: Optional[str] = None):
+        """Index ``key``; searches return ``value`` (defaults to the key)."""
+        entry_id = len(self.values)
+        grams = trigrams(key, self.n)
+        self.values.append(key if value is None else value)
+        self.gram_counts.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(entry_id)
+
+    def search(self, query: str, limit: int = 3, threshold: float = 0.3) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (value, score) pairs, best match first."""
+        grams = trigrams(query, self.n)
+        if not grams:
+            return []
+
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for entry_id in self.postings.get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+
+        best: Dict[str, float] = {}
+        for entry_id, common in shared.items():
+            score = common / (len(grams) + self.gram_counts[entry_id] - common)
+            value = self.values[entry_id]
+            if score >= threshold and score > best.get(value, 0):
+                best[value] = score
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
@@ -13,206 +13,336 @@ Validates documentation compliance with the A2 style guide:
 import os
 import re
 import sys
+import time
+import hashlib
 import argparse
 from pathlib import Path
 from datetime import datetime
 import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, NamedTuple
+
+from doc_model import Document, get_document, default_cache
+from doc_profiler import Profiler
+
+# Bump whenever a rule's behaviour changes; cached results from another
+# rule set are discarded
+RULESET_VERSION = 1
+
+# Rule kinds: line rules see every line during the single pass over the
+# document, document rules run once per file
+LINE_RULE = 'line'
+DOCUMENT_RULE = 'document'
+
+UPPERCASE_RE = re.compile(r'[A-Z]')
+HEADER_SPACE_RE = re.compile(r'^#{1,4}\s+')
+BULLET_RE = re.compile(r'^\s*[\*\+]\s')
+STATUS_RE = re.compile(r'\w+')
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+VALID_TYPES = ['-design', '-guide', '-api', '-spec', '-test', '-config']
+VALID_STATUSES = ['CURRENT', 'DRAFT', 'DEPRECATED']
+REQUIRED_METADATA_FIELDS = ['Document Status', 'Last Updated', 'Version', 'Scope']
+REQUIRED_YAML_FIELDS = ['title:', 'type:', 'status:']
+SECTION_SKIP_FILES = ['README.md', 'STYLE_GUIDE.md', 'DOCUMENTATION_INDEX.md']
+
+
+class Rule(NamedTuple):
+    name: str
+    kind: str
+    check: Callable
+
+
+# Registry of validation rules, in reporting order
+RULES: List[Rule] = []
+
+
+def register_rule(kind, name=None):
+    """Register a rule function.
+
+    Line rules are called as ``check(ctx, line_num, line)``, document rules
+    as ``check(ctx, doc)``. Report problems with ``ctx.error()`` and
+    ``ctx.warning()``.
+    """
+    def decorator(func):
+        RULES.append(Rule(name or func.__name__, kind, func))
+        return func
+    return decorator
+
+
+def ruleset_key(rules=None):
+    """Identify a rule set for the result cache."""
+    names = ','.join(rule.name for rule in (RULES if rules is None else rules))
+    return f"{RULESET_VERSION}:{names}"
+
+
+class ValidationContext:
+    """Per-file state shared by the rules while a document is validated."""
+    
+    def __init__(self, doc, filepath, filename, strict):
+        self.doc = doc
+        self.filepath = filepath
+        self.filename = filename
+        self.strict = strict
+        self.rule_index = 0
+        self.messages = []  # (rule index, is error, message)
+        
+    def error(self, message, line=None):
+        self._report(True, message, line)
+        
+    def warning(self, message, line=None):
+        self._report(False, message, line)
+        
+    def _report(self, is_error, message, line):
+        location = self.filepath if line is None else f"{self.filepath}:{line}"
+        self.messages.append((self.rule_index, is_error, f"{location}: {message}"))
+
+
+@register_rule(DOCUMENT_RULE, 'filename')
+def validate_filename(ctx, doc):
+    """Validate filename follows naming conventions."""
+    filename = ctx.filename
+    if not filename.endswith('.md'):
+        return  # Only validate markdown files
+        
+    # Check for spaces
+    if ' ' in filename:
+        ctx.error("Filename contains spaces")
+        
+    # Check for mixed case (except README.md)
+    if filename != 'README.md' and UPPERCASE_RE.search(filename.replace('.md', '')):
+        ctx.warning("Filename contains uppercase letters")
+        
+    # Check for mixed separators
+    if '_' in filename and '-' in filename:
+        ctx.error("Filename uses mixed separators (both _ and -)")
+        
+    # Check length
+    if len(filename) > 50:
+        ctx.warning("Filename longer than 50 characters")
+        
+    # Check for proper document type suffix
+    if ctx.strict and filename not in ['README.md', 'STYLE_GUIDE.md'] and not filename.startswith('.'):
+        if not any(doc_type in filename for doc_type in VALID_TYPES):
+            ctx.warning(f"Filename doesn't follow type convention (should end with {', '.join(VALID_TYPES)})")
+
+
+@register_rule(DOCUMENT_RULE, 'metadata_block')
+def validate_metadata_block(ctx, doc):
+    """Validate presence and format of metadata block."""
+    # YAML frontmatter must close within the first 21 lines
+    front_matter = doc.front_matter
+    yaml_metadata_found = front_matter is not None and front_matter['end'] <= 21
+    
+    # Old-style metadata block must start within the first 10 lines
+    old_style_metadata_found = doc.metadata_line is not None and doc.metadata_line < 10
+            
+    if not yaml_metadata_found and not old_style_metadata_found:
+        ctx.error("Missing required metadata block (YAML frontmatter or old-style)")
+        return
+        
+    # If old-style metadata is found, validate its fields
+    if old_style_metadata_found:
+        metadata = doc.metadata
+        for field in REQUIRED_METADATA_FIELDS:
+            if field not in metadata:
+                ctx.error(f"Missing metadata field '{field}:'")
+                
+        # Validate status values
+        status_match = STATUS_RE.match(metadata.get('Document Status', ''))
+        if status_match:
+            status = status_match.group(0)
+            if status not in VALID_STATUSES:
+                ctx.error(f"Invalid document status '{status}' (must be one of {VALID_STATUSES})")
+                
+        # Validate date format
+        if not DATE_RE.match(metadata.get('Last Updated', '')):
+            ctx.error("Invalid or missing date format (should be YYYY-MM-DD)")
+    
+    # If YAML frontmatter is found, validate basic structure
+    if yaml_metadata_found:
+        yaml_content = front_matter['text']
+        for field in REQUIRED_YAML_FIELDS:
+            if field not in yaml_content:
+                ctx.warning(f"YAML metadata missing recommended field '{field}'")
+
+
+@register_rule(LINE_RULE, 'headers')
+def validate_header_line(ctx, line_num, line):
+    """Validate header formatting."""
+    if not line.startswith('#'):
+        return
+        
+    # Check for trailing #
+    stripped = line.rstrip()
+    if stripped.endswith('#') and not stripped.endswith('##'):
+        ctx.warning("Header has trailing # characters", line_num)
+        
+    # Check for proper spacing
+    if not HEADER_SPACE_RE.match(line):
+        ctx.error("Header missing space after #", line_num)
+        
+    # Check nesting depth
+    if len(line) - len(line.lstrip('#')) > 4:
+        ctx.warning("Header nesting too deep (max 4 levels)", line_num)
+
+
+@register_rule(DOCUMENT_RULE, 'required_sections')
+def validate_required_sections(ctx, doc):
+    """Validate presence of required sections based on document type."""
+    filename = ctx.filename
+    
+    # Skip validation for certain files
+    if filename in SECTION_SKIP_FILES:
+        return
+        
+    # Check for Overview section
+    if not doc.contains('## Overview') and not doc.contains('# Overview'):
+        ctx.warning("Missing Overview section")
+        
+    # Check for Table of Contents if document is long
+    if doc.line_count > 100 and not doc.contains('Table of Contents'):
+        ctx.warning("Long document missing Table of Contents")
+        
+    # Type-specific validations
+    if '-design' in filename:
+        for section in ['Requirements', 'Architecture', 'Implementation']:
+            if not doc.contains(f'## {section}'):
+                ctx.warning(f"Design document missing '{section}' section")
+                
+    elif '-guide' in filename:
+        for section in ['Prerequisites', 'Instructions']:
+            if not doc.contains(f'## {section}') and doc.contains(section, ignore_case=True):
+                ctx.warning(f"Guide missing '{section}' section")
+
+
+@register_rule(LINE_RULE, 'formatting')
+def validate_formatting_line(ctx, line_num, line):
+    """Validate formatting standards."""
+    # Check for tabs
+    if '\t' in line:
+        ctx.warning("Line contains tabs (use spaces)", line_num)
+        
+    # Check for trailing whitespace
+    if line.endswith((' ', '\t')):
+        ctx.warning("Line has trailing whitespace", line_num)
+        
+    # Check bullet point format
+    if ('*' in line or '+' in line) and BULLET_RE.match(line):
+        ctx.warning("Use '-' for bullet points, not '*' or '+'", line_num)
+
+
+@register_rule(DOCUMENT_RULE, 'code_block_language')
+def validate_code_block_language(ctx, doc):
+    """Check for code blocks without language specification (opening
+    fences only; closing fences never carry a language)."""
+    for fence in doc.fences:
+        if not fence['info']:
+            ctx.warning("Code block missing language specification")
+
 
 class DocumentValidator:
-    def __init__(self, strict=False):
+    def __init__(self, strict=False, rules=None, profiler=None):
         self.strict = strict
+        self.rules = list(RULES if rules is None else rules)
+        self.profiler = profiler
         self.errors = []
         self.warnings = []
         
-    def validate_file(self, filepath):
-        """Validate a single markdown file."""
+    def validate_file(self, filepath, content=None):
+        """Validate a single markdown file.
+        
+        ``content`` overrides the file on disk (e.g. an unsaved editor buffer).
+        """
+        if self.profiler is None:
+            self._validate_file(filepath, content)
+        else:
+            with self.profiler.file(os.path.relpath(filepath)):
+                self._validate_file(filepath, content)
+                
+    def _validate_file(self, filepath, content):
+        profiler = self.profiler
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if profiler is None:
+                doc = get_document(filepath) if content is None else Document(str(filepath), content)
+            else:
+                with profiler.rule('load_document'):
+                    doc = get_document(filepath) if content is None else Document(str(filepath), content)
         except Exception as e:
             self.errors.append(f"{filepath}: Cannot read file - {e}")
             return
             
-        filename = os.path.basename(filepath)
-        relative_path = os.path.relpath(filepath)
-        
-        # Validate filename
-        self._validate_filename(filename, relative_path)
-        
-        # Validate content structure
-        self._validate_metadata_block(content, relative_path)
-        self._validate_headers(content, relative_path)
-        self._validate_required_sections(content, relative_path, filename)
-        self._validate_formatting(content, relative_path)
-        
-    def _validate_filename(self, filename, filepath):
-        """Validate filename follows naming conventions."""
-        if not filename.endswith('.md'):
-            return  # Only validate markdown files
-            
-        # Check for spaces
-        if ' ' in filename:
-            self.errors.append(f"{filepath}: Filename contains spaces")
-            
-        # Check for mixed case (except README.md)
-        if filename != 'README.md' and re.search(r'[A-Z]', filename.replace('.md', '')):
-            self.warnings.append(f"{filepath}: Filename contains uppercase letters")
-            
-        # Check for mixed separators
-        if '_' in filename and '-' in filename:
-            self.errors.append(f"{filepath}: Filename uses mixed separators (both _ and -)")
-            
-        # Check length
-        if len(filename) > 50:
-            self.warnings.append(f"{filepath}: Filename longer than 50 characters")
-            
-        # Check for proper document type suffix
-        valid_types = ['-design', '-guide', '-api', '-spec', '-test', '-config']
-        if filename not in ['README.md', 'STYLE_GUIDE.md'] and not filename.startswith('.'):
-            has_valid_type = any(doc_type in filename for doc_type in valid_types)
-            if not has_valid_type and self.strict:
-                self.warnings.append(f"{filepath}: Filename doesn't follow type convention (should end with {', '.join(valid_types)})")
-    
-    def _validate_metadata_block(self, content, filepath):
-        """Validate presence and format of metadata block."""
-        lines = content.split('\n')
-        
-        # Check for YAML frontmatter first
-        yaml_metadata_found = False
-        if lines and lines[0].strip() == '---':
-            # Look for closing ---
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    yaml_metadata_found = True
-                    break
-                if i > 20:  # Don't search too far
-                    break
-        
-        # Check for old-style metadata block
-        old_style_metadata_found = False
-        for i, line in enumerate(lines[:10]):
-            if line.strip().startswith('> **Document Status:**'):
-                old_style_metadata_found = True
-                break
+        if profiler is not None:
+            # Parse up front so lazy parsing is not billed to the first rule
+            with profiler.rule('parse_document'):
+                doc.line_count, doc.tokens
                 
-        if not yaml_metadata_found and not old_style_metadata_found:
-            self.errors.append(f"{filepath}: Missing required metadata block (YAML frontmatter or old-style)")
-            return
-            
-        # If old-style metadata is found, validate its fields
-        if old_style_metadata_found:
-            required_fields = [
-                'Document Status:',
-                'Last Updated:',
-                'Version:',
-                'Scope:'
-            ]
-            
-            metadata_section = '\n'.join(lines[:20])  # Check first 20 lines
-            
-            for field in required_fields:
-                if f'**{field}**' not in metadata_section:
-                    self.errors.append(f"{filepath}: Missing metadata field '{field}'")
-                    
-            # Validate status values
-            status_match = re.search(r'\*\*Document Status:\*\*\s*(\w+)', metadata_section)
-            if status_match:
-                status = status_match.group(1)
-                valid_statuses = ['CURRENT', 'DRAFT', 'DEPRECATED']
-                if status not in valid_statuses:
-                    self.errors.append(f"{filepath}: Invalid document status '{status}' (must be one of {valid_statuses})")
-                    
-            # Validate date format
-            date_match = re.search(r'\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})', metadata_section)
-            if not date_match:
-                self.errors.append(f"{filepath}: Invalid or missing date format (should be YYYY-MM-DD)")
-        
-        # If YAML frontmatter is found, validate basic structure
-        if yaml_metadata_found:
-            yaml_section = []
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    break
-                yaml_section.append(line)
-            
-            yaml_content = '\n'.join(yaml_section)
-            
-            # Check for basic required fields in YAML
-            required_yaml_fields = ['title:', 'type:', 'status:']
-            for field in required_yaml_fields:
-                if field not in yaml_content:
-                    self.warnings.append(f"{filepath}: YAML metadata missing recommended field '{field}'")
-    
-    def _validate_headers(self, content, filepath):
-        """Validate header formatting."""
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            if line.startswith('#'):
-                # Check for trailing #
-                if line.rstrip().endswith('#') and not line.rstrip().endswith('##'):
-                    self.warnings.append(f"{filepath}:{i}: Header has trailing # characters")
-                    
-                # Check for proper spacing
-                if not re.match(r'^#{1,4}\s+', line):
-                    self.errors.append(f"{filepath}:{i}: Header missing space after #")
-                    
-                # Check nesting depth
-                header_level = len(line) - len(line.lstrip('#'))
-                if header_level > 4:
-                    self.warnings.append(f"{filepath}:{i}: Header nesting too deep (max 4 levels)")
+        ctx = ValidationContext(doc, os.path.relpath(filepath), os.path.basename(filepath), self.strict)
+        
+        line_rules = []
+        for index, rule in enumerate(self.rules):
+            if rule.kind == LINE_RULE:
+                line_rules.append((index, rule.check))
+                continue
+            ctx.rule_index = index
+            if profiler is None:
+                rule.check(ctx, doc)
+            else:
+                with profiler.rule(rule.name):
+                    rule.check(ctx, doc)
+                
+        # One pass over the lines drives every line rule
+        if line_rules and profiler is not None:
+            self._profile_line_rules(ctx, doc, line_rules)
+        elif line_rules:
+            for line_num, line in enumerate(doc.iter_lines(), 1):
+                for index, check in line_rules:
+                    ctx.rule_index = index
+                    check(ctx, line_num, line)
                     
-    def _validate_required_sections(self, content, filepath, filename):
-        """Validate presence of required sections based on document type."""
-        # Skip validation for certain files
-        skip_files = ['README.md', 'STYLE_GUIDE.md', 'DOCUMENTATION_INDEX.md']
-        if filename in skip_files:
-            return
+        # Report in rule registration order (stable within each rule)
+        ctx.messages.sort(key=lambda message: message[0])
+        for _, is_error, message in ctx.messages:
+            (self.errors if is_error else self.warnings).append(message)
             
-        # Check for Overview section
-        if '## Overview' not in content and '# Overview' not in content:
-            self.warnings.append(f"{filepath}: Missing Overview section")
+    def _profile_line_rules(self, ctx, doc, line_rules):
+        """The single line pass, timing each line rule separately."""
+        elapsed = [0.0] * len(line_rules)
+        clock = time.perf_counter
+        for line_num, line in enumerate(doc.iter_lines(), 1):
+            for slot, (index, check) in enumerate(line_rules):
+                ctx.rule_index = index
+                start = clock()
+                check(ctx, line_num, line)
+                elapsed[slot] += clock() - start
+        for slot, (index, _) in enumerate(line_rules):
+            self.profiler.add_rule(self.rules[index].name, elapsed[slot], calls=doc.line_count)
             
-        # Check for Table of Contents if document is long
-        line_count = len(content.split('\n'))
-        if line_count > 100 and 'Table of Contents' not in content:
-            self.warnings.append(f"{filepath}: Long document missing Table of Contents")
+    def validate_files(self, filepaths, jobs=1):
+        """Validate a list of files, optionally fanning them out across processes.
+        
+        Each worker process runs its own DocumentValidator. Results are merged
+        back in the order of ``filepaths`` so the output matches a serial run.
+        Returns one (errors, warnings) pair per input file.
+        """
+        per_file = []
+        if jobs <= 1 or len(filepaths) < 2:
+            for filepath in filepaths:
+                error_start, warning_start = len(self.errors), len(self.warnings)
+                self.validate_file(filepath)
+                per_file.append((self.errors[error_start:], self.warnings[warning_start:]))
+            return per_file
             
-        # Type-specific validations
-        if '-design' in filename:
-            required_sections = ['Requirements', 'Architecture', 'Implementation']
-            for section in required_sections:
-                if f'## {section}' not in content:
-                    self.warnings.append(f"{filepath}: Design document missing '{section}' section")
-                    
-        elif '-guide' in filename:
-            required_sections = ['Prerequisites', 'Instructions']
-            for section in required_sections:
-                if f'## {section}' not in content and section.lower() in content.lower():
-                    self.warnings.append(f"{filepath}: Guide missing '{section}' section")
-                    
-    def _validate_formatting(self, content, filepath):
-        """Validate formatting standards."""
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            # Check for tabs
-            if '\t' in line:
-                self.warnings.append(f"{filepath}:{i}: Line contains tabs (use spaces)")
-                
-            # Check for trailing whitespace
-            if line.endswith(' ') or line.endswith('\t'):
-                self.warnings.append(f"{filepath}:{i}: Line has trailing whitespace")
-                
-            # Check bullet point format
-            if re.match(r'^\s*[\*\+]\s', line):
-                self.warnings.append(f"{filepath}:{i}: Use '-' for bullet points, not '*' or '+'")
-                
-        # Check for code blocks without language specification
-        code_blocks = re.findall(r'```(\w*)\n', content)
-        for block in code_blocks:
-            if not block:  # Empty language specification
-                self.warnings.append(f"{filepath}: Code block missing language specification")
+        chunksize = max(1, len(filepaths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=_init_worker,
+                                 initargs=(self.strict, self.rules)) as pool:
+            for errors, warnings in pool.map(_validate_file_in_worker, filepaths,
+                                             chunksize=chunksize):
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
+                per_file.append((errors, warnings))
+        return per_file
                 
     def get_results(self):
         """Get validation results."""
@@ -245,6 +375,143 @@ class DocumentValidator:
             
         return len(self.errors) == 0  # Return True if no errors
 
+# Per-process validator used by --jobs workers
+_worker_validator = None
+
+def _init_worker(strict, rules):
+    """Create the DocumentValidator owned by a pool worker process."""
+    global _worker_validator
+    _worker_validator = DocumentValidator(strict=strict, rules=rules)
+
+def _validate_file_in_worker(filepath):
+    """Validate one file in a pool worker and return its findings."""
+    validator = _worker_validator
+    validator.errors = []
+    validator.warnings = []
+    validator.validate_file(filepath)
+    return validator.errors, validator.warnings
+
+class ValidationCache:
+    """Persisted content-hash cache backing ``--incremental`` runs.
+    
+    For every file the cache stores its size, mtime, content hash and the
+    findings of its last validation, per ``--strict`` mode. The cache is
+    discarded when the rule set or working directory (which appears in
+    the reported paths) changes. Files whose size and mtime are unchanged
+    are not read at all; touched files are re-hashed and only re-validated
+    if their content changed.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, cache_path, strict=False, rules=None):
+        self.cache_path = cache_path
+        self.mode = 'strict' if strict else 'default'
+        self.ruleset = ruleset_key(rules)
+        self.cwd = os.getcwd()
+        self.files = {}
+        self.stats = {'reused': 0, 'validated': 0, 'removed': 0}
+        
+    def load(self):
+        """Load the cache file, discarding it if it is stale or unreadable."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (data.get('version') != self.VERSION or data.get('ruleset') != self.ruleset
+                or data.get('cwd') != self.cwd):
+            return
+        self.files = data.get('files', {})
+        
+    def save(self):
+        """Write the cache file atomically."""
+        data = {
+            'version': self.VERSION,
+            'ruleset': self.ruleset,
+            'cwd': self.cwd,
+            'files': self.files
+        }
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path)
+        
+    def validate(self, validator, filepaths, jobs=1, prune=True):
+        """Validate ``filepaths`` incrementally, filling ``validator`` with merged results.
+        
+        With ``prune`` (a full-tree run) cached files missing from
+        ``filepaths`` are dropped from the cache.
+        """
+        keys = {filepath: os.path.abspath(filepath) for filepath in filepaths}
+        
+        stale = []
+        fresh_stat = {}
+        for filepath in filepaths:
+            entry = self.files.get(keys[filepath])
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                stale.append(filepath)
+                continue
+            if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+                if self.mode in entry['results']:
+                    continue
+                digest = entry['hash']
+            else:
+                digest = _hash_file(filepath)
+                if entry and entry['hash'] == digest:
+                    entry['size'], entry['mtime'] = st.st_size, st.st_mtime_ns
+                    if self.mode in entry['results']:
+                        continue
+            fresh_stat[filepath] = (st.st_size, st.st_mtime_ns, digest)
+            stale.append(filepath)
+            
+        removed = []
+        if prune:
+            current = set(keys.values())
+            removed = [key for key in self.files if key not in current]
+            for key in removed:
+                del self.files[key]
+                
+        results = dict(zip(stale, validator.validate_files(stale, jobs=jobs)))
+        for filepath, (errors, warnings) in results.items():
+            if filepath not in fresh_stat:
+                continue  # Unreadable files are re-validated every run
+            size, mtime, digest = fresh_stat[filepath]
+            entry = self.files.get(keys[filepath])
+            if not entry or entry['hash'] != digest:
+                entry = {'results': {}}
+                self.files[keys[filepath]] = entry
+            entry.update(size=size, mtime=mtime, hash=digest)
+            entry['results'][self.mode] = {'errors': errors, 'warnings': warnings}
+            
+        # Merge fresh and cached findings back in input order
+        validator.errors = []
+        validator.warnings = []
+        for filepath in filepaths:
+            if filepath in results:
+                errors, warnings = results[filepath]
+            else:
+                cached = self.files[keys[filepath]]['results'][self.mode]
+                errors, warnings = cached['errors'], cached['warnings']
+            validator.errors.extend(errors)
+            validator.warnings.extend(warnings)
+            
+        self.stats = {
+            'reused': len(filepaths) - len(results),
+            'validated': len(results),
+            'removed': len(removed)
+        }
+
+def _hash_file(filepath):
+    """Return the SHA-1 hex digest of a file's content."""
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 def find_markdown_files(directory):
     """Find all markdown files in directory."""
     markdown_files = []
@@ -266,10 +533,27 @@ def main():
                        help='Directory to validate (default: a2-docs)')
     parser.add_argument('--output', help='Output results to JSON file')
     parser.add_argument('--files', nargs='*', help='Specific files to validate')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes (default: 1, 0 = one per CPU)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Reuse cached results for files whose content is unchanged')
+    parser.add_argument('--cache-file',
+                       help='Cache file for --incremental (default: <directory>/.validate_docs_cache.json)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Report time and call counts per rule and the slowest files')
+    parser.add_argument('--profile-output', help='Save the --profile report to a JSON file')
+    parser.add_argument('--profile-top', type=int, default=10,
+                       help='Number of slowest files to report (default: 10)')
     
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
+    profiler = Profiler() if args.profile or args.profile_output else None
+    if profiler and jobs > 1:
+        print("⚠️  --profile runs in a single process; ignoring --jobs")
+        jobs = 1
     
-    validator = DocumentValidator(strict=args.strict)
+    validator = DocumentValidator(strict=args.strict, profiler=profiler)
     
     if args.files:
         # Validate specific files
@@ -289,12 +573,33 @@ def main():
     print(f"🔍 Validating {len(files_to_validate)} markdown files...")
     print()
     
-    for filepath in files_to_validate:
-        validator.validate_file(filepath)
+    if args.incremental:
+        cache_dir = args.directory if os.path.isdir(args.directory) else '.'
+        cache = ValidationCache(args.cache_file or os.path.join(cache_dir, '.validate_docs_cache.json'),
+                                strict=args.strict)
+        cache.load()
+        cache.validate(validator, files_to_validate, jobs=jobs, prune=not args.files)
+        cache.save()
+        stats = cache.stats
+        print(f"♻️  Incremental: {stats['validated']} validated, {stats['reused']} reused from cache, "
+              f"{stats['removed']} removed")
+        print()
+    else:
+        validator.validate_files(files_to_validate, jobs=jobs)
         
     # Print results
     success = validator.print_results()
     
+    if profiler:
+        cache = default_cache()
+        profiler.files_read, profiler.bytes_read = cache.reads, cache.bytes_read
+        if args.profile:
+            print()
+            profiler.print_report(args.profile_top)
+        if args.profile_output:
+            profiler.save(args.profile_output, args.profile_top)
+            print(f"⏱️  Profile saved to {args.profile_output}")
+    
     # Save results if requested
     if args.output:
         results = validator.get_results()
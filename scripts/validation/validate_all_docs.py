@@ -6,14 +6,126 @@ Checks consistency, dates, cross-references, and required content.
 
 import os
 import re
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple
 
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+from doc_model import DocumentCache
+from doc_profiler import Profiler
+
+OUTDATED_TERMS_FILE = Path(__file__).with_name("outdated_terms.yaml")
+
+# Used when the YAML term list cannot be loaded
+DEFAULT_OUTDATED_TERMS = {
+    "single.*Arducam": "References single camera approach",
+    "CSI.*cable.*gimbal": "References problematic CSI cable",
+    "camera-only": "Mentions camera-only perception",
+    "RTX 4080.*production.*LLM": "Suggests RTX 4080 for production LLM"
+}
+
+def load_outdated_terms(path: Path = OUTDATED_TERMS_FILE) -> Dict[str, str]:
+    """Load the pattern -> description map from a YAML term list."""
+    if yaml is None:
+        print(f"⚠️  PyYAML not installed; using built-in outdated terms instead of {path}")
+        return dict(DEFAULT_OUTDATED_TERMS)
+    if not path.exists():
+        print(f"⚠️  {path} not found; using built-in outdated terms")
+        return dict(DEFAULT_OUTDATED_TERMS)
+        
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    return {entry['pattern']: entry['description'] for entry in data.get('outdated_terms', [])}
+
+# A named character, an escape sequence or a run of other characters
+PATTERN_PIECE_RE = re.compile(r'\\N\{[^}]*\}|\\.|[^\\]+', re.DOTALL)
+
+def fold_pattern(pattern: str) -> str:
+    """Lowercase the literal characters of a regex.
+    
+    Escape sequences such as ``\\S`` or ``\\W`` keep their case, since
+    lowercasing would change their meaning.
+    """
+    return PATTERN_PIECE_RE.sub(
+        lambda piece: piece.group() if re.match(r'\\[A-Za-z0-9]', piece.group()) else piece.group().lower(),
+        pattern)
+
+class OutdatedTermScanner:
+    """Finds every outdated term in a document.
+    
+    Case-insensitive patterns cannot use the regex engine's fast literal
+    search, so each term is compiled case-sensitively with its literal
+    characters lowercased (see fold_pattern) and run over the lowercased
+    document. The hits equal running ``re.finditer(pattern, text,
+    re.IGNORECASE)`` for each term. Text whose lowercase form changes
+    length (e.g. a dotted capital I), and patterns that do not fold, are
+    matched case-insensitively as written. Like the individual patterns,
+    ``.`` does not cross line boundaries.
+    """
+    
+    def __init__(self, terms: Dict[str, str]):
+        self.terms = []  # (case-insensitive regex, folded regex or None, description)
+        for pattern, description in terms.items():
+            try:
+                regex = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid outdated term pattern '{pattern}': {e}") from e
+            try:
+                folded = re.compile(fold_pattern(pattern))
+            except re.error:
+                folded = None
+            self.terms.append((regex, folded, description))
+        
+    def scan(self, text: str) -> List[Tuple[int, int, str]]:
+        """Return (line, column, description) for every hit, 1-based."""
+        if not self.terms:
+            return []
+        haystack = text.lower()
+        if len(haystack) != len(text):
+            haystack = None
+            
+        starts = []
+        for index, (regex, folded, _) in enumerate(self.terms):
+            if folded is not None and haystack is not None:
+                matches = folded.finditer(haystack)
+            else:
+                matches = regex.finditer(text)
+            starts.extend((match.start(), index) for match in matches)
+        starts.sort()
+        
+        hits = []
+        line, line_start, last = 1, 0, 0
+        for pos, index in starts:
+            newlines = text.count('\n', last, pos)
+            if newlines:
+                line += newlines
+                line_start = text.rfind('\n', last, pos) + 1
+            last = pos
+            hits.append((line, pos - line_start + 1, self.terms[index][2]))
+        return hits
+
 class A2DocValidator:
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, profiler: Profiler = None, outdated_terms: Dict[str, str] = None,
+                 recursive: bool = True, jobs: int = 1):
         self.project_root = project_root
         self.doc_dir = project_root / "a2-docs"
+        self.profiler = profiler
+        self.recursive = recursive
+        self.jobs = jobs
+        self.outdated_scanner = OutdatedTermScanner(
+            load_outdated_terms() if outdated_terms is None else outdated_terms)
+        self.cache = DocumentCache()
+        self.documents: Dict[str, Path] = {}  # name relative to doc_dir -> path
+        self._link_targets: Dict[Path, bool] = {}
         self.errors = []
         self.warnings = []
         self.info = []
@@ -23,82 +135,147 @@ class A2DocValidator:
         print("🔍 A2 Documentation Validation")
         print("=" * 50)
         
-        self.check_document_headers()
-        self.check_outdated_content()
-        self.check_cross_references()
-        self.check_naming_conventions()
+        self.scan_documents()
+        
+        checks = ['check_document_headers',
+                  'check_outdated_content',
+                  'check_cross_references',
+                  'check_naming_conventions']
+        if self.profiler is None and self.jobs > 1:
+            # The checks are independent and only read the loaded documents,
+            # so each runs in its own process on a copy of this validator;
+            # findings are merged in check order below
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(checks)),
+                                     initializer=_init_worker,
+                                     initargs=(self,)) as pool:
+                results = list(pool.map(_run_check_in_worker, checks))
+        else:
+            results = []
+            for name in checks:
+                if self.profiler is None:
+                    results.append(getattr(self, name)())
+                else:
+                    with self.profiler.rule(name):
+                        results.append(getattr(self, name)())
+                        
+        for findings in results:
+            self.errors.extend(findings['errors'])
+            self.warnings.extend(findings['warnings'])
+            self.info.extend(findings['info'])
         self.generate_report()
         
+    def scan_documents(self):
+        """Find markdown files with one directory walk and load each one once."""
+        paths = []
+        for root, dirs, files in os.walk(self.doc_dir):
+            if self.recursive:
+                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__']]
+            else:
+                dirs[:] = []
+            paths.extend(Path(root) / file for file in files if file.endswith('.md'))
+            
+        self.documents = {}
+        for path in sorted(paths):
+            name = path.relative_to(self.doc_dir).as_posix()
+            with self._file(name):
+                try:
+                    document = self.cache.get(path)
+                except (OSError, UnicodeDecodeError) as e:
+                    self.errors.append(f"{name}: Cannot read file - {e}")
+                    continue
+            if self.profiler is not None:
+                self.profiler.add_read(document.size)
+            self.documents[name] = path
+        return self.documents
+        
+    def _file(self, name: str):
+        """Attribute the enclosed work to document ``name`` when profiling."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.file(name)
+        
+    def _text(self, name: str) -> str:
+        """Document text from the shared cache (no re-read unless it changed)."""
+        return self.cache.get(self.documents[name]).text
+        
+    @staticmethod
+    def _findings() -> Dict[str, List[str]]:
+        return {'errors': [], 'warnings': [], 'info': []}
+        
     def check_document_headers(self):
         """Ensure all docs have proper headers."""
+        findings = self._findings()
         required_pattern = r'> \*\*Document Status:\*\* (CURRENT|DRAFT|DEPRECATED)\s*\n> \*\*Last Updated:\*\* \d{4}-\d{2}-\d{2}'
         
-        for md_file in self.doc_dir.glob("*.md"):
+        for name, md_file in self.documents.items():
             if md_file.name == "README.md":
                 continue
                 
-            content = md_file.read_text()
-            if not re.search(required_pattern, content):
-                self.errors.append(f"{md_file.name}: Missing standard header")
-                
-            # Check if updated recently
-            date_match = re.search(r'Last Updated:\*\* (\d{4}-\d{2}-\d{2})', content)
-            if date_match:
-                last_update = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                days_old = (datetime.now() - last_update).days
-                if days_old > 30:
-                    self.warnings.append(f"{md_file.name}: Not updated in {days_old} days")
+            with self._file(name):
+                content = self._text(name)
+                if not re.search(required_pattern, content):
+                    findings['errors'].append(f"{name}: Missing standard header")
+                    
+                # Check if updated recently
+                date_match = re.search(r'Last Updated:\*\* (\d{4}-\d{2}-\d{2})', content)
+                if date_match:
+                    last_update = datetime.strptime(date_match.group(1), "%Y-%m-%d")
+                    days_old = (datetime.now() - last_update).days
+                    if days_old > 30:
+                        findings['warnings'].append(f"{name}: Not updated in {days_old} days")
+        return findings
                     
     def check_outdated_content(self):
-        """Check for outdated technical content."""
-        outdated_terms = {
-            "single.*Arducam": "References single camera approach",
-            "CSI.*cable.*gimbal": "References problematic CSI cable",
-            "camera-only": "Mentions camera-only perception",
-            "RTX 4080.*production.*LLM": "Suggests RTX 4080 for production LLM"
-        }
-        
-        for md_file in self.doc_dir.glob("*.md"):
-            content = md_file.read_text().lower()
-            for pattern, description in outdated_terms.items():
-                if re.search(pattern.lower(), content):
-                    self.errors.append(f"{md_file.name}: {description}")
+        """Check for outdated technical content (terms from outdated_terms.yaml)."""
+        findings = self._findings()
+        for name in self.documents:
+            with self._file(name):
+                for line, column, description in self.outdated_scanner.scan(self._text(name)):
+                    findings['errors'].append(f"{name}:{line}:{column}: {description}")
+        return findings
                     
     def check_cross_references(self):
         """Validate all markdown links."""
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+        findings = self._findings()
+        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
         
-        for md_file in self.doc_dir.glob("*.md"):
-            content = md_file.read_text()
-            for match in re.finditer(link_pattern, content):
-                link_text, link_path = match.groups()
-                
-                if link_path.startswith("http"):
-                    continue
-                    
-                if link_path.startswith("#"):
-                    continue
+        for name, md_file in self.documents.items():
+            with self._file(name):
+                for match in link_pattern.finditer(self._text(name)):
+                    link_text, link_path = match.groups()
                     
-                # Check relative path
-                full_path = (md_file.parent / link_path.split("#")[0]).resolve()
-                if not full_path.exists():
-                    self.errors.append(f"{md_file.name}: Broken link to {link_path}")
+                    if link_path.startswith("http"):
+                        continue
+                        
+                    if link_path.startswith("#"):
+                        continue
+                        
+                    # Check relative path (each target is only stat'ed once)
+                    full_path = (md_file.parent / link_path.split("#")[0]).resolve()
+                    exists = self._link_targets.get(full_path)
+                    if exists is None:
+                        exists = self._link_targets[full_path] = full_path.exists()
+                    if not exists:
+                        findings['errors'].append(f"{name}: Broken link to {link_path}")
+        return findings
                     
     def check_naming_conventions(self):
         """Ensure consistent file naming."""
-        for md_file in self.doc_dir.glob("*.md"):
-            name = md_file.stem
+        findings = self._findings()
+        for name, md_file in self.documents.items():
+            stem = md_file.stem
             
             # Check for underscores (should be hyphens)
-            if "_" in name:
-                self.warnings.append(f"{md_file.name}: Use hyphens not underscores")
+            if "_" in stem:
+                findings['warnings'].append(f"{name}: Use hyphens not underscores")
                 
             # Check for consistent suffixes
             expected_suffixes = ["-guide", "-design", "-spec", "-api", "-overview"]
-            has_suffix = any(name.endswith(suffix) for suffix in expected_suffixes)
+            has_suffix = any(stem.endswith(suffix) for suffix in expected_suffixes)
             
-            if not has_suffix and name not in ["README", "master-document"]:
-                self.info.append(f"{md_file.name}: Consider adding type suffix")
+            if not has_suffix and stem not in ["README", "master-document"]:
+                findings['info'].append(f"{name}: Consider adding type suffix")
+        return findings
                 
     def generate_report(self):
         """Generate validation report."""
@@ -125,11 +302,59 @@ class A2DocValidator:
             print(f"\n📊 Total issues: {total_issues}")
             
         # Generate health score
-        doc_count = len(list(self.doc_dir.glob("*.md")))
+        doc_count = len(self.documents)
         if doc_count > 0:
             health = max(0, 100 - (total_issues * 5))
             print(f"📈 Documentation Health Score: {health}%")
 
+# Per-process validator used by --jobs workers
+_worker_validator = None
+
+def _init_worker(validator):
+    """Install the validator (with its loaded documents) in a pool worker."""
+    global _worker_validator
+    _worker_validator = validator
+
+def _run_check_in_worker(name):
+    """Run one check_* method in a pool worker and return its findings."""
+    return getattr(_worker_validator, name)()
+
+def main():
+    parser = argparse.ArgumentParser(description='Comprehensive A2 documentation validation')
+    parser.add_argument('project_root', nargs='?', default='/home/waragainstwork/A2',
+                       help='A2 project root containing a2-docs/')
+    parser.add_argument('--outdated-terms', type=Path, default=OUTDATED_TERMS_FILE,
+                       help='YAML list of outdated term patterns (default: outdated_terms.yaml)')
+    parser.add_argument('--top-level', action='store_true',
+                       help='Only validate a2-docs/*.md, not subdirectories')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Worker processes for running checks concurrently (default: 1, 0 = one per CPU)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Report time and call counts per check and the slowest files')
+    parser.add_argument('--profile-output', help='Save the --profile report to a JSON file')
+    parser.add_argument('--profile-top', type=int, default=10,
+                       help='Number of slowest files to report (default: 10)')
+    args = parser.parse_args()
+    
+    profiler = Profiler() if args.profile or args.profile_output else None
+    try:
+        outdated_terms = load_outdated_terms(args.outdated_terms)
+        validator = A2DocValidator(Path(args.project_root), profiler=profiler,
+                                   outdated_terms=outdated_terms,
+                                   recursive=not args.top_level,
+                                   jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ Cannot load outdated terms from {args.outdated_terms}: {e}")
+        sys.exit(1)
+    validator.validate_all()
+    
+    if profiler:
+        if args.profile:
+            print()
+            profiler.print_report(args.profile_top)
+        if args.profile_output:
+            profiler.save(args.profile_output, args.profile_top)
+            print(f"⏱️  Profile saved to {args.profile_output}")
+
 if __name__ == "__main__":
-    validator = A2DocValidator(Path("/home/waragainstwork/A2"))
-    validator.validate_all()
\ No newline at end of file
+    main()